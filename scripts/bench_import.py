@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Measure import time of the src package.
+
+Imports the client modules in a fresh interpreter with ``-X importtime``
+and reports the time spent in src's own modules (excluding third-party
+dependencies such as requests), slowest first. Exits non-zero when the
+total exceeds the budget, so CI can guard worker start-up and
+``--collect-only`` time.
+
+Usage:
+    python scripts/bench_import.py [--budget-ms MS] [--top N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ("src.http_client", "src.async_http_client", "src.assertions")
+
+
+def measure():
+    """Import MODULES in a subprocess.
+
+    Returns:
+        Tuple of (self time in microseconds per src module, total
+        cumulative microseconds, stdout of the import).
+    """
+    code = "import " + ", ".join(MODULES)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    own, total = {}, 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, field = line[len("import time:"):].split("|")
+        name = field.strip()
+        # Nested imports are indented; top-level entries add up to the whole import
+        if not field[1:].startswith(" "):
+            total += int(cumulative_us)
+        if name == "src" or name.startswith("src."):
+            own[name] = int(self_us)
+    return own, total, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Allowed time in src's own modules")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules listed")
+    args = parser.parse_args()
+
+    own, total, stdout = measure()
+    own_ms = sum(own.values()) / 1000
+    for name, self_us in sorted(own.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<28} {self_us / 1000:7.2f} ms")
+    print(f"src modules: {own_ms:.2f} ms of {total / 1000:.2f} ms total import (budget {args.budget_ms:.0f} ms)")
+    if stdout:
+        print(f"Import printed output: {stdout.strip()!r}")
+        return 1
+    return 0 if own_ms <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON handling of a large list response.
+
+Compares the former path (stdlib ``requests.Response.json()`` called once
+by the test and once per assertion helper) with the current one (configured
+codec, body decoded once and memoized on the response). No network is used.
+
+Usage:
+    python scripts/bench_json.py [--iterations N] [--codec auto|stdlib|orjson]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.json_codec import JSONResponse, get_codec, response_json, set_codec  # noqa: E402
+
+# Reads of the same body in a typical list test: test code + two assertion helpers
+READS_PER_TEST = 3
+
+
+def make_response(cls, content):
+    """Build a response of the given class without network."""
+    response = cls()
+    response.status_code = 200
+    response._content = content
+    response.headers['Content-Type'] = 'application/json'
+    response.encoding = 'utf-8'
+    return response
+
+
+def bench(label, iterations, func):
+    """Run func repeatedly and print milliseconds per call."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    per_call = (time.perf_counter() - started) / iterations * 1e3
+    print(f"  {label:<10} {per_call:10.2f} ms/test")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--codec', default='auto')
+    args = parser.parse_args()
+    set_codec(args.codec)
+
+    content = json.dumps([
+        {"id": i, "taskId": i, "projectId": 1, "content": "comment text " * 10, "createdAt": "2024-01-01 00:00:00"}
+        for i in range(12000)
+    ]).encode('utf-8')
+    print(f"getByProjectId-like list, {len(content)} bytes, codec {get_codec().name}:")
+
+    def run_legacy():
+        response = make_response(requests.Response, content)
+        for _ in range(READS_PER_TEST):
+            response.json()
+
+    def run_current():
+        response = make_response(JSONResponse, content)
+        for _ in range(READS_PER_TEST):
+            response_json(response)
+
+    before = bench("before", args.iterations, run_legacy)
+    after = bench("after", args.iterations, run_current)
+    print(f"  speedup    {before / after:10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
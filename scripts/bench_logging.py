@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request logging overhead of HTTPClient.
+
+Compares the former logging path (eager f-strings, response.text decoded
+up to four times, synchronous handler) with the current one (lazy
+formatting, partial body decode, queue-based handler). No network is used:
+the logging methods are fed prebuilt responses. Both paths run at INFO
+and at WARNING (the usual "bodies are discarded" case).
+
+Usage:
+    python scripts/bench_logging.py [--iterations N]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.history import ExchangeRecord  # noqa: E402
+from src.http_client import HTTPClient  # noqa: E402
+from src.logging_setup import configure_logging  # noqa: E402
+from src.rate_limiter import RateGovernor  # noqa: E402
+
+legacy_logger = logging.getLogger("bench.legacy")
+
+
+def legacy_log_request(method, url, **kwargs):
+    """Former HTTPClient._log_request."""
+    legacy_logger.info(f"{method.upper()} {url}")
+    if kwargs.get('json'):
+        legacy_logger.debug(f"Request body: {kwargs['json']}")
+    if kwargs.get('params'):
+        legacy_logger.debug(f"Query params: {kwargs['params']}")
+
+
+def legacy_log_response(history_entry, response):
+    """Former HTTPClient._log_response."""
+    legacy_logger.info(f"Response status: {response.status_code}")
+    history_entry['response'] = {
+        'status_code': response.status_code,
+        'headers': dict(response.headers),
+        'body': response.text[:500] if response.text else None
+    }
+    if response.status_code >= 400:
+        legacy_logger.error(f"Response body: {response.text}")
+    else:
+        legacy_logger.debug(f"Response body: {response.text[:200]}")
+
+
+def make_response(payload, status_code=200):
+    """Build a requests.Response without network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode('utf-8')
+    response.headers['Content-Type'] = 'application/json'
+    response.headers['Server'] = 'nginx'
+    response.headers['Date'] = 'Mon, 01 Jan 2024 00:00:00 GMT'
+    response.encoding = 'utf-8'
+    return response
+
+
+def bench(label, iterations, func):
+    """Run func repeatedly and print request-thread CPU microseconds per call.
+
+    Thread CPU time is measured so work handed off to the log listener
+    thread is not charged to the request path.
+    """
+    started = time.thread_time()
+    for _ in range(iterations):
+        func()
+    per_call = (time.thread_time() - started) / iterations * 1e6
+    print(f"  {label:<10} {per_call:10.1f} us/request")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    devnull = open(os.devnull, 'w')
+
+    legacy_handler = logging.StreamHandler(devnull)
+    legacy_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    legacy_logger.addHandler(legacy_handler)
+    legacy_logger.propagate = False
+
+    current_handler = logging.StreamHandler(devnull)
+    current_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = configure_logging(handlers=[current_handler])
+    package_logger = logging.getLogger('src')
+
+    client = HTTPClient(base_url="http://stand-in", rate_governor=RateGovernor(0, 1))
+    url = "http://stand-in/comments/getByProjectId"
+    body = {"projectId": 1, "name": "Task"}
+
+    cases = [
+        ("small JSON object", make_response({"status": "ok", "item": {"id": 1}})),
+        ("2 MB JSON list", make_response([
+            {"id": i, "taskId": i, "content": "comment text " * 10} for i in range(12000)
+        ])),
+    ]
+
+    for (name, response), level in [(case, level) for case in cases for level in ('INFO', 'WARNING')]:
+        legacy_logger.setLevel(level)
+        package_logger.setLevel(level)
+        size = len(response.content)
+        iterations = args.iterations if size < 10000 else max(20, args.iterations // 100)
+        print(f"{name}, {level} ({size} bytes, {iterations} iterations):")
+
+        def run_legacy():
+            entry = {'method': 'GET', 'url': url}
+            legacy_log_request('GET', url, json=body)
+            legacy_log_response(entry, response)
+
+        def run_current():
+            record = ExchangeRecord('GET', url, body=body)
+            client._log_request('GET', url, json=body)
+            client._log_response(record, response)
+
+        before = bench("before", iterations, run_legacy)
+        after = bench("after", iterations, run_current)
+        print(f"  speedup    {before / after:10.1f}x")
+
+    listener.stop()
+    devnull.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,13 @@
 Provides common assertions for status codes, response structure,
 and schema validation.
 """
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from requests import Response
 import json
 
+from .json_codec import iter_json_items, response_json
+from .spec_loader import SpecLoader, get_default_spec_loader
+
 
 def assert_status_code(response: Response, expected_status: int, message: Optional[str] = None) -> None:
     """Assert response has expected status code.
@@ -39,7 +42,7 @@ def assert_response_has_keys(response: Response, keys: List[str]) -> None:
         AssertionError: If any key is missing.
     """
     try:
-        data = response.json()
+        data = response_json(response)
     except json.JSONDecodeError:
         raise AssertionError(f"Response is not valid JSON: {response.text[:200]}")
     
@@ -61,7 +64,7 @@ def assert_response_is_list(response: Response, min_length: Optional[int] = None
         AssertionError: If response is not a list or length requirement not met.
     """
     try:
-        data = response.json()
+        data = response_json(response)
     except json.JSONDecodeError:
         raise AssertionError(f"Response is not valid JSON: {response.text[:200]}")
     
@@ -71,6 +74,113 @@ def assert_response_is_list(response: Response, min_length: Optional[int] = None
         assert len(data) >= min_length, f"Expected at least {min_length} items, got {len(data)}"
 
 
+def assert_stream_is_list(
+    items: Union[Response, Iterable[Any]],
+    min_length: Optional[int] = None,
+    item_keys: Optional[List[str]] = None,
+) -> int:
+    """Assert a streamed JSON list, counting and validating items one at a time.
+    
+    Streaming variant of assert_response_is_list for lists too large to
+    hold in memory: items are checked as they are decoded and then dropped.
+    
+    Args:
+        items: Response (ideally requested with ``stream=True``) or items
+            from ``HTTPClient.iter_items()``.
+        min_length: Minimum expected list length (optional).
+        item_keys: Keys every item must contain (optional).
+    
+    Returns:
+        Number of items.
+    
+    Raises:
+        AssertionError: If the body is not a list, an item lacks a key, or
+            the length requirement is not met.
+    """
+    if isinstance(items, Response):
+        items = iter_json_items(items)
+    
+    count = 0
+    try:
+        for item in items:
+            if item_keys:
+                assert_json_structure(item, item_keys, path=f"root[{count}]")
+            count += 1
+    except json.JSONDecodeError as e:
+        raise AssertionError(f"Response is not a valid JSON list: {e.msg} at item {count}")
+    
+    if min_length is not None:
+        assert count >= min_length, f"Expected at least {min_length} items, got {count}"
+    return count
+
+
+def assert_matches_spec(
+    data: Union[Response, Iterable[Any]],
+    operation_id: str,
+    status: Optional[int] = None,
+    spec_loader: Optional[SpecLoader] = None,
+) -> int:
+    """Assert a response body matches its description in api_spec.json.
+    
+    The schema of each operation is compiled once per process. List bodies
+    are validated one item at a time against the compiled item schema, so
+    streamed lists never have to be held in memory.
+    
+    Args:
+        data: Response, or items from ``HTTPClient.iter_items()`` of a list
+            operation.
+        operation_id: Operation ID in api_spec.json.
+        status: Response status described in the spec; defaults to the
+            response's status code (200 for items).
+        spec_loader: Spec to validate against; defaults to the shared one.
+    
+    Returns:
+        Number of items validated (1 for a non-list body, 0 when the spec
+        does not describe the body).
+    
+    Raises:
+        AssertionError: If the status is not declared for the operation or
+            the body does not match the schema.
+        ValueError: If the operation is not in the spec.
+    """
+    spec_loader = spec_loader or get_default_spec_loader()
+    endpoint = spec_loader.get_endpoint_by_operation_id(operation_id)
+    if endpoint is None:
+        raise ValueError(f"Unknown operation: {operation_id}")
+    if status is None:
+        status = data.status_code if isinstance(data, Response) else 200
+    assert str(status) in endpoint.get("responses", {}), (
+        f"Status {status} is not declared for {operation_id} in api_spec.json"
+    )
+    
+    validator = spec_loader.get_response_validator(operation_id, status)
+    if validator is None:
+        return 0
+    
+    if validator.item_schema is None:
+        try:
+            body = response_json(data) if isinstance(data, Response) else data
+        except json.JSONDecodeError:
+            raise AssertionError(f"Response is not valid JSON: {data.text[:200]}")
+        errors = validator.errors(body)
+        assert not errors, f"Response of {operation_id} does not match api_spec.json:\n" + "\n".join(errors)
+        return 1
+    
+    items = iter_json_items(data) if isinstance(data, Response) else data
+    errors = []
+    count = 0
+    try:
+        for item in items:
+            errors.extend(validator.item_schema.errors(item, f"root[{count}]"))
+            count += 1
+            if len(errors) >= 10:
+                break
+    except json.JSONDecodeError as e:
+        raise AssertionError(f"Response is not a valid JSON list: {e.msg} at item {count}")
+    assert not errors, f"Response of {operation_id} does not match api_spec.json:\n" + "\n".join(errors[:10])
+    return count
+
+
 def assert_response_contains_text(response: Response, text: str) -> None:
     """Assert response text contains specific string.
     
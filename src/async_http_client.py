@@ -0,0 +1,458 @@
+"""Asyncio HTTP client for GanttPRO API.
+
+Async counterpart of :class:`src.http_client.HTTPClient` built on httpx.
+Exposes the same get/post/put/delete/request surface and keeps
+``request_history`` and ``last_response`` with the same semantics, so
+scenario and sweep code can fan out many in-flight calls from one process.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Dict, Optional, Tuple, TypeVar
+
+import httpx
+
+from .config import Config
+from .deadline import DeadlineExceeded, clip_timeout, remaining as deadline_remaining
+from .history import ExchangeRecord, RequestHistory, body_preview
+from .key_pool import APIKeyPool, get_default_key_pool
+from .rate_limiter import RateGovernor, get_default_governor
+from .retry import RetryPolicy
+from .single_flight import AsyncSingleFlight, flight_key
+from .spec_loader import SpecLoader, get_default_spec_loader
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _httpx_timeout(timeout: Any) -> Any:
+    """Convert a requests-style timeout, clipped to the deadline, for httpx.
+
+    Args:
+        timeout: Seconds, a (connect, read) tuple, None, or an httpx.Timeout
+            (passed through as is).
+
+    Returns:
+        httpx.Timeout; writes get the read timeout, waiting for a pooled
+        connection is only limited by the deadline.
+    """
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    timeout = clip_timeout(timeout)
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return httpx.Timeout(connect=connect, read=read, write=read, pool=deadline_remaining())
+
+
+class AsyncHTTPClient:
+    """Asyncio HTTP client for API requests."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_connections: int = 100,
+        rate_governor: Optional[RateGovernor] = None,
+        history_size: Optional[int] = None,
+        history_spill_path: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        spec_loader: Optional[SpecLoader] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+    ):
+        """Initialize async HTTP client.
+
+        Args:
+            base_url: Base URL for API requests. Defaults to Config.BASE_URL.
+            max_connections: Maximum number of simultaneously open connections.
+                Requests above this limit wait for a free connection.
+            rate_governor: Per-API-key rate limiter consulted before each send.
+                Defaults to the process-wide governor shared with HTTPClient.
+            history_size: Number of recent exchanges kept in request_history.
+                Defaults to Config.HISTORY_SIZE.
+            history_spill_path: JSON Lines file receiving exchanges evicted
+                from request_history. Defaults to Config.HISTORY_SPILL_PATH.
+            retry_policy: Retry policy for failed requests. Defaults to the
+                policy configured by RETRY_* settings (no retries unless set).
+                Its sleep function is not used; waits are awaited.
+            key_pool: API keys that requests sent with any of them are
+                spread over. Defaults to the pool shared with HTTPClient.
+            spec_loader: Spec used to resolve request paths to operations
+                and their timeouts. Defaults to the shared spec.
+            single_flight: Group coalescing identical concurrent GETs, e.g.
+                get_default_async_single_flight(). Off by default, so fan-out
+                of identical requests reaches the server as sent.
+        """
+        self.base_url = base_url or Config.BASE_URL
+        self.max_connections = max_connections
+        self.rate_governor = rate_governor or get_default_governor()
+        self.retry_policy = retry_policy or RetryPolicy.from_config()
+        self.key_pool = key_pool or get_default_key_pool()
+        self.request_history = RequestHistory(
+            capacity=history_size or Config.HISTORY_SIZE,
+            spill_path=history_spill_path or Config.HISTORY_SPILL_PATH,
+        )
+        self._spec_loader = spec_loader
+        self.single_flight = single_flight
+        self._timeouts: Optional[Dict[str, Tuple[float, float]]] = None
+        self.last_response: Optional[httpx.Response] = None
+        self._session: Optional[httpx.AsyncClient] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """Get httpx session bound to the running event loop.
+
+        Connections cannot be shared between event loops, so a new session
+        is opened whenever the client is used from a different loop (e.g.
+        consecutive ``asyncio.run`` calls from a session-scoped fixture)
+        and the stale one is dropped.
+
+        Returns:
+            httpx.AsyncClient instance.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session_loop is not loop:
+            self._session = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                # Timeouts are set per request (see _timeout_for)
+                timeout=None,
+            )
+            self._session_loop = loop
+        return self._session
+
+    @property
+    def spec_loader(self) -> SpecLoader:
+        """API spec used to resolve request paths to operations."""
+        if self._spec_loader is None:
+            self._spec_loader = get_default_spec_loader()
+        return self._spec_loader
+
+    def _timeout_for(self, method: str, path: str) -> Tuple[float, float]:
+        """Get (connect, read) timeout of the operation serving a request.
+
+        Operations may override the Config defaults in api_spec.json, as
+        for HTTPClient.
+
+        Args:
+            method: HTTP method.
+            path: API endpoint path.
+
+        Returns:
+            Connect and read timeouts in seconds.
+        """
+        if self._timeouts is None:
+            self._timeouts = {
+                endpoint["operationId"]: (
+                    endpoint["timeout"].get("connect", Config.HTTP_CONNECT_TIMEOUT),
+                    endpoint["timeout"].get("read", Config.HTTP_READ_TIMEOUT),
+                )
+                for endpoint in self.spec_loader.get_endpoints()
+                if endpoint.get("timeout")
+            }
+        endpoint = self.spec_loader.find_endpoint(method, path)
+        operation = endpoint.get("operationId") if endpoint else None
+        return self._timeouts.get(operation, (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT))
+
+    def _build_url(self, path: str) -> str:
+        """Build full URL from path.
+
+        Args:
+            path: API endpoint path (e.g., '/tasks/123').
+
+        Returns:
+            Full URL.
+        """
+        path = path.lstrip('/')
+        return f"{self.base_url}/{path}"
+
+    def _log_request(self, method: str, url: str, **kwargs) -> None:
+        """Log request details.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Additional request parameters.
+        """
+        # Lazy %-formatting: messages are only built if the level is enabled
+        logger.info("%s %s", method.upper(), url)
+        if kwargs.get('json'):
+            logger.debug("Request body: %s", kwargs['json'])
+        if kwargs.get('params'):
+            logger.debug("Query params: %s", kwargs['params'])
+
+    def _log_response(self, request_info: ExchangeRecord, response: httpx.Response) -> None:
+        """Log response details and store them in history.
+
+        Args:
+            request_info: History entry of the request this response answers.
+            response: HTTP response object.
+        """
+        status_code = response.status_code
+        logger.info("Response status: %s", status_code)
+
+        # Store in history; only the beginning of the body is decoded
+        request_info.record_response(
+            status_code,
+            response.headers,
+            body_preview(response.content, response.encoding),
+        )
+
+        # Full body is decoded only when the message will actually be emitted
+        if status_code >= 400:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Response body: %s", response.text)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response body: %s", (request_info.response_body or '')[:200])
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Make HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            path: API endpoint path.
+            headers: Request headers.
+            **kwargs: Additional arguments passed to httpx (json, params,
+                data, files, ...). ``timeout`` takes seconds or a (connect,
+                read) tuple like HTTPClient; without it the operation's
+                timeouts are used.
+
+        Returns:
+            Response object.
+
+        Raises:
+            httpx.TimeoutException: If connecting or reading timed out.
+            DeadlineExceeded: If the current deadline passed before the
+                request (or a retry) could be sent.
+        """
+        if self.key_pool is None or not headers or headers.get('X-API-Key') not in self.key_pool:
+            return await self._perform(method, path, headers, **kwargs)
+        key = self.key_pool.acquire()
+        try:
+            return await self._perform(method, path, dict(headers, **{'X-API-Key': key}), **kwargs)
+        finally:
+            self.key_pool.release(key)
+
+    async def _perform(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Make HTTP request with final headers (see request()).
+
+        Returns:
+            Response object.
+        """
+        url = self._build_url(path)
+        kwargs.setdefault('timeout', self._timeout_for(method, path))
+
+        merged_headers = {"Accept": "application/json"}
+        if headers:
+            merged_headers.update(headers)
+
+        request_info = ExchangeRecord(
+            method=method,
+            url=url,
+            headers={k: v for k, v in merged_headers.items() if k != 'X-API-Key'},  # Don't log API key
+            params=kwargs.get('params'),
+            body=kwargs.get('json') or kwargs.get('data'),
+        )
+        self.request_history.append(request_info)
+
+        self._log_request(method, url, **kwargs)
+
+        # Identical GETs already in flight are not sent again; their outcome is shared
+        if self.single_flight is not None and method.upper() == 'GET':
+            call_key = flight_key(method, url, merged_headers, **kwargs)
+            response, shared = await self.single_flight.do(
+                call_key, lambda: self._send(request_info, merged_headers, **kwargs)
+            )
+        else:
+            response, shared = await self._send(request_info, merged_headers, **kwargs), False
+
+        if shared:
+            # Own copy per caller, so decoded bodies are never shared; the body
+            # is already decoded, so the encoding headers must not come along
+            request_info.coalesced = True
+            headers = [
+                (name, value) for name, value in response.headers.multi_items()
+                if name.lower() not in ('content-encoding', 'content-length')
+            ]
+            response = httpx.Response(
+                response.status_code,
+                headers=headers,
+                content=response.content,
+                request=response.request,
+            )
+
+        self.last_response = response
+        self._log_response(request_info, response)
+        return response
+
+    async def _send(self, request_info: ExchangeRecord, headers: Dict[str, str], **kwargs) -> httpx.Response:
+        """Send request, retrying failed attempts per retry policy.
+
+        Args:
+            request_info: History entry of the request; throttle time and
+                retry count are accumulated on it.
+            headers: Merged request headers.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            Response of the last attempt.
+
+        Raises:
+            httpx.TransportError: If the last attempt failed to connect.
+            DeadlineExceeded: If the deadline passed before an attempt.
+        """
+        policy = self.retry_policy
+        if policy:
+            policy.budget.record_request()
+        method = request_info.method
+        attempt = 0
+        while True:
+            # Wait only if the budget of this API key is exhausted
+            if self.rate_governor.shared:
+                # Shared budgets wait on a file lock, which must not block the event loop
+                delay = await asyncio.to_thread(self.rate_governor.reserve, headers.get('X-API-Key'))
+            else:
+                delay = self.rate_governor.reserve(headers.get('X-API-Key'))
+            if delay > 0:
+                await asyncio.sleep(delay)
+            request_info.throttled += delay
+            if deadline_remaining() == 0:
+                raise DeadlineExceeded(f"Deadline exceeded before sending {method} {request_info.url}")
+            attempt_kwargs = dict(kwargs, timeout=_httpx_timeout(kwargs.get('timeout')))
+            try:
+                response = await self._get_session().request(
+                    method=method,
+                    url=request_info.url,
+                    headers=headers,
+                    **attempt_kwargs
+                )
+            except httpx.TransportError as e:
+                if not (policy and policy.should_retry(method, attempt, error=True)):
+                    raise
+                delay = policy.backoff(attempt)
+                reason = type(e).__name__
+            else:
+                if not (policy and policy.should_retry(method, attempt, response.status_code)):
+                    return response
+                delay = policy.backoff(attempt, response.headers)
+                reason = response.status_code
+            attempt += 1
+            request_info.retries = attempt
+            logger.warning("Retry %d of %s %s after %s in %.2fs", attempt, method, request_info.url, reason, delay)
+            await asyncio.sleep(delay)
+
+    def get_last_request(self) -> Optional[ExchangeRecord]:
+        """Get details of the last request made.
+
+        Returns:
+            Exchange record with request/response details or None.
+        """
+        return self.request_history.last()
+
+    def clear_history(self) -> None:
+        """Clear request history."""
+        self.request_history.clear()
+
+    async def get(self, path: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+        """Make GET request.
+
+        Args:
+            path: API endpoint path.
+            headers: Request headers.
+            **kwargs: Additional arguments.
+
+        Returns:
+            Response object.
+        """
+        return await self.request("GET", path, headers=headers, **kwargs)
+
+    async def post(self, path: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+        """Make POST request.
+
+        Args:
+            path: API endpoint path.
+            headers: Request headers.
+            **kwargs: Additional arguments.
+
+        Returns:
+            Response object.
+        """
+        return await self.request("POST", path, headers=headers, **kwargs)
+
+    async def put(self, path: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+        """Make PUT request.
+
+        Args:
+            path: API endpoint path.
+            headers: Request headers.
+            **kwargs: Additional arguments.
+
+        Returns:
+            Response object.
+        """
+        return await self.request("PUT", path, headers=headers, **kwargs)
+
+    async def delete(self, path: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> httpx.Response:
+        """Make DELETE request.
+
+        Args:
+            path: API endpoint path.
+            headers: Request headers.
+            **kwargs: Additional arguments.
+
+        Returns:
+            Response object.
+        """
+        return await self.request("DELETE", path, headers=headers, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the underlying session and its connections, and the history
+        spill file.
+
+        A session left over from an already finished event loop cannot be
+        closed gracefully any more and is simply dropped.
+        """
+        self.request_history.close()
+        session, session_loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is not None and session_loop is asyncio.get_running_loop():
+            await session.aclose()
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine to completion from synchronous code.
+
+        Convenience for pytest tests and fixtures that are not async
+        themselves; the session opened for the run is closed afterwards.
+
+        Args:
+            coro: Coroutine using this client.
+
+        Returns:
+            Result of the coroutine.
+        """
+        async def _runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_runner())
@@ -0,0 +1,216 @@
+"""Record/replay of HTTP exchanges.
+
+In record mode every exchange sent by HTTPClient is appended to a cassette
+file (JSON Lines, one interaction per line). In replay mode responses are
+served from the cassette without touching the network, so the suite can be
+rerun offline against a deterministic backend. Cassettes are kept per test:
+the active cassette is switched with :meth:`Cassette.use`.
+"""
+import base64
+import json
+import os
+import re
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+from .config import Config
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class Interaction:
+    """Recorded response."""
+
+    __slots__ = ('status_code', 'headers', 'content', 'encoding', 'url')
+
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes, encoding: Optional[str], url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.url = url
+
+
+def match_key(method: str, url: str, params: Any = None, body: Any = None) -> str:
+    """Build key identifying a request within a cassette.
+
+    Args:
+        method: HTTP method.
+        url: Request URL without query string.
+        params: Query parameters (dict or list of pairs) or None.
+        body: JSON-serializable request body or None.
+
+    Returns:
+        Key string.
+    """
+    query = ''
+    if params:
+        items = params.items() if isinstance(params, Mapping) else params
+        query = urlencode(sorted((str(k), str(v)) for k, v in items), doseq=True)
+    payload = json.dumps(body, sort_keys=True, default=str) if body is not None else ''
+    return f"{method.upper()} {url}?{query} {payload}"
+
+
+def cassette_name(test_id: str) -> str:
+    """Convert a test node ID to a cassette file name.
+
+    Args:
+        test_id: Pytest node ID.
+
+    Returns:
+        File name safe for any file system.
+    """
+    return re.sub(r'[^\w.-]+', '_', test_id).strip('_') + '.jsonl'
+
+
+class Cassette:
+    """Per-test store of recorded exchanges."""
+
+    def __init__(self, directory: str, mode: str, name: str = 'default'):
+        """Initialize cassette.
+
+        Args:
+            directory: Directory holding cassette files.
+            mode: 'record' to write exchanges, 'replay' to serve them.
+            name: Initially active cassette (usually a test node ID).
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        self.directory = directory
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, Deque[Interaction]] = {}
+        self.use(name)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def use(self, name: str) -> None:
+        """Switch the active cassette.
+
+        In record mode the cassette file is started afresh; in replay mode
+        its interactions are loaded.
+
+        Args:
+            name: Cassette name, usually a pytest node ID.
+        """
+        with self._lock:
+            self.name = name
+            self.path = os.path.join(self.directory, cassette_name(name))
+            if self.recording:
+                os.makedirs(self.directory, exist_ok=True)
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+            else:
+                self._recorded = self._load(self.path)
+
+    @staticmethod
+    def _load(path: str) -> Dict[str, Deque[Interaction]]:
+        recorded: Dict[str, Deque[Interaction]] = defaultdict(deque)
+        if not os.path.exists(path):
+            return recorded
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if 'body_b64' in entry:
+                    content = base64.b64decode(entry['body_b64'])
+                else:
+                    content = entry.get('body', '').encode('utf-8')
+                recorded[entry['key']].append(Interaction(
+                    status_code=entry['status'],
+                    headers=entry.get('headers', {}),
+                    content=content,
+                    encoding=entry.get('encoding'),
+                    url=entry['url'],
+                ))
+        return recorded
+
+    def record(
+        self,
+        key: str,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        encoding: Optional[str],
+        url: str,
+    ) -> None:
+        """Append an exchange to the active cassette.
+
+        Args:
+            key: Request key from :func:`match_key`.
+            status_code: Response status code.
+            headers: Response headers.
+            content: Raw response body.
+            encoding: Response body encoding.
+            url: Final response URL.
+        """
+        entry: Dict[str, Any] = {
+            'key': key,
+            'status': status_code,
+            'url': url,
+            'encoding': encoding,
+            'headers': dict(headers),
+        }
+        try:
+            entry['body'] = (content or b'').decode('utf-8')
+        except UnicodeDecodeError:
+            entry['body_b64'] = base64.b64encode(content).decode('ascii')
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.write('\n')
+
+    def play(self, key: str) -> Interaction:
+        """Take the next recorded response for a request.
+
+        Identical requests are answered in recording order; the last
+        recorded response is repeated once the queue is exhausted.
+
+        Args:
+            key: Request key from :func:`match_key`.
+
+        Returns:
+            Recorded interaction.
+
+        Raises:
+            CassetteMiss: If the request was never recorded in this cassette.
+        """
+        with self._lock:
+            queue = self._recorded.get(key)
+            if not queue:
+                raise CassetteMiss(f"No recorded response for {key!r} in cassette {self.path}")
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+
+_default_cassette: Optional[Cassette] = None
+_default_lock = threading.Lock()
+
+
+def get_default_cassette() -> Optional[Cassette]:
+    """Get process-wide cassette configured from Config.
+
+    Returns:
+        Cassette, or None unless CASSETTE_MODE is 'record' or 'replay'.
+    """
+    global _default_cassette
+    if not Config.CASSETTE_MODE:
+        return None
+    with _default_lock:
+        if _default_cassette is None:
+            _default_cassette = Cassette(Config.CASSETTE_DIR, Config.CASSETTE_MODE)
+        return _default_cassette
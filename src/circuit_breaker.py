@@ -0,0 +1,203 @@
+"""Circuit breakers per API operation.
+
+After a number of consecutive failures (connection errors, timeouts,
+gateway errors) of one operation its circuit opens: further requests to
+that operation fail immediately with CircuitOpenError instead of waiting
+for their own failure. After a cool-down one probe request is let through
+(half-open); its success closes the circuit, its failure reopens it. A
+probe ending without either outcome (e.g. cut short by a deadline) is
+released, and a probe never heard back from is replaced after another
+cool-down. Other operations are unaffected.
+"""
+import threading
+import time
+from typing import Callable, Collection, Dict, Optional
+
+import requests
+
+from .config import Config
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Statuses signalling an outage rather than an application error
+FAILURE_STATUSES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to an operation with an open circuit."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker of one operation."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Operation the breaker guards (used in error messages).
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before a probe.
+            clock: Monotonic time source.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.last_failure: Optional[str] = None
+        self.opened_at = 0.0
+        self.probe_started = 0.0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """Let a request through or reject it.
+
+        Returns:
+            True if the request is the probe of a half-open circuit; its
+            caller must record an outcome or call release_probe().
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with the
+                probe request already in flight.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            now = self._clock()
+            if self.state == HALF_OPEN and now - self.probe_started >= self.reset_timeout:
+                # The probe never reported back: open again, due for a new probe
+                self.state = OPEN
+                self.opened_at = self.probe_started
+            retry_in = self.opened_at + self.reset_timeout - now
+            if self.state == OPEN and retry_in <= 0:
+                # This request is the probe
+                self.state = HALF_OPEN
+                self.probe_started = now
+                return True
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"Circuit open for {self.name} after {self.failures} consecutive failures "
+                f"(last: {self.last_failure}); next probe in {max(0.0, retry_in):.1f}s"
+            )
+
+    def record_success(self) -> None:
+        """Record a successful exchange and close the circuit."""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def record_failure(self, reason: str) -> None:
+        """Record a failed exchange, opening the circuit at the threshold.
+
+        Args:
+            reason: Short description of the failure (status or error type).
+        """
+        with self._lock:
+            self.failures += 1
+            self.last_failure = reason
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = self._clock()
+
+    def release_probe(self) -> None:
+        """Give back the probe slot if the probe ended without an outcome.
+
+        Called when the probe request is done; a no-op once its success or
+        failure was recorded. Otherwise the next request becomes the probe.
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+                self.opened_at = self._clock() - self.reset_timeout
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being rejected."""
+        return self.state != CLOSED
+
+
+class CircuitBreakers:
+    """Circuit breakers keyed by operation."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        failure_statuses: Collection[int] = FAILURE_STATUSES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize breaker registry.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit;
+                0 disables circuit breaking.
+            reset_timeout: Seconds a circuit stays open before a probe.
+            failure_statuses: Response statuses counted as failures.
+            clock: Monotonic time source.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_statuses = frozenset(failure_statuses)
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def get(self, operation: str) -> Optional[CircuitBreaker]:
+        """Get breaker of an operation.
+
+        Args:
+            operation: Operation ID or "METHOD /path".
+
+        Returns:
+            Circuit breaker, or None when circuit breaking is disabled.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            breaker = self._breakers.get(operation)
+            if breaker is None:
+                breaker = self._breakers[operation] = CircuitBreaker(
+                    operation, self.failure_threshold, self.reset_timeout, self._clock,
+                )
+            return breaker
+
+    def open_circuits(self) -> Dict[str, CircuitBreaker]:
+        """Get breakers that are currently open or half-open."""
+        with self._lock:
+            return {name: breaker for name, breaker in self._breakers.items() if breaker.is_open}
+
+    def reset(self) -> None:
+        """Close all circuits."""
+        with self._lock:
+            self._breakers.clear()
+
+
+_default_breakers: Optional[CircuitBreakers] = None
+_default_lock = threading.Lock()
+
+
+def get_default_breakers() -> CircuitBreakers:
+    """Get process-wide circuit breakers configured from Config.
+
+    Returns:
+        Shared CircuitBreakers instance.
+    """
+    global _default_breakers
+    with _default_lock:
+        if _default_breakers is None:
+            _default_breakers = CircuitBreakers(Config.CIRCUIT_FAILURE_THRESHOLD, Config.CIRCUIT_RESET_TIMEOUT)
+        return _default_breakers
@@ -1,61 +1,291 @@
 """Configuration module for GanttPRO API tests.
 
-Loads and validates environment variables required for API testing.
+Settings are resolved lazily: nothing is read at import time. On first
+access to a setting the environment is assembled once and cached, with the
+process environment taking precedence over ``.env.<profile>``, then the
+built-in defaults of the profile, then ``.env``. The profile is chosen with
+CONFIG_PROFILE (e.g. ``staging``, ``prod`` or ``local`` for the stand-in
+server) or ``Config.reload(profile)``.
 """
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
-# Load environment variables from .env file
-load_dotenv()
+# Built-in profile defaults; .env.<profile> files may add or override values
+PROFILES: Dict[str, Dict[str, str]] = {
+    'prod': {
+        'BASE_URL': "https://api.ganttpro.com/v1.0",
+    },
+    # Stand-in server: python -m tests.harness.stand_in_server
+    'local': {
+        'BASE_URL': "http://127.0.0.1:8765",
+        'API_KEY': "stand-in",
+        'RATE_LIMIT_RPS': "0",
+    },
+}
+
+_environment: Optional[Dict[str, str]] = None
+_values: Dict[str, Any] = {}
+_lock = threading.RLock()
+
+
+def _find_env_file(name: str) -> Optional[str]:
+    # Imported on first use only: python-dotenv is not needed to import src
+    from dotenv import find_dotenv
+    return find_dotenv(name) or None
+
+
+def _load_environment(profile: Optional[str] = None) -> Dict[str, str]:
+    """Assemble the environment settings are read from.
+
+    Args:
+        profile: Profile name; defaults to CONFIG_PROFILE from the process
+            environment or .env.
+
+    Returns:
+        Mapping of variable names to raw values.
+
+    Raises:
+        ValueError: If the profile is neither built in nor has a
+            .env.<profile> file.
+    """
+    from dotenv import dotenv_values
+
+    base_file = _find_env_file(".env")
+    base = {k: v for k, v in dotenv_values(base_file).items() if v is not None} if base_file else {}
+    profile = profile or os.environ.get("CONFIG_PROFILE") or base.get("CONFIG_PROFILE") or None
+
+    environment = dict(base)
+    if profile:
+        profile_file = _find_env_file(f".env.{profile}")
+        if profile not in PROFILES and not profile_file:
+            raise ValueError(
+                f"Unknown config profile: {profile!r} "
+                f"(built in: {', '.join(PROFILES)}; or create .env.{profile})"
+            )
+        environment.update(PROFILES.get(profile, {}))
+        if profile_file:
+            environment.update({k: v for k, v in dotenv_values(profile_file).items() if v is not None})
+    environment.update(os.environ)
+    if profile:
+        environment["CONFIG_PROFILE"] = profile
+    return environment
+
+
+class Setting:
+    """Config value read from the environment on first access and cached."""
+
+    def __init__(self, parse: Callable[[str], Any] = str, default: Union[str, Callable[[], Any], None] = None):
+        """Initialize setting.
+
+        Args:
+            parse: Converts the raw string value.
+            default: Raw value used when the variable is unset or empty, or
+                a function computing the value (e.g. from other settings).
+        """
+        self.parse = parse
+        self.default = default
+        self.name = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        try:
+            return _values[self.name]
+        except KeyError:
+            pass
+        with _lock:
+            if self.name not in _values:
+                _values[self.name] = self.resolve()
+            return _values[self.name]
+
+    def resolve(self) -> Any:
+        """Read and parse the value from the current environment.
+
+        Returns:
+            Parsed value, or the default when unset or empty.
+        """
+        global _environment
+        with _lock:
+            if _environment is None:
+                _environment = _load_environment()
+            raw = _environment.get(self.name)
+        if raw:
+            return self.parse(raw)
+        if callable(self.default):
+            return self.default()
+        return None if self.default is None else self.parse(self.default)
+
+
+def _bool(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes")
+
+
+def _lower(value: str) -> str:
+    return value.lower()
+
+
+def _upper(value: str) -> str:
+    return value.upper()
+
+
+def _csv(value: str) -> Tuple[str, ...]:
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def _methods(value: str) -> Tuple[str, ...]:
+    return tuple(method.upper() for method in _csv(value))
+
+
+def _api_keys() -> Tuple[str, ...]:
+    return (Config.API_KEY,) if Config.API_KEY else ()
+
+
+def _user_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ganttpro-api-tests")
 
 
 class Config:
     """Configuration class for API testing."""
-    
+
+    # Named profile the settings come from (see PROFILES and .env.<profile>)
+    CONFIG_PROFILE: Optional[str] = Setting(_lower)
+
     # Required
-    BASE_URL: str = os.getenv("BASE_URL", "https://api.ganttpro.com/v1.0")
-    API_KEY: Optional[str] = os.getenv("API_KEY")
-    
+    BASE_URL: str = Setting(str, "https://api.ganttpro.com/v1.0")
+    API_KEY: Optional[str] = Setting()
+    # Several comma-separated keys to spread requests over (defaults to API_KEY)
+    API_KEYS: Tuple[str, ...] = Setting(_csv, _api_keys)
+    # How requests are spread over API_KEYS: round_robin or least_loaded
+    API_KEY_STRATEGY: str = Setting(_lower, "round_robin")
+
     # Optional IDs for endpoint tests
-    TASK_ID: Optional[str] = os.getenv("TASK_ID")
-    PROJECT_ID: Optional[str] = os.getenv("PROJECT_ID")
-    COMMENT_ID: Optional[str] = os.getenv("COMMENT_ID")
-    TIMELOG_ID: Optional[str] = os.getenv("TIMELOG_ID")
-    LINK_ID: Optional[str] = os.getenv("LINK_ID")
-    ATTACHMENT_ID: Optional[str] = os.getenv("ATTACHMENT_ID")
-    RESOURCE_ID: Optional[str] = os.getenv("RESOURCE_ID")
-    USER_ID: Optional[str] = os.getenv("USER_ID")
-    
+    TASK_ID: Optional[str] = Setting()
+    PROJECT_ID: Optional[str] = Setting()
+    COMMENT_ID: Optional[str] = Setting()
+    TIMELOG_ID: Optional[str] = Setting()
+    LINK_ID: Optional[str] = Setting()
+    ATTACHMENT_ID: Optional[str] = Setting()
+    RESOURCE_ID: Optional[str] = Setting()
+    USER_ID: Optional[str] = Setting()
+
+    # Client-side rate limiting per API key (RATE_LIMIT_RPS=0 disables it)
+    RATE_LIMIT_RPS: float = Setting(float, "2")
+    RATE_LIMIT_BURST: int = Setting(int, "5")
+    # Directory for a rate budget shared by all processes (e.g. xdist workers)
+    RATE_LIMIT_STATE_DIR: Optional[str] = Setting()
+
+    # Request history kept by HTTP clients (older exchanges optionally spilled to disk)
+    HISTORY_SIZE: int = Setting(int, "1000")
+    HISTORY_SPILL_PATH: Optional[str] = Setting()
+
+    # Opt-in retries of failed requests (RETRY_MAX_RETRIES=0 disables them)
+    RETRY_MAX_RETRIES: int = Setting(int, "0")
+    RETRY_METHODS: Tuple[str, ...] = Setting(_methods, "GET,HEAD,OPTIONS,PUT,DELETE")
+    RETRY_BACKOFF_BASE: float = Setting(float, "0.5")
+    RETRY_BACKOFF_MAX: float = Setting(float, "30")
+    # Retries allowed per request sent, plus a fixed allowance, across all clients
+    RETRY_BUDGET_RATIO: float = Setting(float, "0.2")
+    RETRY_BUDGET_MIN: int = Setting(int, "10")
+
+    # Opt-in hedging: duplicate GETs still unanswered after the operation's p95
+    # time to first byte, for at most HEDGE_BUDGET_RATIO extra requests
+    HEDGE_ENABLED: bool = Setting(_bool, "false")
+    HEDGE_PERCENTILE: float = Setting(float, "95")
+    HEDGE_MIN_SAMPLES: int = Setting(int, "20")
+    HEDGE_BUDGET_RATIO: float = Setting(float, "0.05")
+
+    # Send identical concurrent GETs (same URL, query and API key) only once
+    SINGLE_FLIGHT_ENABLED: bool = Setting(_bool, "true")
+
+    # Opt-in cache of GET responses for operations with a TTL in api_spec.json
+    CACHE_ENABLED: bool = Setting(_bool, "false")
+    CACHE_MAX_ENTRIES: int = Setting(int, "256")
+    CACHE_DIR: Optional[str] = Setting()
+
+    # Keep the parsed and indexed api_spec.json between runs, in a per-user cache
+    # directory outside the working tree (one file per spec content hash)
+    SPEC_CACHE_ENABLED: bool = Setting(_bool, "true")
+    SPEC_CACHE_DIR: str = Setting(str, _user_cache_dir)
+
+    # Circuit breaker per operation: consecutive failures that open it (0 disables)
+    # and seconds before a probe request is let through
+    CIRCUIT_FAILURE_THRESHOLD: int = Setting(int, "5")
+    CIRCUIT_RESET_TIMEOUT: float = Setting(float, "30")
+
+    # Record exchanges to per-test cassettes or replay them offline ("record" / "replay")
+    CASSETTE_MODE: Optional[str] = Setting(_lower)
+    CASSETTE_DIR: str = Setting(str, "cassettes")
+
+    # Concurrent requests in HTTPClient.batch
+    BATCH_MAX_WORKERS: int = Setting(int, "8")
+
+    # Connection pools of HTTPClient: hosts kept, keep-alive connections per host
+    HTTP_POOL_CONNECTIONS: int = Setting(int, "10")
+    HTTP_POOL_MAXSIZE: int = Setting(int, lambda: max(10, Config.BATCH_MAX_WORKERS))
+    # Default timeouts of HTTPClient requests (per operation overrides in api_spec.json)
+    HTTP_CONNECT_TIMEOUT: float = Setting(float, "5")
+    HTTP_READ_TIMEOUT: float = Setting(float, "30")
+    # Total request time allowed per test in seconds (0 disables the deadline)
+    TEST_DEADLINE: float = Setting(float, "0")
+    # Connections opened to BASE_URL before the first test (0 disables warm-up)
+    HTTP_WARMUP_CONNECTIONS: int = Setting(int, "0")
+
+    # Accept-Encoding of HTTPClient: auto (every decoder installed), identity, or a list
+    HTTP_ACCEPT_ENCODING: str = Setting(_lower, "auto")
+
+    # JSON backend for request bodies and response parsing: auto, stdlib or orjson
+    JSON_CODEC: str = Setting(_lower, "auto")
+
+    # Level of HTTP client logs (DEBUG adds request/response bodies)
+    LOG_LEVEL: str = Setting(_upper, "INFO")
+
+    @classmethod
+    def reload(cls, profile: Optional[str] = None) -> None:
+        """Drop cached settings and read them again on next access.
+
+        Process-wide objects built from settings (rate governor, breakers,
+        ...) keep their configuration; reload before creating clients.
+
+        Args:
+            profile: Profile to switch to; defaults to CONFIG_PROFILE.
+
+        Raises:
+            ValueError: If the profile is unknown.
+        """
+        global _environment
+        environment = _load_environment(profile)
+        with _lock:
+            _environment = environment
+            _values.clear()
+
     @classmethod
     def validate(cls) -> None:
         """Validate that required configuration is present.
-        
+
         Raises:
             ValueError: If required configuration is missing.
         """
-        if not cls.API_KEY:
+        if not cls.API_KEY and not cls.API_KEYS:
             raise ValueError(
                 "API_KEY is required. Please set it in your .env file. "
                 "Copy .env.example to .env and fill in your credentials."
             )
-    
+
     @classmethod
     def get_auth_headers(cls) -> dict:
         """Get authentication headers for API requests.
-        
+
+        With several API_KEYS the first one is used; HTTP clients spread
+        requests carrying any pooled key over the whole pool.
+
         Returns:
             Dictionary with authentication headers.
         """
+        api_key = cls.API_KEYS[0] if cls.API_KEYS else (cls.API_KEY or "")
         return {
-            "X-API-Key": cls.API_KEY or "",
+            "X-API-Key": api_key,
             "Accept": "application/json"
         }
-
-
-# Validate configuration on module import
-try:
-    Config.validate()
-except ValueError as e:
-    # Allow import but warn - tests will handle missing config
-    print(f"Warning: {e}")
@@ -0,0 +1,81 @@
+"""Deadlines shared by all requests made within a context.
+
+A deadline caps the time left for every request of, e.g., one test:
+HTTPClient clips its connect/read timeouts to the remaining time and
+refuses to start requests or retries once the deadline has passed. The
+deadline lives in a context variable, so it follows the test through
+nested calls and is copied into HTTPClient.batch worker threads.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple, Union
+
+import requests
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+_deadline: "ContextVar[Optional[float]]" = ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when a request cannot start before the deadline."""
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Cap the remaining time of all requests made in the block.
+
+    Nested deadlines never extend an outer one.
+
+    Args:
+        seconds: Time budget in seconds; None or 0 leaves the current
+            deadline (if any) unchanged.
+    """
+    if not seconds:
+        yield
+        return
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(expires_at if outer is None else min(outer, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Get time left until the current deadline.
+
+    Returns:
+        Seconds left (0 once passed) or None without a deadline.
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return max(0.0, expires_at - time.monotonic())
+
+
+def clip_timeout(timeout: Timeout) -> Timeout:
+    """Limit a requests timeout to the time left until the deadline.
+
+    Read timeouts apply per socket read, so a response trickling in slowly
+    can still overrun the deadline slightly.
+
+    Args:
+        timeout: Timeout as accepted by requests: seconds, a
+            (connect, read) tuple or None.
+
+    Returns:
+        Timeout in the same form, with no part exceeding the time left.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return (
+            left if connect is None else min(connect, left),
+            left if read is None else min(read, left),
+        )
+    return left if timeout is None else min(timeout, left)
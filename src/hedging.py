@@ -0,0 +1,110 @@
+"""Hedged requests for tail-latency reduction.
+
+When a request has not answered within the observed p95 time to first
+byte of its operation, a duplicate is sent and whichever finishes first
+wins. Hedging is limited to idempotent methods and capped by a budget
+relative to traffic, so slow responses cost at most a few percent of
+extra requests.
+"""
+import threading
+from typing import Collection, Optional
+
+from .config import Config
+from .metrics import LatencyHistogram
+from .retry import RetryBudget
+
+
+class HedgePolicy:
+    """When to send a duplicate of a slow request."""
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        min_delay: float = 0.005,
+        methods: Collection[str] = ('GET',),
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initialize hedge policy.
+
+        Args:
+            percentile: Time-to-first-byte percentile of the operation after
+                which the duplicate is sent.
+            min_samples: Exchanges of an operation observed before it is
+                hedged at all.
+            min_delay: Lower bound of the hedge delay in seconds.
+            methods: HTTP methods that may be hedged.
+            budget: Cap on hedges relative to hedge-eligible requests;
+                defaults to the process-wide hedge budget.
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.methods = frozenset(m.upper() for m in methods)
+        self.budget = budget or get_default_hedge_budget()
+        self._lock = threading.Lock()
+        self.hedges = 0
+        self.wins = 0
+
+    def delay_for(self, method: str, histogram: Optional[LatencyHistogram]) -> Optional[float]:
+        """Get hedge delay of a request.
+
+        Records the request in the hedge budget when it is eligible.
+
+        Args:
+            method: HTTP method.
+            histogram: Time-to-first-byte histogram of the operation.
+
+        Returns:
+            Seconds to wait before hedging, or None if the request is not
+            hedged (method not allowed or too few samples).
+        """
+        if method.upper() not in self.methods or histogram is None or histogram.count < self.min_samples:
+            return None
+        self.budget.record_request()
+        return max(self.min_delay, histogram.percentile(self.percentile))
+
+    def try_hedge(self) -> bool:
+        """Take one hedge from the budget.
+
+        Returns:
+            True if the duplicate may be sent.
+        """
+        if not self.budget.try_spend():
+            return False
+        with self._lock:
+            self.hedges += 1
+        return True
+
+    def record_win(self) -> None:
+        """Record that the duplicate answered first."""
+        with self._lock:
+            self.wins += 1
+
+    @classmethod
+    def from_config(cls) -> Optional["HedgePolicy"]:
+        """Build policy from Config.
+
+        Returns:
+            HedgePolicy, or None unless HEDGE_ENABLED is set.
+        """
+        if not Config.HEDGE_ENABLED:
+            return None
+        return cls(percentile=Config.HEDGE_PERCENTILE, min_samples=Config.HEDGE_MIN_SAMPLES)
+
+
+_default_budget: Optional[RetryBudget] = None
+_default_lock = threading.Lock()
+
+
+def get_default_hedge_budget() -> RetryBudget:
+    """Get process-wide hedge budget configured from Config.
+
+    Returns:
+        Shared budget allowing HEDGE_BUDGET_RATIO hedges per eligible request.
+    """
+    global _default_budget
+    with _default_lock:
+        if _default_budget is None:
+            _default_budget = RetryBudget(Config.HEDGE_BUDGET_RATIO, min_retries=0)
+        return _default_budget
@@ -0,0 +1,295 @@
+"""Bounded request/response history for HTTP clients.
+
+Keeps the most recent exchanges in a fixed-capacity ring buffer of slotted
+records. Older exchanges are dropped or, optionally, appended to a JSON
+Lines spill file so long soak runs keep constant memory.
+"""
+import json
+import threading
+import weakref
+from collections import deque
+from typing import Any, Dict, Iterator, List, Mapping, Optional, TextIO, Union
+
+# Response headers worth keeping for reports and debugging
+KEPT_RESPONSE_HEADERS = (
+    'content-type',
+    'content-length',
+    'content-encoding',
+    'etag',
+    'last-modified',
+    'retry-after',
+)
+
+RESPONSE_BODY_LIMIT = 500
+
+
+def body_preview(content: Optional[bytes], encoding: Optional[str], limit: int = RESPONSE_BODY_LIMIT) -> Optional[str]:
+    """Decode only the beginning of a response body.
+
+    Avoids decoding multi-megabyte bodies just to keep their first chars.
+
+    Args:
+        content: Raw response body.
+        encoding: Body encoding; UTF-8 when unknown.
+        limit: Number of characters to keep.
+
+    Returns:
+        At most ``limit`` decoded characters, or None for an empty body.
+    """
+    if not content:
+        return None
+    # A character takes at most 4 bytes, so this slice always covers `limit` chars
+    return content[:limit * 4].decode(encoding or 'utf-8', errors='replace')[:limit]
+
+
+class ExchangeRecord:
+    """One request/response exchange.
+
+    Supports read access by key (``record['url']``, ``record.get('response')``)
+    so code written against the former dict entries keeps working.
+    """
+
+    __slots__ = (
+        'method',
+        'url',
+        'headers',
+        'params',
+        'body',
+        'status_code',
+        'response_headers',
+        'response_body',
+        'throttled',
+        'retries',
+        'from_cache',
+        'revalidated',
+        'hedged',
+        'coalesced',
+        'connect_time',
+        'ttfb',
+        'total_time',
+        'bytes_sent',
+        'bytes_received',
+        'bytes_transferred',
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Any = None,
+        body: Any = None,
+    ):
+        """Initialize exchange record.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            headers: Request headers (without API key).
+            params: Query parameters.
+            body: Request body (json or form data).
+        """
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.params = params
+        self.body = body
+        self.status_code: Optional[int] = None
+        self.response_headers: Optional[Dict[str, str]] = None
+        self.response_body: Optional[str] = None
+        self.throttled = 0.0
+        self.retries = 0
+        self.from_cache = False
+        self.revalidated = False
+        self.hedged = False
+        self.coalesced = False
+        self.connect_time = 0.0
+        self.ttfb = 0.0
+        self.total_time = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bytes_transferred = 0
+
+    def record_response(self, status_code: int, headers: Mapping[str, str], text: Optional[str]) -> None:
+        """Store compact response details.
+
+        Args:
+            status_code: HTTP status code.
+            headers: Response headers; only KEPT_RESPONSE_HEADERS are kept.
+            text: Response body; truncated to RESPONSE_BODY_LIMIT chars.
+        """
+        self.status_code = status_code
+        self.response_headers = {
+            name: value for name, value in headers.items()
+            if name.lower() in KEPT_RESPONSE_HEADERS
+        }
+        self.response_body = text[:RESPONSE_BODY_LIMIT] if text else None
+
+    @property
+    def response(self) -> Optional[Dict[str, Any]]:
+        """Response details in the legacy dict shape, None before a response."""
+        if self.status_code is None:
+            return None
+        return {
+            'status_code': self.status_code,
+            'headers': self.response_headers,
+            'body': self.response_body,
+        }
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Timing breakdown in seconds.
+
+        ``wait`` is time spent throttled by the rate limit, ``connect`` time
+        spent opening connections, ``ttfb`` time from sending the final
+        attempt until response headers arrived, and ``total`` the wall time
+        of the whole exchange including waits, retries and body download.
+        """
+        return {
+            'wait': self.throttled,
+            'connect': self.connect_time,
+            'ttfb': self.ttfb,
+            'total': self.total_time,
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'response':
+            return self.response
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key == 'response' or key in self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get field by name like dict.get.
+
+        Args:
+            key: Field name.
+            default: Value returned for unknown fields.
+
+        Returns:
+            Field value or default.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a plain dictionary.
+
+        Returns:
+            Dictionary with request details and nested response.
+        """
+        return {
+            'method': self.method,
+            'url': self.url,
+            'headers': self.headers,
+            'params': self.params,
+            'body': self.body,
+            'response': self.response,
+            'throttled': self.throttled,
+            'retries': self.retries,
+            'from_cache': self.from_cache,
+            'revalidated': self.revalidated,
+            'hedged': self.hedged,
+            'coalesced': self.coalesced,
+            'timings': self.timings,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'bytes_transferred': self.bytes_transferred,
+        }
+
+    def __repr__(self) -> str:
+        return f"ExchangeRecord({self.method} {self.url} -> {self.status_code})"
+
+
+class RequestHistory:
+    """Fixed-capacity ring buffer of exchange records.
+
+    Behaves like a read-only sequence of the most recent records
+    (``history[-1]``, ``len(history)``, iteration, truthiness).
+    """
+
+    def __init__(self, capacity: int = 1000, spill_path: Optional[str] = None):
+        """Initialize request history.
+
+        Args:
+            capacity: Number of most recent records kept in memory.
+            spill_path: Optional JSON Lines file receiving records evicted
+                from memory. Records are spilled as they are at eviction time,
+                through one handle kept open until close().
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spilled = 0
+        self._records: deque = deque()
+        self._lock = threading.Lock()
+        self._spill_file: Optional[TextIO] = None
+
+    def append(self, record: ExchangeRecord) -> None:
+        """Add record, evicting the oldest one when full.
+
+        Args:
+            record: Exchange record to add.
+        """
+        with self._lock:
+            if len(self._records) >= self.capacity:
+                evicted = self._records.popleft()
+                if self.spill_path:
+                    self._spill(evicted)
+            self._records.append(record)
+
+    def _spill(self, record: ExchangeRecord) -> None:
+        if self._spill_file is None:
+            # Line-buffered: every spilled record is readable right away
+            self._spill_file = open(self.spill_path, 'a', encoding='utf-8', buffering=1)
+            weakref.finalize(self, self._spill_file.close)
+        self._spill_file.write(json.dumps(record.to_dict(), default=str, ensure_ascii=False) + '\n')
+        self.spilled += 1
+
+    def close(self) -> None:
+        """Close the spill file; it is reopened if more records are evicted."""
+        with self._lock:
+            spill_file, self._spill_file = self._spill_file, None
+        if spill_file is not None:
+            spill_file.close()
+
+    def last(self) -> Optional[ExchangeRecord]:
+        """Get most recent record.
+
+        Returns:
+            Last record or None if history is empty.
+        """
+        with self._lock:
+            return self._records[-1] if self._records else None
+
+    def clear(self) -> None:
+        """Drop all in-memory records (the spill file is kept)."""
+        with self._lock:
+            self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
+
+    def __iter__(self) -> Iterator[ExchangeRecord]:
+        with self._lock:
+            return iter(list(self._records))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ExchangeRecord, List[ExchangeRecord]]:
+        with self._lock:
+            if isinstance(index, slice):
+                return list(self._records)[index]
+            return self._records[index]
@@ -5,31 +5,268 @@ authentication, and logging capabilities.
 """
 import logging
 import json
-from typing import Any, Dict, Optional, List
+import time
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, Optional, List, Mapping, Sequence, Tuple
 import requests
 from requests import Response
+from requests.structures import CaseInsensitiveDict
 
+from .cassette import Cassette, CassetteMiss, get_default_cassette, match_key
+from .circuit_breaker import CircuitBreaker, CircuitBreakers, get_default_breakers
 from .config import Config
+from .deadline import DeadlineExceeded, clip_timeout, remaining as deadline_remaining
+from .hedging import HedgePolicy
+from .history import ExchangeRecord, RequestHistory, body_preview
+from .json_codec import JSONResponse, get_codec, iter_json_array
+from .key_pool import APIKeyPool, get_default_key_pool
+from .metrics import LatencyStats, get_default_latency_stats
+from .rate_limiter import RateGovernor, get_default_governor
+from .response_cache import ResponseCache, cache_key
+from .retry import RetryPolicy
+from .single_flight import SingleFlight, flight_key, get_default_single_flight
+from .spec_loader import SpecLoader, get_default_spec_loader
+from .transport import TimedHTTPAdapter, accept_encoding, connect_time, reset_connect_timer, transferred_bytes
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _keep_retrying(delay: float, breaker: Optional[CircuitBreaker]) -> bool:
+    """Check that a retry after delay seconds is still worth sending.
+    
+    Retries stop when the wait would pass the deadline or the circuit of
+    the operation has opened meanwhile.
+    """
+    if breaker is not None and breaker.is_open:
+        return False
+    left = deadline_remaining()
+    return left is None or delay < left
+
+
+def _close_response(future: Future) -> None:
+    """Release the connection of a response nobody is waiting for."""
+    if future.exception() is None:
+        future.result().close()
+
+
+def _body_read(response: Response) -> bool:
+    """Check whether the body of a response has been read (not a pending stream)."""
+    return response._content is not False
+
+
+def _count_bytes(chunks: Iterator[bytes], request_info: ExchangeRecord) -> Iterator[bytes]:
+    """Pass body chunks through, adding their size to bytes_received."""
+    for chunk in chunks:
+        request_info.bytes_received += len(chunk)
+        yield chunk
+
+
+def _body_size(body: Any) -> int:
+    """Size in bytes of a prepared request body."""
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0  # Streamed bodies (files, generators) are not measured
+
+
+class BatchResult:
+    """Outcome of one request sent through HTTPClient.batch."""
+    
+    __slots__ = ('method', 'path', 'response', 'error', 'elapsed')
+    
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        response: Optional[Response],
+        error: Optional[Exception],
+        elapsed: float,
+    ):
+        """Initialize batch result.
+        
+        Args:
+            method: HTTP method.
+            path: API endpoint path.
+            response: Response, or None if the request raised.
+            error: Exception raised while sending, if any.
+            elapsed: Wall-clock seconds spent on the request.
+        """
+        self.method = method
+        self.path = path
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+    
+    @property
+    def ok(self) -> bool:
+        """True if a response was received (regardless of status code)."""
+        return self.error is None
+    
+    def __repr__(self) -> str:
+        outcome = self.response.status_code if self.response is not None else type(self.error).__name__
+        return f"BatchResult({self.method} {self.path} -> {outcome}, {self.elapsed:.3f}s)"
+
+
 class HTTPClient:
     """HTTP client for API requests."""
     
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        rate_governor: Optional[RateGovernor] = None,
+        history_size: Optional[int] = None,
+        history_spill_path: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        spec_loader: Optional[SpecLoader] = None,
+        cassette: Optional[Cassette] = None,
+        latency_stats: Optional[LatencyStats] = None,
+        pool_maxsize: Optional[int] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        single_flight: Optional[SingleFlight] = None,
+        key_pool: Optional[APIKeyPool] = None,
+    ):
         """Initialize HTTP client.
         
         Args:
             base_url: Base URL for API requests. Defaults to Config.BASE_URL.
+            rate_governor: Per-API-key rate limiter consulted before each send.
+                Defaults to the process-wide governor configured from Config.
+            history_size: Number of recent exchanges kept in request_history.
+                Defaults to Config.HISTORY_SIZE.
+            history_spill_path: JSON Lines file receiving exchanges evicted
+                from request_history. Defaults to Config.HISTORY_SPILL_PATH.
+            retry_policy: Retry policy for failed requests. Defaults to the
+                policy configured by RETRY_* settings (no retries unless set).
+            response_cache: Cache for GET responses of operations with a TTL.
+                Defaults to the cache configured by CACHE_* settings (off
+                unless CACHE_ENABLED is set).
+            spec_loader: Spec used to resolve request paths to operations.
+                Loaded from api_spec.json on first use.
+            cassette: Cassette recording or replaying exchanges. Defaults to
+                the cassette configured by CASSETTE_* settings (none unless
+                CASSETTE_MODE is set).
+            latency_stats: Per-operation latency histograms. Defaults to
+                the process-wide stats shared by all clients.
+            pool_maxsize: Keep-alive connections kept per host. Defaults to
+                Config.HTTP_POOL_MAXSIZE.
+            circuit_breakers: Per-operation circuit breakers. Defaults to the
+                process-wide breakers configured by CIRCUIT_* settings.
+            hedge_policy: Policy for duplicating slow GETs. Defaults to the
+                policy configured by HEDGE_* settings (off unless
+                HEDGE_ENABLED is set).
+            single_flight: Group coalescing identical concurrent GETs.
+                Defaults to the process-wide group when
+                SINGLE_FLIGHT_ENABLED is set (the default).
+            key_pool: API keys that requests sent with any of them are
+                spread over. Defaults to the process-wide pool of API_KEYS.
         """
         self.base_url = base_url or Config.BASE_URL
+        self.rate_governor = rate_governor or get_default_governor()
+        self.retry_policy = retry_policy or RetryPolicy.from_config()
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.from_config()
+        self._spec_loader = spec_loader
+        self._timeouts: Optional[Dict[str, Tuple[float, float]]] = None
+        self.cassette = cassette or get_default_cassette()
+        self.latency_stats = latency_stats if latency_stats is not None else get_default_latency_stats()
+        self.circuit_breakers = circuit_breakers or get_default_breakers()
+        self.hedge_policy = hedge_policy or HedgePolicy.from_config()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        if single_flight is None and Config.SINGLE_FLIGHT_ENABLED:
+            single_flight = get_default_single_flight()
+        self.single_flight = single_flight
+        self.key_pool = key_pool or get_default_key_pool()
         self.session = requests.Session()
-        self.request_history: List[Dict[str, Any]] = []
+        self.session.headers['Accept-Encoding'] = accept_encoding(Config.HTTP_ACCEPT_ENCODING)
+        self.pool_maxsize = pool_maxsize or Config.HTTP_POOL_MAXSIZE
+        self.adapter = TimedHTTPAdapter(
+            pool_connections=Config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+        )
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        self.request_history = RequestHistory(
+            capacity=history_size or Config.HISTORY_SIZE,
+            spill_path=history_spill_path or Config.HISTORY_SPILL_PATH,
+        )
         self.last_response: Optional[Response] = None  # Для Allure отчётов
     
+    def warm_up(self, connections: Optional[int] = None) -> int:
+        """Open keep-alive connections to the base URL in parallel.
+        
+        Args:
+            connections: Number of connections. Defaults to
+                Config.HTTP_WARMUP_CONNECTIONS.
+        
+        Returns:
+            Number of connections opened; failures are logged, not raised.
+        """
+        count = Config.HTTP_WARMUP_CONNECTIONS if connections is None else connections
+        if count <= 0 or (self.cassette is not None and self.cassette.replaying):
+            return 0
+        started = time.perf_counter()
+        opened = self.adapter.warm_up(self.base_url, count)
+        logger.info("Warmed up %d of %d connections to %s in %.3fs",
+                    opened, count, self.base_url, time.perf_counter() - started)
+        return opened
+    
+    def connection_stats(self) -> Dict[str, int]:
+        """Get keep-alive reuse statistics of the session.
+        
+        Returns:
+            Dictionary with requests, connections_opened, connections_warmed
+            and reused counts.
+        """
+        return self.adapter.stats()
+    
+    @property
+    def spec_loader(self) -> SpecLoader:
+        """API spec used to resolve request paths to operations."""
+        if self._spec_loader is None:
+            self._spec_loader = get_default_spec_loader()
+        return self._spec_loader
+    
+    def _operation_id(self, method: str, path: str) -> Optional[str]:
+        """Resolve request to its operationId in api_spec.json.
+        
+        Args:
+            method: HTTP method.
+            path: API endpoint path.
+        
+        Returns:
+            Operation ID or None for paths not in the spec.
+        """
+        endpoint = self.spec_loader.find_endpoint(method, path)
+        return endpoint.get("operationId") if endpoint else None
+    
+    def _timeout_for(self, operation_id: Optional[str]) -> Tuple[float, float]:
+        """Get (connect, read) timeout of an operation.
+        
+        Operations may override the Config defaults in api_spec.json
+        (``"timeout": {"connect": 5, "read": 60}``).
+        
+        Args:
+            operation_id: Operation ID or None for paths not in the spec.
+        
+        Returns:
+            Connect and read timeouts in seconds.
+        """
+        if self._timeouts is None:
+            self._timeouts = {
+                endpoint["operationId"]: (
+                    endpoint["timeout"].get("connect", Config.HTTP_CONNECT_TIMEOUT),
+                    endpoint["timeout"].get("read", Config.HTTP_READ_TIMEOUT),
+                )
+                for endpoint in self.spec_loader.get_endpoints()
+                if endpoint.get("timeout")
+            }
+        return self._timeouts.get(operation_id, (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT))
+    
     def _build_url(self, path: str) -> str:
         """Build full URL from path.
         
@@ -51,32 +288,41 @@ class HTTPClient:
             url: Request URL.
             **kwargs: Additional request parameters.
         """
-        logger.info(f"{method.upper()} {url}")
+        # Lazy %-formatting: messages are only built if the level is enabled
+        logger.info("%s %s", method.upper(), url)
         if kwargs.get('json'):
-            logger.debug(f"Request body: {kwargs['json']}")
+            logger.debug("Request body: %s", kwargs['json'])
         if kwargs.get('params'):
-            logger.debug(f"Query params: {kwargs['params']}")
+            logger.debug("Query params: %s", kwargs['params'])
     
-    def _log_response(self, response: Response) -> None:
-        """Log response details.
+    def _log_response(self, request_info: ExchangeRecord, response: Response) -> None:
+        """Log response details and store them in history.
         
         Args:
+            request_info: History entry of the request this response answers.
             response: HTTP response object.
         """
-        logger.info(f"Response status: {response.status_code}")
+        status_code = response.status_code
+        logger.info("Response status: %s", status_code)
         
-        # Store in history
-        if self.request_history:
-            self.request_history[-1]['response'] = {
-                'status_code': response.status_code,
-                'headers': dict(response.headers),
-                'body': response.text[:500] if response.text else None
-            }
+        # Streamed bodies are left to the caller and not previewed
+        streamed = not _body_read(response)
         
-        if response.status_code >= 400:
-            logger.error(f"Response body: {response.text}")
-        else:
-            logger.debug(f"Response body: {response.text[:200]}")
+        # Store in history; only the beginning of the body is decoded
+        request_info.record_response(
+            status_code,
+            response.headers,
+            None if streamed else body_preview(response.content, response.encoding),
+        )
+        
+        # Full body is decoded only when the message will actually be emitted
+        if streamed:
+            return
+        if status_code >= 400:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Response body: %s", response.text)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response body: %s", (request_info.response_body or '')[:200])
     
     def request(
         self,
@@ -91,12 +337,64 @@ class HTTPClient:
             method: HTTP method (GET, POST, PUT, DELETE).
             path: API endpoint path.
             headers: Request headers.
-            **kwargs: Additional arguments passed to requests.
+            **kwargs: Additional arguments passed to requests. Without an
+                explicit ``timeout`` the operation's timeouts are used.
         
         Returns:
             Response object.
+        
+        Raises:
+            DeadlineExceeded: If the current deadline passed before the
+                request (or a retry) could be sent.
+            CircuitOpenError: If the circuit of the operation is open.
+        
+        With ``stream=True`` the body is not read: it can be consumed with
+        ``response.iter_items()`` or ``iter_content()``, and is neither cached
+        nor recorded in history. Identical GETs issued concurrently are sent
+        once and share the response (see SINGLE_FLIGHT_ENABLED). Cached
+        responses with an ETag or Last-Modified are revalidated once expired;
+        a 304 answer returns the cached body.
+        """
+        return self._exchange(method, path, headers, **kwargs)[0]
+    
+    def _exchange(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Tuple[Response, ExchangeRecord]:
+        """Make HTTP request (see request()), taking the API key from the pool
+        if X-API-Key is one of its keys.
+        
+        Returns:
+            Response object and its history entry.
         """
+        if self.key_pool is None or not headers or headers.get('X-API-Key') not in self.key_pool:
+            return self._perform(method, path, headers, **kwargs)
+        key = self.key_pool.acquire()
+        try:
+            return self._perform(method, path, dict(headers, **{'X-API-Key': key}), **kwargs)
+        finally:
+            self.key_pool.release(key)
+    
+    def _perform(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Tuple[Response, ExchangeRecord]:
+        """Make HTTP request with final headers (see request()).
+        
+        Returns:
+            Response object and its history entry.
+        """
+        started = time.perf_counter()
         url = self._build_url(path)
+        operation = self._operation_id(method, path)
+        # Unknown paths are grouped by method and path
+        operation_name = operation or f"{method.upper()} /{path.split('?')[0].lstrip('/')}"
         
         # Merge headers
         merged_headers = {"Accept": "application/json"}
@@ -104,40 +402,486 @@ class HTTPClient:
             merged_headers.update(headers)
         
         # Store request details
-        request_info = {
-            'method': method,
-            'url': url,
-            'headers': {k: v for k, v in merged_headers.items() if k != 'X-API-Key'},  # Don't log API key
-            'params': kwargs.get('params'),
-            'body': kwargs.get('json') or kwargs.get('data'),
-            'response': None
-        }
+        request_info = ExchangeRecord(
+            method=method,
+            url=url,
+            headers={k: v for k, v in merged_headers.items() if k != 'X-API-Key'},  # Don't log API key
+            params=kwargs.get('params'),
+            body=kwargs.get('json') or kwargs.get('data'),
+        )
         self.request_history.append(request_info)
         
         self._log_request(method, url, **kwargs)
         
-        response = self.session.request(
-            method=method,
-            url=url,
-            headers=merged_headers,
-            **kwargs
+        # Serve reference data from cache when the operation has a TTL
+        key = ttl = stale = None
+        if self.response_cache is not None and method.upper() == 'GET':
+            ttl = self.response_cache.ttl_for(operation)
+            if ttl is not None:
+                key = cache_key(method, url, kwargs.get('params'), merged_headers.get('X-API-Key'))
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    request_info.from_cache = True
+                    response = self._build_response(
+                        cached.status_code, cached.headers, cached.content, cached.encoding,
+                        cached.url, method, url, kwargs.get('params'),
+                    )
+                    request_info.total_time = time.perf_counter() - started
+                    self.last_response = response
+                    self._log_response(request_info, response)
+                    return response, request_info
+                # Expired entries with an ETag / Last-Modified are revalidated
+                stale = self.response_cache.get_stale(key)
+                if stale is not None:
+                    merged_headers.update(stale.validators)
+                    request_info.headers.update(stale.validators)
+        
+        breaker = self.circuit_breakers.get(operation_name)
+        
+        # Slow GETs are duplicated once past the operation's p95 time to first byte
+        hedge_delay = None
+        if self.hedge_policy is not None and self.cassette is None:
+            hedge_delay = self.hedge_policy.delay_for(method, self.latency_stats.histogram(operation_name, 'ttfb'))
+        
+        kwargs.setdefault('timeout', self._timeout_for(operation))
+        
+        def fetch() -> Response:
+            probe = breaker is not None and breaker.allow()
+            try:
+                response = self._send(request_info, merged_headers, breaker, hedge_delay, **kwargs)
+            finally:
+                # A probe that raised before recording an outcome must not keep the circuit half-open
+                if probe:
+                    breaker.release_probe()
+            if stale is not None and response.status_code == 304:
+                # Not modified: answer with the stored body instead of the empty 304
+                cached = self.response_cache.refresh(key, ttl, response.headers) or stale
+                request_info.revalidated = True
+                response = self._build_response(
+                    cached.status_code, cached.headers, cached.content, cached.encoding,
+                    cached.url, method, url, kwargs.get('params'),
+                )
+            return response
+        
+        # Identical GETs already in flight are not sent again; their outcome is shared
+        if (self.single_flight is not None and method.upper() == 'GET'
+                and self.cassette is None and not kwargs.get('stream')):
+            call_key = flight_key(method, url, merged_headers, **kwargs)
+            response, shared = self.single_flight.do(call_key, fetch, timeout=deadline_remaining())
+        else:
+            response, shared = fetch(), False
+        
+        if shared:
+            # Own copy per caller, so memoized bodies are never shared
+            request_info.coalesced = True
+            response = self._build_response(
+                response.status_code, response.headers, response.content, response.encoding,
+                response.url, method, url, kwargs.get('params'),
+            )
+            request_info.total_time = time.perf_counter() - started
+            self.last_response = response
+            self._log_response(request_info, response)
+            return response, request_info
+        
+        if key and not request_info.revalidated and _body_read(response) and 200 <= response.status_code < 300:
+            self.response_cache.put(
+                key, ttl, response.status_code, response.headers,
+                response.content, response.encoding, response.url,
+            )
+        
+        request_info.total_time = time.perf_counter() - started
+        request_info.bytes_sent = _body_size(response.request.body if response.request else None)
+        # A revalidated body was not transferred again; a streamed one is not read yet
+        if _body_read(response) and not request_info.revalidated:
+            request_info.bytes_received = len(response.content or b'')
+            request_info.bytes_transferred = transferred_bytes(response)
+        self.latency_stats.record(
+            operation_name,
+            request_info.timings,
         )
         
         self.last_response = response  # Сохраняем для Allure
-        self._log_response(response)
+        self._log_response(request_info, response)
+        return response, request_info
+    
+    @staticmethod
+    def _build_response(
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        encoding: Optional[str],
+        response_url: str,
+        method: str,
+        url: str,
+        params: Any,
+    ) -> Response:
+        """Build a Response object from stored response data.
+        
+        Used for responses served without network (cache, cassette replay).
+        
+        Args:
+            status_code: Response status code.
+            headers: Response headers.
+            content: Raw response body.
+            encoding: Response body encoding.
+            response_url: Final response URL.
+            method: HTTP method of the request being answered.
+            url: Request URL.
+            params: Query parameters of the request.
+        
+        Returns:
+            Fresh Response object.
+        """
+        response = JSONResponse()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        response._content_consumed = True
+        response.encoding = encoding
+        response.url = response_url
+        response.reason = requests.status_codes._codes.get(status_code, ('',))[0].upper().replace('_', ' ')
+        response.request = requests.Request(method, url, params=params).prepare()
+        return response
+    
+    def _send(
+        self,
+        request_info: ExchangeRecord,
+        headers: Dict[str, str],
+        breaker: Optional[CircuitBreaker] = None,
+        hedge_delay: Optional[float] = None,
+        **kwargs
+    ) -> Response:
+        """Send request, retrying failed attempts per retry policy.
+        
+        Args:
+            request_info: History entry of the request; throttle time,
+                connect time and retry count are accumulated on it.
+            headers: Merged request headers.
+            breaker: Circuit breaker of the operation; every attempt is
+                recorded on it and retries stop once it opens.
+            hedge_delay: Seconds after which an attempt still waiting for
+                its response is duplicated; None disables hedging.
+            **kwargs: Additional arguments passed to requests.
+        
+        Returns:
+            Response of the last attempt.
+        
+        Raises:
+            requests.RequestException: If the last attempt failed to connect.
+            DeadlineExceeded: If the deadline passed before an attempt.
+        """
+        policy = self.retry_policy
+        if policy:
+            policy.budget.record_request()
+        method = request_info.method
+        replaying = self.cassette is not None and self.cassette.replaying
+        attempt = 0
+        while True:
+            # Wait only if the budget of this API key is exhausted
+            if not replaying:
+                request_info.throttled += self.rate_governor.acquire(headers.get('X-API-Key'))
+            if deadline_remaining() == 0:
+                raise DeadlineExceeded(f"Deadline exceeded before sending {method} {request_info.url}")
+            attempt_kwargs = dict(kwargs, timeout=clip_timeout(kwargs.get('timeout')))
+            try:
+                if hedge_delay is None:
+                    response = self._timed_transmit(request_info, headers, attempt_kwargs)
+                else:
+                    response = self._hedged_transmit(request_info, headers, attempt_kwargs, hedge_delay)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if breaker is not None:
+                    breaker.record_failure(type(e).__name__)
+                if not (policy and policy.should_retry(method, attempt, error=True)):
+                    raise
+                delay = policy.backoff(attempt)
+                if not _keep_retrying(delay, breaker):
+                    raise
+                reason = type(e).__name__
+            else:
+                request_info.ttfb = response.elapsed.total_seconds()
+                if breaker is not None:
+                    if response.status_code in self.circuit_breakers.failure_statuses:
+                        breaker.record_failure(f"HTTP {response.status_code}")
+                    else:
+                        breaker.record_success()
+                if not (policy and policy.should_retry(method, attempt, response.status_code)):
+                    return response
+                delay = policy.backoff(attempt, response.headers)
+                if not _keep_retrying(delay, breaker):
+                    return response
+                reason = response.status_code
+                response.close()
+            attempt += 1
+            request_info.retries = attempt
+            logger.warning("Retry %d of %s %s after %s in %.2fs", attempt, method, request_info.url, reason, delay)
+            if not replaying:
+                policy.sleep(delay)
+    
+    def _timed_transmit(self, request_info: ExchangeRecord, headers: Dict[str, str], kwargs: Dict[str, Any]) -> Response:
+        """Send one attempt, adding its connection setup time to the record.
+        
+        Args:
+            request_info: History entry of the request.
+            headers: Merged request headers.
+            kwargs: Arguments for requests.
+        
+        Returns:
+            Response object.
+        """
+        reset_connect_timer()
+        try:
+            return self._transmit(request_info.method, request_info.url, headers, **kwargs)
+        finally:
+            request_info.connect_time += connect_time()
+    
+    def _hedged_transmit(
+        self,
+        request_info: ExchangeRecord,
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+        delay: float,
+    ) -> Response:
+        """Send one attempt, duplicated if it has not answered within delay.
+        
+        The first successful response wins; the other one is closed when it
+        arrives. If both fail, the error of the original request is raised.
+        
+        Args:
+            request_info: History entry of the request.
+            headers: Merged request headers.
+            kwargs: Arguments for requests.
+            delay: Seconds to wait before sending the duplicate.
+        
+        Returns:
+            Response that arrived first.
+        """
+        if self._hedge_executor is None:
+            # Room for every pooled connection plus its duplicate
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=2 * self.pool_maxsize, thread_name_prefix="http-hedge",
+            )
+        executor = self._hedge_executor
+        
+        def send() -> Response:
+            return self._timed_transmit(request_info, headers, kwargs)
+        
+        def send_duplicate() -> Response:
+            request_info.throttled += self.rate_governor.acquire(headers.get('X-API-Key'))
+            return send()
+        
+        primary = executor.submit(contextvars.copy_context().run, send)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self.hedge_policy.try_hedge():
+            return primary.result()
+        
+        request_info.hedged = True
+        logger.info("Hedging %s %s after %.3fs", request_info.method, request_info.url, delay)
+        duplicate = executor.submit(contextvars.copy_context().run, send_duplicate)
+        pending = {primary, duplicate}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.add_done_callback(_close_response)
+                    if future is duplicate:
+                        self.hedge_policy.record_win()
+                    return future.result()
+        return primary.result()
+    
+    @staticmethod
+    def _encode_json_body(headers: Dict[str, str], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize a json= body with the configured JSON codec.
+        
+        Args:
+            headers: Merged request headers.
+            kwargs: Arguments for requests.
+        
+        Returns:
+            Arguments for requests including headers, with the body encoded
+            as data and Content-Type set.
+        """
+        if kwargs.get('json') is None:
+            return dict(kwargs, headers=headers)
+        kwargs = dict(kwargs)
+        body = get_codec().dumps(kwargs.pop('json'))
+        if not any(name.lower() == 'content-type' for name in headers):
+            headers = dict(headers, **{'Content-Type': 'application/json'})
+        return dict(kwargs, data=body, headers=headers)
+    
+    def _transmit(self, method: str, url: str, headers: Dict[str, str], **kwargs) -> Response:
+        """Send one attempt over the network or replay it from the cassette.
+        
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            headers: Merged request headers.
+            **kwargs: Additional arguments passed to requests.
+        
+        Returns:
+            Response object.
+        
+        Raises:
+            CassetteMiss: In replay mode, if the request was not recorded.
+        """
+        cassette = self.cassette
+        if cassette is None:
+            return self.session.request(method=method, url=url, **self._encode_json_body(headers, kwargs))
+        
+        body = kwargs.get('json')
+        if body is None and isinstance(kwargs.get('data'), (Mapping, str)):
+            body = kwargs['data']
+        key = match_key(method, url, kwargs.get('params'), body)
+        
+        if cassette.replaying:
+            recorded = cassette.play(key)
+            return self._build_response(
+                recorded.status_code, recorded.headers, recorded.content, recorded.encoding,
+                recorded.url, method, url, kwargs.get('params'),
+            )
+        
+        response = self.session.request(method=method, url=url, **self._encode_json_body(headers, kwargs))
+        cassette.record(
+            key, response.status_code, response.headers,
+            response.content, response.encoding, response.url,
+        )
         return response
     
-    def get_last_request(self) -> Optional[Dict[str, Any]]:
+    def batch(
+        self,
+        requests_: Sequence[Mapping[str, Any]],
+        max_workers: Optional[int] = None,
+    ) -> List[BatchResult]:
+        """Send independent requests concurrently over the shared session.
+        
+        Each description is a mapping with 'method' and 'path' plus any
+        keyword arguments accepted by request() (headers, params, json, ...).
+        Requests go through the same rate governor, retry policy, cache and
+        history as single calls. Connection errors, and in replay mode requests
+        missing from the cassette, are captured per request instead of
+        aborting the batch.
+        
+        Example:
+            results = client.batch([
+                {"method": "GET", "path": "/colors", "headers": auth_headers},
+                {"method": "DELETE", "path": f"/tasks/{task_id}", "headers": auth_headers},
+            ])
+        
+        Args:
+            requests_: Request descriptions.
+            max_workers: Maximum concurrent requests. Defaults to
+                Config.BATCH_MAX_WORKERS.
+        
+        Returns:
+            Results in the order of the descriptions.
+        """
+        if not requests_:
+            return []
+        
+        def run(description: Mapping[str, Any]) -> BatchResult:
+            kwargs = dict(description)
+            method = kwargs.pop('method')
+            path = kwargs.pop('path')
+            started = time.perf_counter()
+            try:
+                response = self.request(method, path, **kwargs)
+                error = None
+            except (requests.RequestException, CassetteMiss) as e:
+                response, error = None, e
+            return BatchResult(method, path, response, error, time.perf_counter() - started)
+        
+        workers = min(max_workers or Config.BATCH_MAX_WORKERS, len(requests_))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http-batch") as pool:
+            # Each worker runs in a copy of the caller's context (deadline included)
+            futures = [pool.submit(contextvars.copy_context().run, run, d) for d in requests_]
+            results = [future.result() for future in futures]
+        
+        # Concurrent calls finish in any order; point last_response at the last description
+        for result in reversed(results):
+            if result.response is not None:
+                self.last_response = result.response
+                break
+        return results
+    
+    def iter_items(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 64 * 1024,
+        **kwargs
+    ) -> Iterator[Any]:
+        """GET a list endpoint and yield its items one at a time.
+        
+        The response is streamed and decoded incrementally, so lists of
+        any length are processed in constant memory. Body sizes are added to
+        the history entry once the list has been read; the connection is
+        released when iteration ends or the iterator is closed.
+        
+        Example:
+            for time_log in client.iter_items("/timeLogs/getByProjectId",
+                                              params={"projectId": project_id},
+                                              headers=auth_headers):
+                assert time_log["projectId"] == project_id
+        
+        Args:
+            path: API endpoint path.
+            headers: Request headers.
+            chunk_size: Bytes read from the connection at a time.
+            **kwargs: Additional arguments passed to requests.
+        
+        Yields:
+            List items in order.
+        
+        Raises:
+            requests.HTTPError: If the response status is not successful.
+            requests.exceptions.JSONDecodeError: If the body is not a JSON
+                array.
+        """
+        response, request_info = self._exchange('GET', path, headers, stream=True, **kwargs)
+        streamed = not _body_read(response)
+        try:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size)
+            if streamed:
+                chunks = _count_bytes(chunks, request_info)
+            try:
+                yield from iter_json_array(chunks, response.encoding or 'utf-8')
+            except json.JSONDecodeError as e:
+                raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+            if streamed:
+                request_info.bytes_transferred = transferred_bytes(response)
+        finally:
+            response.close()
+    
+    def get_last_request(self) -> Optional[ExchangeRecord]:
         """Get details of the last request made.
         
         Returns:
-            Dictionary with request/response details or None.
+            Exchange record with request/response details or None.
         """
-        return self.request_history[-1] if self.request_history else None
+        return self.request_history.last()
     
     def clear_history(self) -> None:
         """Clear request history."""
-        self.request_history = []
+        self.request_history.clear()
+    
+    def close(self) -> None:
+        """Close pooled connections, the history spill file and the hedging
+        worker threads.
+        
+        Hedged requests still in flight finish in the background.
+        """
+        executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.session.close()
+        self.request_history.close()
+    
+    def __enter__(self) -> "HTTPClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def get(self, path: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Response:
         """Make GET request.
@@ -0,0 +1,272 @@
+"""Pluggable JSON codec for HTTP clients and assertions.
+
+The stdlib ``json`` module is always available; ``orjson`` is used when
+installed (JSON_CODEC=auto) and parses large list responses several times
+faster. Parsed response bodies are memoized on the response, so a body is
+decoded once per exchange no matter how many assertions read it.
+
+Large list bodies can instead be decoded item by item from a streamed
+response (``stream=True``), without holding the body or its text in memory.
+"""
+import codecs
+import json
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+import requests
+from requests import Response
+
+from .config import Config
+
+
+def _import_orjson() -> Any:
+    """Import orjson on first use, so importing src stays cheap.
+
+    Returns:
+        orjson module, or None if it is not installed.
+    """
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return orjson
+
+
+class StdlibCodec:
+    """JSON codec backed by the standard library."""
+
+    name = 'stdlib'
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        # Same output as requests' own json= encoding
+        return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+
+class OrjsonCodec:
+    """JSON codec backed by orjson."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        self._orjson = _import_orjson()
+        if self._orjson is None:
+            raise ImportError("orjson is not installed")
+        self._options = self._orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._options)
+
+
+CODECS: Dict[str, Callable[[], Any]] = {
+    'stdlib': StdlibCodec,
+    'orjson': OrjsonCodec,
+}
+
+_default_codec = None
+_default_lock = threading.Lock()
+
+
+def get_codec(name: Optional[str] = None) -> Any:
+    """Get a JSON codec.
+
+    Args:
+        name: Codec name from CODECS, or 'auto' for the fastest installed
+            one. Defaults to the process-wide codec selected by
+            Config.JSON_CODEC.
+
+    Returns:
+        Codec with ``loads(bytes | str)`` and ``dumps(obj) -> bytes``.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the requested codec is not installed.
+    """
+    global _default_codec
+    if name is None:
+        with _default_lock:
+            if _default_codec is None:
+                _default_codec = get_codec(Config.JSON_CODEC)
+            return _default_codec
+    if name == 'auto':
+        name = 'orjson' if _import_orjson() is not None else 'stdlib'
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {name!r} (available: {', '.join(CODECS)})")
+    return CODECS[name]()
+
+
+def set_codec(codec: Any) -> None:
+    """Replace the process-wide codec.
+
+    Args:
+        codec: Codec instance, or a name accepted by get_codec.
+    """
+    global _default_codec
+    if isinstance(codec, str):
+        codec = get_codec(codec)
+    with _default_lock:
+        _default_codec = codec
+
+
+_UNPARSED = object()
+
+
+def response_json(response: Response) -> Any:
+    """Parse a response body once and memoize the result on the response.
+
+    Later calls return the same object, so callers must not mutate it if
+    other code reads the body afterwards.
+
+    Args:
+        response: HTTP response object.
+
+    Returns:
+        Parsed JSON body.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON
+            (also a json.JSONDecodeError).
+    """
+    parsed = getattr(response, '_parsed_json', _UNPARSED)
+    if parsed is _UNPARSED:
+        encoding = (response.encoding or 'utf-8').lower().replace('_', '-')
+        body = response.content if encoding in ('utf-8', 'utf8', 'ascii') else response.text
+        try:
+            parsed = get_codec().loads(body)
+        except ValueError as e:
+            raise requests.exceptions.JSONDecodeError(str(e), response.text, 0)
+        response._parsed_json = parsed
+    return parsed
+
+
+_WHITESPACE = ' \t\n\r'
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]], encoding: str = 'utf-8') -> Iterator[Any]:
+    """Decode a JSON array incrementally, yielding one item at a time.
+
+    Only the item being decoded and the current chunk are held in memory.
+    Items are decoded with the stdlib scanner, which can resume at any
+    offset of a partially received body.
+
+    Args:
+        chunks: Body chunks as received (bytes are decoded incrementally).
+        encoding: Encoding of byte chunks.
+
+    Yields:
+        Array items in order.
+
+    Raises:
+        json.JSONDecodeError: If the body is not a well-formed JSON array.
+    """
+    scan = json.JSONDecoder().raw_decode
+    decode = codecs.getincrementaldecoder(encoding)().decode
+    source = iter(chunks)
+    buf, pos, exhausted = '', 0, False
+
+    def fill() -> bool:
+        # Append the next chunk, dropping the consumed text; False once the body ended
+        nonlocal buf, pos, exhausted
+        if exhausted:
+            return False
+        for chunk in source:
+            text = decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                buf, pos = buf[pos:] + text, 0
+                return True
+        buf, pos = buf[pos:] + decode(b'', True), 0
+        exhausted = True
+        return True
+
+    def skip_whitespace() -> bool:
+        # Advance to the next significant character; False at end of body
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return True
+            if not fill():
+                return False
+
+    if not skip_whitespace() or buf[pos] != '[':
+        raise json.JSONDecodeError("Expecting JSON array", buf, pos)
+    pos += 1
+    if not skip_whitespace():
+        raise json.JSONDecodeError("Unterminated array", buf, pos)
+    if buf[pos] == ']':
+        pos += 1
+    else:
+        while True:
+            while True:
+                try:
+                    item, end = scan(buf, pos)
+                except json.JSONDecodeError:
+                    if fill():
+                        continue
+                    raise
+                # A number at the end of the buffer may continue in the next chunk
+                if end == len(buf) and fill():
+                    continue
+                break
+            pos = end
+            yield item
+            if not skip_whitespace():
+                raise json.JSONDecodeError("Unterminated array", buf, pos)
+            if buf[pos] == ']':
+                pos += 1
+                break
+            if buf[pos] != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+            pos += 1
+            if not skip_whitespace():
+                raise json.JSONDecodeError("Unterminated array", buf, pos)
+    if skip_whitespace():
+        raise json.JSONDecodeError("Extra data", buf, pos)
+
+
+def iter_json_items(response: Response, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """Yield the items of a JSON array response one at a time.
+
+    Streamed responses (``stream=True``) are decompressed and decoded chunk
+    by chunk; already read or parsed bodies are iterated directly.
+
+    Args:
+        response: HTTP response with a JSON array body.
+        chunk_size: Bytes read from the connection at a time.
+
+    Yields:
+        Array items in order.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not a JSON array.
+    """
+    parsed = getattr(response, '_parsed_json', _UNPARSED)
+    if parsed is not _UNPARSED:
+        if not isinstance(parsed, list):
+            raise requests.exceptions.JSONDecodeError("Expecting JSON array", '', 0)
+        yield from parsed
+        return
+    try:
+        yield from iter_json_array(response.iter_content(chunk_size), response.encoding or 'utf-8')
+    except json.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+class JSONResponse(Response):
+    """Response whose ``json()`` uses the configured codec and is memoized."""
+
+    def json(self, **kwargs) -> Any:
+        if kwargs:
+            # Custom decoder options: leave it to requests
+            return super().json(**kwargs)
+        return response_json(self)
+
+    def iter_items(self, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+        """Yield the items of a JSON array body one at a time (see iter_json_items)."""
+        return iter_json_items(self, chunk_size)
@@ -0,0 +1,126 @@
+"""Pool of API keys sharing the requests of a run.
+
+With several keys configured (API_KEYS), every client request carrying one
+of them (``Config.get_auth_headers()`` returns the first) is sent with a key
+taken from the pool, round-robin or to the key with the fewest requests in
+flight. Each key keeps its own rate budget in the RateGovernor, so
+throughput grows with the number of keys. Requests with a key outside the
+pool (or none, as in auth-negative tests) are left untouched.
+"""
+import itertools
+import threading
+from typing import Dict, Optional, Sequence
+
+from .config import Config
+from .rate_limiter import RateGovernor
+from .response_cache import auth_identity
+
+ROUND_ROBIN = 'round_robin'
+LEAST_LOADED = 'least_loaded'
+STRATEGIES = (ROUND_ROBIN, LEAST_LOADED)
+
+
+class APIKeyPool:
+    """Distributes requests over several API keys."""
+
+    def __init__(self, keys: Sequence[str], strategy: str = ROUND_ROBIN):
+        """Initialize key pool.
+
+        Args:
+            keys: API keys; duplicates and empty values are ignored.
+            strategy: ROUND_ROBIN, or LEAST_LOADED to pick the key with the
+                fewest requests in flight (then the fewest sent).
+
+        Raises:
+            ValueError: If no key is given or the strategy is unknown.
+        """
+        self.keys = list(dict.fromkeys(key for key in keys if key))
+        if not self.keys:
+            raise ValueError("APIKeyPool needs at least one API key")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown key pool strategy: {strategy!r} (available: {', '.join(STRATEGIES)})")
+        self.strategy = strategy
+        self._cycle = itertools.cycle(self.keys)
+        self._lock = threading.Lock()
+        self._requests = dict.fromkeys(self.keys, 0)
+        self._in_flight = dict.fromkeys(self.keys, 0)
+
+    def acquire(self) -> str:
+        """Take a key for one request.
+
+        Returns:
+            API key; release it with release() once the response arrived.
+        """
+        with self._lock:
+            if self.strategy == LEAST_LOADED:
+                key = min(self.keys, key=lambda k: (self._in_flight[k], self._requests[k]))
+            else:
+                key = next(self._cycle)
+            self._requests[key] += 1
+            self._in_flight[key] += 1
+            return key
+
+    def release(self, key: str) -> None:
+        """Return a key taken with acquire().
+
+        Args:
+            key: API key.
+        """
+        with self._lock:
+            self._in_flight[key] -= 1
+
+    def stats(self, governor: Optional[RateGovernor] = None) -> Dict[str, Dict[str, float]]:
+        """Get usage per key.
+
+        Args:
+            governor: Rate governor whose per-key throttling is included.
+
+        Returns:
+            Request and in-flight counts (plus throttled requests and
+            seconds with a governor) keyed by a hash of each API key.
+        """
+        with self._lock:
+            usage = {
+                key: {'requests': self._requests[key], 'in_flight': self._in_flight[key]}
+                for key in self.keys
+            }
+        if governor is not None:
+            for key, key_usage in usage.items():
+                throttling = governor.key_stats(key)
+                key_usage['throttled_requests'] = throttling['throttled_requests']
+                key_usage['throttled_seconds'] = throttling['throttled_seconds']
+        return {auth_identity(key): key_usage for key, key_usage in usage.items()}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._requests
+
+    @classmethod
+    def from_config(cls) -> Optional["APIKeyPool"]:
+        """Build pool from Config.
+
+        Returns:
+            APIKeyPool of API_KEYS, or None if no key is configured.
+        """
+        if not Config.API_KEYS:
+            return None
+        return cls(Config.API_KEYS, strategy=Config.API_KEY_STRATEGY)
+
+
+_default_pool: Optional[APIKeyPool] = None
+_default_lock = threading.Lock()
+
+
+def get_default_key_pool() -> Optional[APIKeyPool]:
+    """Get process-wide key pool shared by all clients.
+
+    Returns:
+        Shared APIKeyPool, or None if no API key is configured.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = APIKeyPool.from_config()
+        return _default_pool
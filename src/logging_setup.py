@@ -0,0 +1,121 @@
+"""Logging setup for the API test harness.
+
+Importing ``src`` modules never touches logging configuration. Test runs
+and scripts call :func:`configure_logging` once; records from ``src``
+loggers are then put on a queue and formatted and written by a background
+listener thread, so request threads only pay for an enqueue. Records do not
+propagate; handlers installed on the root logger (pytest's log capture, an
+application's own configuration) are reached through RootHandler on the
+listener thread, and :func:`flush_logging` delivers pending records before
+such handlers are swapped.
+"""
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional, Union
+
+from .config import Config
+
+PACKAGE_LOGGER = 'src'
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread.
+
+    The stock QueueHandler formats every record on the calling thread before
+    enqueueing it; here the record is enqueued as is. Log call arguments
+    must therefore not be mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class RootHandler(logging.Handler):
+    """Passes records to the handlers currently installed on the root logger.
+
+    Looked up per record, so handlers that come and go (e.g. pytest's
+    per-test capture) receive the records emitted while they are installed,
+    provided pending records are flushed before they are removed.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().callHandlers(record)
+
+
+class _FlushMarker(logging.LogRecord):
+    """Queue entry signalling that every record before it was handled."""
+
+    def __init__(self):
+        super().__init__('', logging.CRITICAL, '', 0, '', None, None)
+        self.handled = threading.Event()
+
+
+class _Listener(QueueListener):
+    def handle(self, record: logging.LogRecord) -> None:
+        if isinstance(record, _FlushMarker):
+            record.handled.set()
+        else:
+            super().handle(record)
+
+
+_listener: Optional[_Listener] = None
+
+
+def configure_logging(
+    level: Optional[Union[int, str]] = None,
+    handlers: Optional[Iterable[logging.Handler]] = None,
+) -> QueueListener:
+    """Route ``src`` log records through a queue to background handlers.
+
+    Calling it again replaces the previous queue handler, so the latest
+    configuration wins.
+
+    Args:
+        level: Log level for ``src`` loggers. Defaults to Config.LOG_LEVEL.
+        handlers: Handlers run on the listener thread. Defaults to a
+            RootHandler if the root logger has handlers already, otherwise a
+            stderr stream handler with the standard basicConfig format.
+
+    Returns:
+        Started QueueListener; call ``stop()`` to flush and shut it down.
+    """
+    global _listener
+    if handlers is None and logging.getLogger().handlers:
+        handlers = [RootHandler()]
+    if handlers is None:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+        handlers = [stream_handler]
+
+    package_logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in list(package_logger.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            package_logger.removeHandler(handler)
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    package_logger.addHandler(DeferredQueueHandler(records))
+    package_logger.setLevel(level or Config.LOG_LEVEL)
+    # Handlers run on the listener thread only, never again on the request thread
+    package_logger.propagate = False
+
+    listener = _Listener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    _listener = listener
+    return listener
+
+
+def flush_logging(timeout: float = 5.0) -> None:
+    """Wait until the listener has handled every record queued so far.
+
+    Args:
+        timeout: Maximum seconds to wait.
+    """
+    listener = _listener
+    if listener is None or listener._thread is None:
+        return
+    marker = _FlushMarker()
+    listener.queue.put_nowait(marker)
+    marker.handled.wait(timeout)
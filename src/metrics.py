@@ -0,0 +1,280 @@
+"""Latency histograms per API operation.
+
+HDR-style histograms: values are recorded in microseconds into log-linear
+buckets with a bounded relative error (under 1% with the default precision),
+so percentiles stay accurate from sub-millisecond to minute-long requests
+while memory grows only with the number of distinct buckets hit.
+Histograms can be merged, e.g. across pytest-xdist workers.
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Timings recorded per exchange, see ExchangeRecord
+TIMING_FIELDS = ('wait', 'connect', 'ttfb', 'total')
+
+REPORTED_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """Log-linear histogram of durations."""
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        """Initialize histogram.
+
+        Args:
+            sub_bucket_bits: Linear sub-buckets per power of two as a bit
+                count; relative error is at most 2 ** -sub_bucket_bits.
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    def _bucket(self, value_us: int) -> int:
+        """Lowest value of the bucket holding value_us."""
+        shift = max(0, value_us.bit_length() - self.sub_bucket_bits - 1)
+        return (value_us >> shift) << shift
+
+    def _bucket_top(self, bucket: int) -> int:
+        """Highest value of the bucket starting at bucket."""
+        shift = max(0, bucket.bit_length() - self.sub_bucket_bits - 1)
+        return bucket + (1 << shift) - 1
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """Record a duration.
+
+        Args:
+            seconds: Duration in seconds; negative values count as 0.
+            count: Number of occurrences.
+        """
+        value_us = max(0, int(round(seconds * 1e6)))
+        bucket = self._bucket(value_us)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += count
+        self.total_us += value_us * count
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add all values of another histogram with the same precision.
+
+        Args:
+            other: Histogram to merge into this one.
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms of different precision")
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        for value in (other.min_us, other.max_us):
+            if value is not None:
+                self.min_us = value if self.min_us is None else min(self.min_us, value)
+                self.max_us = value if self.max_us is None else max(self.max_us, value)
+
+    def percentile(self, percent: float) -> float:
+        """Get a percentile.
+
+        Args:
+            percent: Percentile in [0, 100].
+
+        Returns:
+            Duration in seconds at or below which ``percent`` of the values
+            fall (upper bound of its bucket, capped at the maximum); 0 when
+            empty.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(-(-percent * self.count // 100)))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._bucket_top(bucket), self.max_us) / 1e6
+        return self.max_us / 1e6
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds (0 when empty)."""
+        return self.total_us / self.count / 1e6 if self.count else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Get count, min, mean, max and percentiles in milliseconds.
+
+        Returns:
+            Summary dictionary.
+        """
+        result = {
+            'count': self.count,
+            'min_ms': (self.min_us or 0) / 1e3,
+            'mean_ms': round(self.mean * 1e3, 3),
+            'max_ms': (self.max_us or 0) / 1e3,
+        }
+        for percent in REPORTED_PERCENTILES:
+            result[f'p{percent:g}_ms'] = self.percentile(percent) * 1e3
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize histogram including raw bucket counts for merging.
+
+        Returns:
+            JSON-serializable dictionary.
+        """
+        return {
+            'sub_bucket_bits': self.sub_bucket_bits,
+            'count': self.count,
+            'total_us': self.total_us,
+            'min_us': self.min_us,
+            'max_us': self.max_us,
+            'counts': {str(bucket): count for bucket, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(data['sub_bucket_bits'])
+        histogram.counts = {int(bucket): count for bucket, count in data['counts'].items()}
+        histogram.count = data['count']
+        histogram.total_us = data['total_us']
+        histogram.min_us = data['min_us']
+        histogram.max_us = data['max_us']
+        return histogram
+
+
+class LatencyStats:
+    """Latency histograms keyed by operation and timing field."""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, timings: Dict[str, float]) -> None:
+        """Record the timings of one exchange.
+
+        Args:
+            operation: Operation ID or "METHOD /path" for unknown paths.
+            timings: Seconds per timing field (see TIMING_FIELDS).
+        """
+        with self._lock:
+            for field, seconds in timings.items():
+                histogram = self._histograms.get((operation, field))
+                if histogram is None:
+                    histogram = self._histograms[(operation, field)] = LatencyHistogram()
+                histogram.record(seconds)
+
+    def histogram(self, operation: str, field: str = 'total') -> Optional[LatencyHistogram]:
+        """Get histogram of one operation.
+
+        Args:
+            operation: Operation ID.
+            field: Timing field.
+
+        Returns:
+            Histogram or None if nothing was recorded.
+        """
+        return self._histograms.get((operation, field))
+
+    def operations(self) -> List[str]:
+        """Get names of operations with recorded timings."""
+        return sorted({operation for operation, _ in self._histograms})
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get summaries of all histograms.
+
+        Returns:
+            ``{operation: {field: summary}}`` in milliseconds.
+        """
+        with self._lock:
+            result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+            for (operation, field), histogram in sorted(self._histograms.items()):
+                result.setdefault(operation, {})[field] = histogram.summary()
+            return result
+
+    def slowest(self, limit: int = 5, percent: float = 99.0) -> List[Tuple[str, LatencyHistogram]]:
+        """Get operations with the highest total latency percentile.
+
+        Args:
+            limit: Number of operations returned.
+            percent: Percentile used for ranking.
+
+        Returns:
+            List of (operation, total histogram), slowest first.
+        """
+        with self._lock:
+            totals = [(op, h) for (op, field), h in self._histograms.items() if field == 'total']
+        totals.sort(key=lambda item: item[1].percentile(percent), reverse=True)
+        return totals[:limit]
+
+    def merge(self, other: "LatencyStats") -> None:
+        """Add all histograms of another LatencyStats.
+
+        Args:
+            other: Stats to merge into this one.
+        """
+        with self._lock:
+            for key, histogram in other._histograms.items():
+                if key in self._histograms:
+                    self._histograms[key].merge(histogram)
+                else:
+                    merged = self._histograms[key] = LatencyHistogram(histogram.sub_bucket_bits)
+                    merged.merge(histogram)
+
+    def clear(self) -> None:
+        """Drop all recorded timings."""
+        with self._lock:
+            self._histograms.clear()
+
+    def __len__(self) -> int:
+        return len(self._histograms)
+
+    def dump(self, path: str) -> None:
+        """Write summaries and raw histograms to a JSON file.
+
+        Args:
+            path: Output file path; parent directories are created.
+        """
+        with self._lock:
+            histograms: Dict[str, Dict[str, Any]] = {}
+            for (operation, field), histogram in sorted(self._histograms.items()):
+                histograms.setdefault(operation, {})[field] = histogram.to_dict()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'summary': self.summary(), 'histograms': histograms}, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "LatencyStats":
+        """Read stats written by :meth:`dump`.
+
+        Args:
+            path: JSON file path.
+
+        Returns:
+            LatencyStats instance.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        stats = cls()
+        for operation, fields in data['histograms'].items():
+            for field, histogram in fields.items():
+                stats._histograms[(operation, field)] = LatencyHistogram.from_dict(histogram)
+        return stats
+
+
+_default_stats: Optional[LatencyStats] = None
+_default_lock = threading.Lock()
+
+
+def get_default_latency_stats() -> LatencyStats:
+    """Get process-wide latency stats shared by all clients.
+
+    Returns:
+        Shared LatencyStats instance.
+    """
+    global _default_stats
+    with _default_lock:
+        if _default_stats is None:
+            _default_stats = LatencyStats()
+        return _default_stats
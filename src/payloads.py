@@ -0,0 +1,246 @@
+"""Request payloads generated from api_spec.json body schemas.
+
+PayloadGenerator produces valid bodies (required fields always, optional
+fields at random, enums, bounds and item types honored) and deliberately
+invalid ones, each breaking exactly one rule of the schema. The schema of
+each operation is compiled once into value generators, and all randomness
+comes from one seeded random.Random, so a seed always yields the same
+payloads.
+"""
+import datetime
+import random
+import string
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .spec_loader import SpecLoader, get_default_spec_loader
+
+_ALPHABET = string.ascii_letters + string.digits
+
+# Days after 2020-01-01 that generated dates fall into
+_DATE_RANGE = 3650
+_EPOCH = datetime.date(2020, 1, 1)
+
+# Produces one value from the generator's random.Random
+Generate = Callable[[random.Random], Any]
+
+# Breaks one rule of the schema in a valid body, in place
+Mutation = Tuple[str, Callable[[Dict[str, Any]], None]]
+
+# Values of another JSON type than the one a schema expects
+_WRONG_TYPE = {
+    'integer': "not-a-number",
+    'number': "not-a-number",
+    'string': 12345,
+    'boolean': "yes",
+    'array': {"not": "a list"},
+    'object': ["not", "an", "object"],
+}
+
+
+def _any_value(rng: random.Random) -> Any:
+    return rng.choice((rng.randint(0, 1000), ''.join(rng.choices(_ALPHABET, k=8)), rng.random() < 0.5))
+
+
+def _compile(schema: Dict[str, Any], optional_rate: float) -> Generate:
+    """Compile a JSON Schema into a function generating valid values.
+
+    Args:
+        schema: JSON Schema (see schema.body_schema).
+        optional_rate: Probability of including each optional property.
+
+    Returns:
+        Generator function.
+    """
+    if 'enum' in schema:
+        choices = schema['enum']
+        return lambda rng: rng.choice(choices)
+
+    kind = schema.get('type')
+    if kind == 'integer':
+        low, high = schema.get('minimum'), schema.get('maximum')
+        low = int(low) if low is not None else (int(high) - 1000 if high is not None else 1)
+        high = int(high) if high is not None else low + 1_000_000
+        return lambda rng: rng.randint(low, high)
+
+    if kind == 'number':
+        low, high = schema.get('minimum'), schema.get('maximum')
+        low = low if low is not None else (high - 1000 if high is not None else 0)
+        high = high if high is not None else low + 1000
+        return lambda rng: rng.uniform(low, high)
+
+    if kind == 'boolean':
+        return lambda rng: rng.random() < 0.5
+
+    if kind == 'string':
+        if schema.get('format') == 'date':
+            return lambda rng: (_EPOCH + datetime.timedelta(days=rng.randrange(_DATE_RANGE))).isoformat()
+        if schema.get('format') == 'date-time':
+            return lambda rng: datetime.datetime.combine(
+                _EPOCH + datetime.timedelta(days=rng.randrange(_DATE_RANGE)),
+                datetime.time(rng.randrange(24), rng.randrange(60)),
+            ).isoformat(sep=' ')
+        min_length = schema.get('minLength', 1)
+        max_length = schema.get('maxLength', max(min_length, 16))
+        return lambda rng: ''.join(rng.choices(_ALPHABET, k=rng.randint(min_length, max_length)))
+
+    if kind == 'array':
+        item = _compile(schema.get('items', {}), optional_rate)
+        min_items, max_items = schema.get('minItems', 0), schema.get('maxItems', 3)
+        return lambda rng: [item(rng) for _ in range(rng.randint(min_items, max_items))]
+
+    if kind == 'object' or 'properties' in schema:
+        required = set(schema.get('required', ()))
+        fields = [
+            (name, name in required, _compile(prop, optional_rate))
+            for name, prop in schema.get('properties', {}).items()
+        ]
+
+        def generate_object(rng: random.Random) -> Dict[str, Any]:
+            return {
+                name: generate(rng)
+                for name, is_required, generate in fields
+                if is_required or rng.random() < optional_rate
+            }
+        return generate_object
+
+    return _any_value
+
+
+def _mutations(schema: Dict[str, Any]) -> List[Mutation]:
+    """List the ways to make a body of this schema invalid, one field each.
+
+    Args:
+        schema: JSON Schema of the body.
+
+    Returns:
+        Description and function applying each mutation in place.
+    """
+    mutations: List[Mutation] = []
+    for name in schema.get('required', ()):
+        mutations.append((f"missing required field '{name}'", lambda body, name=name: body.pop(name, None)))
+
+    for name, prop in schema.get('properties', {}).items():
+        def set_value(value: Any, name: str = name) -> Callable[[Dict[str, Any]], None]:
+            return lambda body: body.__setitem__(name, value)
+
+        kind = prop.get('type')
+        if kind in _WRONG_TYPE:
+            mutations.append((f"'{name}' is not of type {kind}", set_value(_WRONG_TYPE[kind])))
+        if 'enum' in prop:
+            values = prop['enum']
+            if all(isinstance(value, int) for value in values):
+                outside = max(values) + 1
+            else:
+                outside = "not-" + "-".join(str(value) for value in values)
+            mutations.append((f"'{name}' is not one of {values}", set_value(outside)))
+        if 'minimum' in prop:
+            below = prop['minimum'] - (1 if kind == 'integer' else 0.5)
+            mutations.append((f"'{name}' is below the minimum of {prop['minimum']}", set_value(below)))
+        if 'maximum' in prop:
+            above = prop['maximum'] + (1 if kind == 'integer' else 0.5)
+            mutations.append((f"'{name}' is above the maximum of {prop['maximum']}", set_value(above)))
+        if 'maxLength' in prop:
+            too_long = 'x' * (prop['maxLength'] + 1)
+            mutations.append((f"'{name}' is longer than {prop['maxLength']} characters", set_value(too_long)))
+    return mutations
+
+
+class PayloadGenerator:
+    """Seeded generator of request bodies described in api_spec.json."""
+
+    def __init__(self, seed: int = 0, spec_loader: Optional[SpecLoader] = None, optional_rate: float = 0.5):
+        """Initialize payload generator.
+
+        Args:
+            seed: Seed of the random sequence; equal seeds give equal payloads.
+            spec_loader: Spec to read body schemas from; defaults to the shared one.
+            optional_rate: Probability of including each optional field.
+        """
+        self.random = random.Random(seed)
+        self.spec_loader = spec_loader or get_default_spec_loader()
+        self.optional_rate = optional_rate
+        self._generators: Dict[str, Generate] = {}
+        self._mutations: Dict[str, List[Mutation]] = {}
+
+    def _schema(self, operation_id: str) -> Dict[str, Any]:
+        schema = self.spec_loader.get_body_schema(operation_id)
+        if schema is None:
+            raise ValueError(f"Operation {operation_id} has no request body in api_spec.json")
+        return schema
+
+    def body(self, operation_id: str) -> Dict[str, Any]:
+        """Generate a valid request body.
+
+        Args:
+            operation_id: Operation ID in api_spec.json.
+
+        Returns:
+            Body with all required and some optional fields.
+
+        Raises:
+            ValueError: If the operation takes no body.
+        """
+        generate = self._generators.get(operation_id)
+        if generate is None:
+            generate = self._generators[operation_id] = _compile(self._schema(operation_id), self.optional_rate)
+        return generate(self.random)
+
+    def bodies(self, operation_id: str, count: int) -> Iterator[Dict[str, Any]]:
+        """Generate valid request bodies.
+
+        Args:
+            operation_id: Operation ID in api_spec.json.
+            count: Number of bodies.
+
+        Yields:
+            Valid bodies.
+        """
+        for _ in range(count):
+            yield self.body(operation_id)
+
+    def _rules(self, operation_id: str) -> List[Mutation]:
+        mutations = self._mutations.get(operation_id)
+        if mutations is None:
+            mutations = self._mutations[operation_id] = _mutations(self._schema(operation_id))
+        return mutations
+
+    def invalid_bodies(self, operation_id: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Generate one invalid body per rule of the body schema.
+
+        Each body is valid except for one field: a required field left out,
+        a value of the wrong type, outside its enum or beyond its bounds.
+
+        Args:
+            operation_id: Operation ID in api_spec.json.
+
+        Yields:
+            Description of the broken rule and the body.
+
+        Raises:
+            ValueError: If the operation takes no body.
+        """
+        for description, mutate in self._rules(operation_id):
+            body = self.body(operation_id)
+            mutate(body)
+            yield description, body
+
+    def invalid_body(self, operation_id: str) -> Tuple[str, Dict[str, Any]]:
+        """Generate an invalid body breaking one randomly chosen rule.
+
+        Args:
+            operation_id: Operation ID in api_spec.json.
+
+        Returns:
+            Description of the broken rule and the body.
+
+        Raises:
+            ValueError: If the operation takes no body or its schema has no
+                rule to break.
+        """
+        rules = self._rules(operation_id)
+        if not rules:
+            raise ValueError(f"Body of {operation_id} has no rule to break")
+        description, mutate = self.random.choice(rules)
+        body = self.body(operation_id)
+        mutate(body)
+        return description, body
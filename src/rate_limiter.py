@@ -0,0 +1,337 @@
+"""Client-side rate limiting for GanttPRO API requests.
+
+Token buckets keyed by API key: each key may send ``burst`` requests
+back to back, then is refilled at ``rate`` requests per second. Callers
+only wait when the budget of their key is exhausted.
+
+Buckets live either in process memory or in small lock-protected state
+files, so that several processes on one machine (e.g. pytest-xdist
+workers) can jointly respect one budget per key.
+"""
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Optional, Union
+
+from .config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenBucket:
+    """Token bucket with reservation semantics.
+
+    ``reserve()`` never blocks: it takes a token (possibly going into debt)
+    and returns how long the caller has to wait before sending. Waiting is
+    left to the caller so the same bucket serves threads and asyncio tasks.
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize token bucket.
+
+        Args:
+            rate: Refill rate in tokens per second.
+            burst: Bucket capacity (requests allowed back to back).
+            clock: Monotonic time source.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to take.
+
+        Returns:
+            Seconds the caller must wait before the reserved send is allowed.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class SharedTokenBucket:
+    """Token bucket whose state is shared between processes.
+
+    State (tokens, last update) is kept in a 16-byte file and updated under
+    an exclusive file lock, so every process using the same path draws from
+    one budget. Uses the system-wide monotonic clock, which is common to
+    all processes on a machine.
+    """
+
+    _STATE = struct.Struct("dd")
+
+    def __init__(self, path: str, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        """Initialize shared token bucket.
+
+        Args:
+            path: State file path; created if missing.
+            rate: Refill rate in tokens per second.
+            burst: Bucket capacity (requests allowed back to back).
+            clock: Monotonic time source shared by all processes.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.path = path
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        # Closes the state file when the bucket is dropped without close()
+        self._close_file = weakref.finalize(self, os.close, self._fd)
+
+    def _lock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens from the shared bucket.
+
+        Args:
+            tokens: Number of tokens to take.
+
+        Returns:
+            Seconds the caller must wait before the reserved send is allowed.
+        """
+        with self._lock:
+            self._lock_file()
+            try:
+                now = self._clock()
+                raw = self._read()
+                if len(raw) == self._STATE.size:
+                    available, updated = self._STATE.unpack(raw)
+                    available = min(self.burst, available + max(0.0, now - updated) * self.rate)
+                else:
+                    available = float(self.burst)
+                available -= tokens
+                self._write(self._STATE.pack(available, now))
+            finally:
+                self._unlock_file()
+        if available >= 0:
+            return 0.0
+        return -available / self.rate
+
+    def _read(self) -> bytes:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        return os.read(self._fd, self._STATE.size)
+
+    def _write(self, data: bytes) -> None:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, data)
+
+    def close(self) -> None:
+        """Close the state file; further calls do nothing."""
+        self._close_file()
+
+
+def _empty_key_stats() -> Dict[str, float]:
+    return {'requests': 0, 'throttled_requests': 0, 'throttled_seconds': 0.0}
+
+
+class RateGovernor:
+    """Per-API-key request budget shared by HTTP clients."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        sleep: Callable[[float], None] = time.sleep,
+        state_dir: Optional[str] = None,
+    ):
+        """Initialize rate governor.
+
+        Args:
+            rate: Requests per second allowed per API key. Zero or negative
+                disables throttling.
+            burst: Requests per API key allowed back to back.
+            sleep: Blocking sleep function.
+            state_dir: Directory for shared bucket state. When set, every
+                process using the same directory shares one budget per key;
+                otherwise buckets are local to this process.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.state_dir = state_dir
+        self._sleep = sleep
+        self._buckets: Dict[str, Union[TokenBucket, SharedTokenBucket]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+        self._key_stats: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    @property
+    def shared(self) -> bool:
+        """Whether reserve() takes a file lock (budgets shared between processes)."""
+        return self.enabled and bool(self.state_dir)
+
+    def _bucket(self, key: str) -> Union[TokenBucket, SharedTokenBucket]:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if self.state_dir:
+                    os.makedirs(self.state_dir, exist_ok=True)
+                    # Hash the key so API keys never end up in file names
+                    name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+                    path = os.path.join(self.state_dir, f"{name}.bucket")
+                    bucket = SharedTokenBucket(path, self.rate, self.burst)
+                else:
+                    bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    def reserve(self, key: Optional[str]) -> float:
+        """Reserve one request for an API key without waiting.
+
+        Args:
+            key: API key the request is sent with (None for anonymous).
+
+        Returns:
+            Seconds the caller must wait before sending.
+        """
+        if not self.enabled:
+            return 0.0
+        delay = self._bucket(key or "").reserve()
+        with self._lock:
+            self.requests += 1
+            key_stats = self._key_stats.get(key or "")
+            if key_stats is None:
+                key_stats = self._key_stats[key or ""] = _empty_key_stats()
+            key_stats['requests'] += 1
+            if delay > 0:
+                self.throttled_requests += 1
+                self.throttled_seconds += delay
+                key_stats['throttled_requests'] += 1
+                key_stats['throttled_seconds'] += delay
+        return delay
+
+    def acquire(self, key: Optional[str]) -> float:
+        """Block until a request for an API key is within budget.
+
+        Args:
+            key: API key the request is sent with (None for anonymous).
+
+        Returns:
+            Seconds spent throttled.
+        """
+        delay = self.reserve(key)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def close(self) -> None:
+        """Close the state files of shared buckets.
+
+        Buckets are created again on the next reservation.
+        """
+        with self._lock:
+            buckets = list(self._buckets.values())
+            self._buckets.clear()
+        for bucket in buckets:
+            if isinstance(bucket, SharedTokenBucket):
+                bucket.close()
+
+    def stats(self) -> Dict[str, float]:
+        """Get throttling statistics.
+
+        Returns:
+            Dictionary with request count, throttled count and seconds.
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'throttled_requests': self.throttled_requests,
+                'throttled_seconds': round(self.throttled_seconds, 3),
+            }
+
+    def key_stats(self, key: Optional[str]) -> Dict[str, float]:
+        """Get throttling statistics of one API key.
+
+        Args:
+            key: API key (None for anonymous requests).
+
+        Returns:
+            Dictionary with request count, throttled count and seconds.
+        """
+        with self._lock:
+            stats = dict(self._key_stats.get(key or "") or _empty_key_stats())
+        stats['throttled_seconds'] = round(stats['throttled_seconds'], 3)
+        return stats
+
+
+_default_governor: Optional[RateGovernor] = None
+_default_lock = threading.Lock()
+
+
+def default_state_dir() -> Optional[str]:
+    """Get directory for rate budget shared between processes.
+
+    Uses RATE_LIMIT_STATE_DIR when configured. Under pytest-xdist all
+    workers of one run share a directory derived from the run id, so they
+    jointly respect the per-key budget without extra configuration.
+
+    Returns:
+        Directory path or None for a process-local budget.
+    """
+    if Config.RATE_LIMIT_STATE_DIR:
+        return Config.RATE_LIMIT_STATE_DIR
+    run_id = os.getenv("PYTEST_XDIST_TESTRUNUID")
+    if run_id:
+        return os.path.join(tempfile.gettempdir(), f"ganttpro-rate-{run_id}")
+    return None
+
+
+def get_default_governor() -> RateGovernor:
+    """Get process-wide rate governor configured from Config.
+
+    Returns:
+        Shared RateGovernor instance.
+    """
+    global _default_governor
+    with _default_lock:
+        if _default_governor is None:
+            _default_governor = RateGovernor(
+                Config.RATE_LIMIT_RPS,
+                Config.RATE_LIMIT_BURST,
+                state_dir=default_state_dir(),
+            )
+        return _default_governor
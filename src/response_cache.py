@@ -0,0 +1,343 @@
+"""Response cache for read-only reference endpoints.
+
+Caches successful GET responses of operations that declare a TTL in
+api_spec.json (``"cache": {"ttlSeconds": N}``), so static reference data
+such as languages, colors and roles is fetched from the API once per TTL.
+Entries are keyed by method, URL, query and a hash of the API key, kept in
+an in-memory LRU and optionally mirrored to disk for reuse across runs.
+
+Entries whose response carried an ETag or Last-Modified validator outlive
+their TTL: the next GET is sent as a conditional request and a 304 answer
+is served from the stored body. Large list operations declare
+``"cache": {"revalidate": true}`` to be revalidated on every read.
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+from .config import Config
+from .spec_loader import SpecLoader, get_default_spec_loader
+
+
+def auth_identity(api_key: Optional[str]) -> str:
+    """Get a non-reversible identity for an API key.
+
+    Args:
+        api_key: API key or None for anonymous requests.
+
+    Returns:
+        Short hash of the key ('' for anonymous).
+    """
+    if not api_key:
+        return ''
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+
+
+def cache_key(method: str, url: str, params: Any, api_key: Optional[str]) -> str:
+    """Build cache key for a request.
+
+    Args:
+        method: HTTP method.
+        url: Full request URL.
+        params: Query parameters (dict or list of pairs) or None.
+        api_key: API key the request is sent with.
+
+    Returns:
+        Cache key string.
+    """
+    query = ''
+    if params:
+        items = params.items() if isinstance(params, Mapping) else params
+        query = urlencode(sorted((str(k), str(v)) for k, v in items), doseq=True)
+    return f"{method.upper()} {url}?{query} {auth_identity(api_key)}"
+
+
+VALIDATOR_HEADERS = (
+    ('etag', 'If-None-Match'),
+    ('last-modified', 'If-Modified-Since'),
+)
+
+
+class CachedResponse:
+    """Stored response content."""
+
+    __slots__ = ('status_code', 'headers', 'content', 'encoding', 'url', 'expires_at')
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        encoding: Optional[str],
+        url: str,
+        expires_at: float,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.url = url
+        self.expires_at = expires_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers revalidating this response.
+
+        Returns:
+            If-None-Match / If-Modified-Since headers built from the stored
+            ETag / Last-Modified (empty if the response had neither).
+        """
+        stored = {name.lower(): value for name, value in self.headers.items()}
+        return {
+            condition: stored[validator]
+            for validator, condition in VALIDATOR_HEADERS
+            if stored.get(validator)
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'status_code': self.status_code,
+            'headers': self.headers,
+            'content': base64.b64encode(self.content).decode('ascii'),
+            'encoding': self.encoding,
+            'url': self.url,
+            'expires_at': self.expires_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CachedResponse":
+        return cls(
+            status_code=data['status_code'],
+            headers=data['headers'],
+            content=base64.b64decode(data['content']),
+            encoding=data['encoding'],
+            url=data['url'],
+            expires_at=data['expires_at'],
+        )
+
+
+class ResponseCache:
+    """TTL + LRU cache of responses, configured per operationId."""
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float],
+        max_entries: int = 256,
+        disk_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize response cache.
+
+        Args:
+            ttls: Time to live in seconds per operationId; operations not
+                listed are never cached.
+            max_entries: Entries kept in memory; least recently used are
+                evicted first.
+            disk_dir: Optional directory mirroring entries on disk.
+            clock: Wall-clock time source (disk entries outlive processes).
+        """
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def ttl_for(self, operation_id: Optional[str]) -> Optional[float]:
+        """Get TTL for an operation.
+
+        Args:
+            operation_id: Operation ID from api_spec.json.
+
+        Returns:
+            TTL in seconds (0 for operations revalidated on every read) or
+            None if the operation is not cacheable.
+        """
+        if not operation_id:
+            return None
+        return self.ttls.get(operation_id)
+
+    def _disk_path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, f"{name}.json")
+
+    def _lookup(self, key: str, now: float) -> Optional[CachedResponse]:
+        # Caller holds the lock; expired entries are kept only if revalidatable
+        entry = self._entries.get(key)
+        if entry is None and self.disk_dir:
+            entry = self._load(key, now)
+            if entry is not None:
+                self._store(key, entry)
+        if entry is not None and entry.expires_at <= now and not entry.validators:
+            del self._entries[key]
+            entry = None
+        return entry
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a fresh entry.
+
+        Args:
+            key: Cache key from :func:`cache_key`.
+
+        Returns:
+            Cached response or None on miss or expiry.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is None or entry.expires_at <= now:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def get_stale(self, key: str) -> Optional[CachedResponse]:
+        """Look up an expired entry that can be revalidated.
+
+        Args:
+            key: Cache key from :func:`cache_key`.
+
+        Returns:
+            Cached response with validators, or None.
+        """
+        with self._lock:
+            entry = self._lookup(key, self._clock())
+            return entry if entry is not None and entry.validators else None
+
+    def refresh(self, key: str, ttl: float, headers: Mapping[str, str]) -> Optional[CachedResponse]:
+        """Renew an entry after a 304 Not Modified answer.
+
+        Args:
+            key: Cache key from :func:`cache_key`.
+            ttl: Time to live in seconds.
+            headers: Headers of the 304 response; they update the stored ones.
+
+        Returns:
+            Renewed cached response, or None if the entry is gone.
+        """
+        with self._lock:
+            entry = self._lookup(key, self._clock())
+            if entry is None:
+                return None
+            renewed = CachedResponse(
+                entry.status_code,
+                {**entry.headers, **headers},
+                entry.content,
+                entry.encoding,
+                entry.url,
+                self._clock() + ttl,
+            )
+            self._store(key, renewed)
+            self.revalidated += 1
+        self._write(key, renewed)
+        return renewed
+
+    def put(
+        self,
+        key: str,
+        ttl: float,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        encoding: Optional[str],
+        url: str,
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from :func:`cache_key`.
+            ttl: Time to live in seconds.
+            status_code: Response status code.
+            headers: Response headers.
+            content: Raw response body.
+            encoding: Response body encoding.
+            url: Final response URL.
+        """
+        entry = CachedResponse(status_code, dict(headers), content, encoding, url, self._clock() + ttl)
+        if ttl <= 0 and not entry.validators:
+            return
+        with self._lock:
+            self._store(key, entry)
+        self._write(key, entry)
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        if not self.disk_dir:
+            return
+        os.makedirs(self.disk_dir, exist_ok=True)
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry.to_json(), f)
+        os.replace(tmp_path, path)
+
+    def _store(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str, now: float) -> Optional[CachedResponse]:
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = CachedResponse.from_json(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+        if entry.expires_at <= now and not entry.validators:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (disk entries expire by TTL)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def from_spec(cls, spec_loader: SpecLoader, **kwargs) -> "ResponseCache":
+        """Build cache with TTLs and revalidated operations declared in api_spec.json.
+
+        Args:
+            spec_loader: SpecLoader instance.
+            **kwargs: Passed to ResponseCache.
+
+        Returns:
+            ResponseCache instance.
+        """
+        ttls = {}
+        for endpoint in spec_loader.get_endpoints():
+            cache = endpoint.get("cache", {})
+            if cache.get("ttlSeconds") or cache.get("revalidate"):
+                ttls[endpoint["operationId"]] = cache.get("ttlSeconds", 0)
+        return cls(ttls, **kwargs)
+
+    @classmethod
+    def from_config(cls) -> Optional["ResponseCache"]:
+        """Build cache from Config with TTLs from the default api_spec.json.
+
+        Returns:
+            ResponseCache, or None unless CACHE_ENABLED is set.
+        """
+        if not Config.CACHE_ENABLED:
+            return None
+        return cls.from_spec(
+            get_default_spec_loader(),
+            max_entries=Config.CACHE_MAX_ENTRIES,
+            disk_dir=Config.CACHE_DIR,
+        )
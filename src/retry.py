@@ -0,0 +1,197 @@
+"""Retry policy for HTTP clients.
+
+Opt-in retries with jittered exponential backoff. ``Retry-After`` sent by
+the server takes precedence over the computed backoff, and a retry budget
+shared by all clients caps retries to a fraction of the traffic, so
+retrying cannot multiply load on the API during an outage.
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Collection, Mapping, Optional
+
+from .config import Config
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryBudget:
+    """Cap on retries relative to the number of requests sent.
+
+    A retry is allowed while retries stay below ``min_retries`` plus
+    ``ratio`` times the number of requests recorded so far.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10):
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per recorded request.
+            min_retries: Retries allowed regardless of traffic.
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record one original (non-retry) request."""
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget.
+
+        Returns:
+            True if the retry is allowed.
+        """
+        with self._lock:
+            if self.retries < self.min_retries + self.ratio * self.requests:
+                self.retries += 1
+                return True
+            self.denied += 1
+            return False
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date.
+        now: Current time for HTTP-date values (defaults to utcnow).
+
+    Returns:
+        Delay in seconds (never negative) or None if absent or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class RetryPolicy:
+    """When and how long to wait before retrying a request."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        methods: Collection[str] = IDEMPOTENT_METHODS,
+        statuses: Collection[int] = RETRYABLE_STATUSES,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        budget: Optional[RetryBudget] = None,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Retries per request after the first attempt.
+            methods: HTTP methods that may be retried (idempotent by default).
+            statuses: Response status codes that trigger a retry.
+            backoff_base: Backoff ceiling of the first retry in seconds;
+                doubles with every further retry.
+            backoff_max: Upper bound of any single wait, including
+                Retry-After.
+            budget: Retry budget; defaults to the process-wide budget.
+            rng: Random source in [0, 1) used for jitter.
+            sleep: Blocking sleep function.
+        """
+        self.max_retries = max_retries
+        self.methods = frozenset(m.upper() for m in methods)
+        self.statuses = frozenset(statuses)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = budget or get_default_budget()
+        self._rng = rng
+        self.sleep = sleep
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        error: bool = False,
+    ) -> bool:
+        """Decide whether a failed attempt is retried.
+
+        Spends one retry from the budget when the answer is yes.
+
+        Args:
+            method: HTTP method of the request.
+            attempt: Number of retries already made.
+            status_code: Status of the response, if one was received.
+            error: True if the attempt failed with a connection error.
+
+        Returns:
+            True if the request should be sent again.
+        """
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return False
+        if not error and status_code not in self.statuses:
+            return False
+        return self.budget.try_spend()
+
+    def backoff(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """Compute wait before the next retry.
+
+        Args:
+            attempt: Number of retries already made.
+            headers: Headers of the failed response, if any.
+
+        Returns:
+            Seconds to wait: Retry-After if sent, otherwise full-jitter
+            exponential backoff; both capped at backoff_max.
+        """
+        retry_after = parse_retry_after(headers.get('Retry-After')) if headers else None
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return self._rng() * ceiling
+
+    @classmethod
+    def from_config(cls) -> Optional["RetryPolicy"]:
+        """Build policy from Config.
+
+        Returns:
+            RetryPolicy, or None when RETRY_MAX_RETRIES is 0 (retries off).
+        """
+        if Config.RETRY_MAX_RETRIES <= 0:
+            return None
+        return cls(
+            max_retries=Config.RETRY_MAX_RETRIES,
+            methods=Config.RETRY_METHODS,
+            backoff_base=Config.RETRY_BACKOFF_BASE,
+            backoff_max=Config.RETRY_BACKOFF_MAX,
+        )
+
+
+_default_budget: Optional[RetryBudget] = None
+_default_lock = threading.Lock()
+
+
+def get_default_budget() -> RetryBudget:
+    """Get process-wide retry budget configured from Config.
+
+    Returns:
+        Shared RetryBudget instance.
+    """
+    global _default_budget
+    with _default_lock:
+        if _default_budget is None:
+            _default_budget = RetryBudget(Config.RETRY_BUDGET_RATIO, Config.RETRY_BUDGET_MIN)
+        return _default_budget
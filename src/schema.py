@@ -0,0 +1,315 @@
+"""Response schemas derived from api_spec.json.
+
+api_spec.json describes responses informally: ``exampleItemShape`` maps
+fields to type names ("integer", "string[]", "week|month|year", nested
+shapes) for list endpoints, and ``example`` shows a literal body. Both are
+turned into JSON Schema here, or an explicit ``schema`` is used as is.
+Request bodies use a JSON Schema dialect (``min``/``max``, ``itemsType``,
+type ``any``) that is normalized here as well.
+
+CompiledSchema validates data against such a schema. The keywords the
+derived schemas use are compiled into plain Python checks once, so the items
+of a list of thousands are checked without walking the schema again; any
+other schema is validated with jsonschema.
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+# Type names of exampleItemShape and the JSON Schema types they stand for
+SHAPE_TYPES = {
+    'integer': 'integer',
+    'number': 'number',
+    'float': 'number',
+    'string': 'string',
+    'boolean': 'boolean',
+    'object': 'object',
+    'array': 'array',
+}
+
+# Keywords compiled into Python checks; schemas using others go to jsonschema
+COMPILED_KEYWORDS = frozenset((
+    'type', 'enum', 'properties', 'required', 'items', 'minimum', 'maximum',
+    'minLength', 'maxLength', 'format', 'title', 'description',
+))
+
+_PYTHON_TYPES = {
+    'integer': int,
+    'number': (int, float),
+    'string': str,
+    'boolean': bool,
+    'object': dict,
+    'array': list,
+    'null': type(None),
+}
+
+# Check appending "<path>: <problem>" messages for invalid values
+Check = Callable[[Any, str, List[str]], None]
+
+
+def shape_to_schema(shape: Any, nullable: bool = True) -> Dict[str, Any]:
+    """Convert an exampleItemShape (or part of it) to JSON Schema.
+
+    Fields of a shape are required; their values may be null, since the API
+    returns null for unset fields.
+
+    Args:
+        shape: Type name, ``"a|b|c"`` alternatives, ``"type[]"``, a list
+            holding the shape of its items, or a dict of field shapes.
+        nullable: Whether the value may be null.
+
+    Returns:
+        JSON Schema; an empty schema for unknown type names.
+    """
+    if isinstance(shape, dict):
+        schema = {
+            'type': 'object',
+            'properties': {name: shape_to_schema(value) for name, value in shape.items()},
+            'required': list(shape),
+        }
+    elif isinstance(shape, list):
+        schema = {'type': 'array'}
+        if shape:
+            schema['items'] = shape_to_schema(shape[0], nullable=False)
+    elif isinstance(shape, str) and shape.endswith('[]'):
+        schema = {'type': 'array', 'items': shape_to_schema(shape[:-2], nullable=False)}
+    elif isinstance(shape, str) and '|' in shape:
+        values: List[Any] = shape.split('|')
+        return {'enum': values + [None] if nullable else values}
+    elif shape in SHAPE_TYPES:
+        schema = {'type': SHAPE_TYPES[shape]}
+    else:
+        return {}
+    if nullable:
+        schema['type'] = [schema['type'], 'null']
+    return schema
+
+
+def example_to_schema(example: Any) -> Dict[str, Any]:
+    """Derive JSON Schema from an example body: same keys and value types.
+
+    Args:
+        example: Example JSON value.
+
+    Returns:
+        JSON Schema.
+    """
+    if isinstance(example, dict):
+        return {
+            'type': 'object',
+            'properties': {name: example_to_schema(value) for name, value in example.items()},
+            'required': list(example),
+        }
+    if isinstance(example, list):
+        return {'type': 'array', 'items': example_to_schema(example[0])} if example else {'type': 'array'}
+    if example is None:
+        return {}
+    for name, python_type in _PYTHON_TYPES.items():
+        if type(example) is python_type:
+            return {'type': name}
+    return {'type': 'number'} if isinstance(example, float) else {}
+
+
+def response_schema(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Get JSON Schema of a response described in api_spec.json.
+
+    Args:
+        response: Response definition, e.g. ``responses["200"]``.
+
+    Returns:
+        ``schema`` if given, a list of ``exampleItemShape`` items, the shape
+        of ``example``, or None if the response body is not described.
+    """
+    if 'schema' in response:
+        return response['schema']
+    if 'exampleItemShape' in response:
+        return {'type': 'array', 'items': shape_to_schema(response['exampleItemShape'], nullable=False)}
+    if 'example' in response:
+        return example_to_schema(response['example'])
+    return None
+
+
+def body_schema(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a request body schema of api_spec.json to JSON Schema.
+
+    ``min``/``max`` become ``minimum``/``maximum``, ``itemsType`` becomes
+    ``items``, type ``any`` allows any value, and annotations such as
+    ``enumLabels`` and ``notes`` are dropped.
+
+    Args:
+        body: Body (or property) schema from api_spec.json.
+
+    Returns:
+        JSON Schema.
+    """
+    schema: Dict[str, Any] = {}
+    if body.get('type') not in (None, 'any'):
+        schema['type'] = body['type']
+    for keyword in ('enum', 'required', 'minimum', 'maximum', 'minLength', 'maxLength', 'format'):
+        if keyword in body:
+            schema[keyword] = body[keyword]
+    if 'min' in body:
+        schema['minimum'] = body['min']
+    if 'max' in body:
+        schema['maximum'] = body['max']
+    if 'properties' in body:
+        schema['properties'] = {name: body_schema(prop) for name, prop in body['properties'].items()}
+    if 'items' in body:
+        schema['items'] = body_schema(body['items'])
+    elif 'itemsType' in body:
+        schema['items'] = {'type': body['itemsType']}
+    return schema
+
+
+def _is_type(value: Any, name: str) -> bool:
+    if name in ('integer', 'number') and isinstance(value, bool):
+        return False
+    if name == 'integer' and isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, _PYTHON_TYPES[name])
+
+
+def _compile(schema: Dict[str, Any]) -> Optional[Check]:
+    """Compile a schema into one check function.
+
+    Returns:
+        Check, or None if the schema uses keywords outside COMPILED_KEYWORDS.
+    """
+    if not isinstance(schema, dict) or not COMPILED_KEYWORDS.issuperset(schema):
+        return None
+    checks: List[Check] = []
+
+    if 'type' in schema:
+        types = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        if not all(name in _PYTHON_TYPES for name in types):
+            return None
+        expected = ' or '.join(types)
+
+        def check_type(value: Any, path: str, errors: List[str]) -> None:
+            if not any(_is_type(value, name) for name in types):
+                errors.append(f"{path}: expected {expected}, got {type(value).__name__} {value!r:.50}")
+        checks.append(check_type)
+
+    if 'enum' in schema:
+        allowed = schema['enum']
+
+        def check_enum(value: Any, path: str, errors: List[str]) -> None:
+            if value not in allowed or (isinstance(value, bool) and not any(v is value for v in allowed)):
+                errors.append(f"{path}: {value!r:.50} is not one of {allowed}")
+        checks.append(check_enum)
+
+    minimum, maximum = schema.get('minimum'), schema.get('maximum')
+    if minimum is not None or maximum is not None:
+
+        def check_range(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                return
+            if minimum is not None and value < minimum:
+                errors.append(f"{path}: {value!r} is less than the minimum of {minimum}")
+            if maximum is not None and value > maximum:
+                errors.append(f"{path}: {value!r} is greater than the maximum of {maximum}")
+        checks.append(check_range)
+
+    min_length, max_length = schema.get('minLength'), schema.get('maxLength')
+    if min_length is not None or max_length is not None:
+
+        def check_length(value: Any, path: str, errors: List[str]) -> None:
+            if not isinstance(value, str):
+                return
+            if min_length is not None and len(value) < min_length:
+                errors.append(f"{path}: {value!r:.50} is shorter than {min_length} characters")
+            if max_length is not None and len(value) > max_length:
+                errors.append(f"{path}: {value!r:.50} is longer than {max_length} characters")
+        checks.append(check_length)
+
+    if 'required' in schema:
+        required = schema['required']
+
+        def check_required(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, dict):
+                missing = [name for name in required if name not in value]
+                if missing:
+                    errors.append(f"{path}: missing keys {missing}")
+        checks.append(check_required)
+
+    if 'properties' in schema:
+        properties = {}
+        for name, subschema in schema['properties'].items():
+            check = _compile(subschema)
+            if check is None:
+                return None
+            properties[name] = check
+
+        def check_properties(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, dict):
+                for name, check in properties.items():
+                    if name in value:
+                        check(value[name], f"{path}.{name}", errors)
+        checks.append(check_properties)
+
+    if 'items' in schema:
+        check_item = _compile(schema['items'])
+        if check_item is None:
+            return None
+
+        def check_items(value: Any, path: str, errors: List[str]) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    check_item(item, f"{path}[{index}]", errors)
+        checks.append(check_items)
+
+    def check_all(value: Any, path: str, errors: List[str]) -> None:
+        for check in checks:
+            check(value, path, errors)
+    return check_all
+
+
+class CompiledSchema:
+    """JSON Schema compiled once and reused for every validation."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        """Initialize compiled schema.
+
+        Args:
+            schema: JSON Schema.
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        self.schema = schema
+        self._check = _compile(schema)
+        items = schema.get('items') if schema.get('type') == 'array' else None
+        self._item_schema: Optional[CompiledSchema] = CompiledSchema(items) if isinstance(items, dict) else None
+        self._validator = None
+        if self._check is None:
+            # Imported on first use only: jsonschema is slow to import
+            from jsonschema.validators import validator_for
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            self._validator = validator_class(schema)
+
+    @property
+    def item_schema(self) -> Optional["CompiledSchema"]:
+        """Schema of the items of a list schema, None for other schemas."""
+        return self._item_schema
+
+    def errors(self, data: Any, path: str = "root", limit: int = 10) -> List[str]:
+        """Validate data.
+
+        Args:
+            data: Decoded JSON value.
+            path: Name of the value in messages.
+            limit: Maximum number of messages returned.
+
+        Returns:
+            Messages of the problems found, empty if data is valid.
+        """
+        if self._check is not None:
+            errors: List[str] = []
+            self._check(data, path, errors)
+            return errors[:limit]
+        messages = []
+        for error in self._validator.iter_errors(data):
+            location = ''.join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in error.absolute_path)
+            messages.append(f"{path}{location}: {error.message}")
+            if len(messages) >= limit:
+                break
+        return messages
@@ -0,0 +1,193 @@
+"""Single-flight coalescing of identical in-flight requests.
+
+While a request for a key is in flight, identical requests wait for it
+instead of being sent again, and all callers receive its outcome. Used by
+the HTTP clients for GETs with the same URL, query, headers and options,
+e.g. when parallel fixtures resolve the same resource list at startup.
+"""
+import threading
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+from .deadline import DeadlineExceeded
+from .response_cache import cache_key
+
+
+def flight_key(method: str, url: str, headers: Mapping[str, str], **kwargs) -> str:
+    """Build the identity of a request for coalescing.
+
+    Requests are only identical if method, URL, query, every request header
+    (e.g. Accept-Language, If-None-Match; the API key hashed) and all other
+    per-call options such as ``timeout`` are equal.
+
+    Args:
+        method: HTTP method.
+        url: Full request URL.
+        headers: Final request headers.
+        **kwargs: Per-call request arguments, including ``params``.
+
+    Returns:
+        Key string.
+    """
+    api_key = None
+    other_headers = []
+    for name, value in headers.items():
+        if name.lower() == 'x-api-key':
+            api_key = value
+        else:
+            other_headers.append((name.lower(), value))
+    options = sorted((name, repr(value)) for name, value in kwargs.items() if name != 'params')
+    return f"{cache_key(method, url, kwargs.get('params'), api_key)} {sorted(other_headers)!r} {options!r}"
+
+
+class _Call:
+    """In-flight call shared by a leader and its followers."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces identical calls made concurrently from several threads."""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """Run fn unless a call for key is already in flight, then share its outcome.
+
+        Args:
+            key: Call identity.
+            fn: Function performing the call.
+            timeout: Seconds a follower waits for the leader (None waits
+                indefinitely).
+
+        Returns:
+            Tuple of the result and whether it was shared from another call.
+
+        Raises:
+            DeadlineExceeded: If a follower timed out waiting.
+            Exception: Whatever fn raised, for the leader and its followers.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise DeadlineExceeded(f"Deadline exceeded waiting for in-flight {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class _LeaderCancelled(Exception):
+    """Outcome shared when the leading call was cancelled; followers call again."""
+
+
+class AsyncSingleFlight:
+    """Coalesces identical calls made concurrently from asyncio tasks."""
+
+    def __init__(self):
+        self._calls: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Await fn unless a call for key is already in flight, then share its outcome.
+
+        Args:
+            key: Call identity.
+            fn: Coroutine function performing the call.
+
+        Returns:
+            Tuple of the result and whether it was shared from another call.
+
+        If the leading call is cancelled, its followers are not: they call
+        again, one of them leading the new call.
+        """
+        # Imported here: HTTPClient uses this module without asyncio
+        import asyncio
+
+        # Futures belong to one event loop
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        future = self._calls.get(call_key)
+        while future is not None:
+            try:
+                # Shielded: a cancelled follower must not cancel the leader's call
+                result = await asyncio.shield(future)
+            except _LeaderCancelled:
+                future = self._calls.get(call_key)
+            else:
+                self.coalesced += 1
+                return result, True
+
+        future = loop.create_future()
+        self._calls[call_key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieved here so a call without followers does not log "never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._calls[call_key]
+
+
+_default_flight: Optional[SingleFlight] = None
+_default_async_flight: Optional[AsyncSingleFlight] = None
+_default_lock = threading.Lock()
+
+
+def get_default_single_flight() -> SingleFlight:
+    """Get process-wide single-flight group shared by all HTTPClients.
+
+    Returns:
+        Shared SingleFlight instance.
+    """
+    global _default_flight
+    with _default_lock:
+        if _default_flight is None:
+            _default_flight = SingleFlight()
+        return _default_flight
+
+
+def get_default_async_single_flight() -> AsyncSingleFlight:
+    """Get process-wide single-flight group shared by all AsyncHTTPClients.
+
+    Returns:
+        Shared AsyncSingleFlight instance.
+    """
+    global _default_async_flight
+    with _default_lock:
+        if _default_async_flight is None:
+            _default_async_flight = AsyncSingleFlight()
+        return _default_async_flight
@@ -1,20 +1,77 @@
 """API specification loader.
 
 Loads api_spec.json and provides helper methods to query endpoint information.
+Endpoints are indexed once at load time, so lookups by operationId, by route
+and of concrete request paths do not scan the endpoint list. The parsed spec
+and its indexes can be persisted in a cache directory, in a file named after
+the spec's content hash, and the process-wide loader is shared by clients, caches and
+the coverage plugin.
 """
+import hashlib
 import json
 import os
-from typing import Any, Dict, List, Optional
+import pickle
+import re
+import threading
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from .config import Config
+from .schema import CompiledSchema, body_schema, response_schema
+
+# Layout version of compiled spec files; bump when the indexes change
+COMPILED_FORMAT = 3
+
+_COMPILED_ATTRIBUTES = (
+    'spec', '_by_operation_id', '_by_route', '_literal_routes', '_templates',
+    '_response_schemas', '_body_schemas',
+)
+
+_PARAM_SEGMENT = re.compile(r'^\{([^{}]+)\}$')
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize path for lookups: no query string, no outer slashes."""
+    return path.split('?', 1)[0].strip('/')
+
+
+def _compile_template(template: str) -> Tuple[Pattern, int]:
+    """Compile a path template to a regex matching concrete paths.
+
+    Args:
+        template: Normalized path template (e.g. 'timeLogs/{timeLogId}').
+
+    Returns:
+        Regex with one named group per ``{param}`` segment, and the number
+        of parameters.
+    """
+    parts = []
+    params = 0
+    for segment in template.split('/'):
+        match = _PARAM_SEGMENT.match(segment)
+        if match:
+            name = match.group(1)
+            parts.append(f"(?P<{name}>[^/]+)" if name.isidentifier() else "([^/]+)")
+            params += 1
+        else:
+            parts.append(re.escape(segment))
+    return re.compile('/'.join(parts) + r'\Z'), params
 
 
 class SpecLoader:
     """Loader for API specification."""
     
-    def __init__(self, spec_path: Optional[str] = None):
+    def __init__(self, spec_path: Optional[str] = None, cache_dir: Optional[str] = None):
         """Initialize spec loader.
         
         Args:
             spec_path: Path to api_spec.json. Defaults to project root.
+            cache_dir: Optional directory keeping the parsed spec and its
+                indexes, one file per spec content hash. Only files owned by
+                the current user are loaded.
+        
+        Raises:
+            FileNotFoundError: If spec file not found.
+            json.JSONDecodeError: If spec file is invalid JSON.
         """
         if spec_path is None:
             # Default to api_spec.json in project root
@@ -22,20 +79,105 @@ class SpecLoader:
             spec_path = os.path.join(project_root, "api_spec.json")
         
         self.spec_path = spec_path
-        self.spec = self._load_spec()
+        self.cache_path: Optional[str] = None
+        self.from_cache = False
+        with open(spec_path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if cache_dir:
+            name = os.path.splitext(os.path.basename(spec_path))[0]
+            self.cache_path = os.path.join(cache_dir, f"{name}.{digest}.pickle")
+        if self.cache_path and self._load_compiled(digest):
+            self.from_cache = True
+        else:
+            self.spec = json.loads(raw)
+            self._build_indexes()
+            if self.cache_path:
+                self._save_compiled(digest)
+        self._prefixes: Dict[str, List[Dict[str, Any]]] = {}
+        self._validators: Dict[Tuple[str, str], CompiledSchema] = {}
+        self._validators_lock = threading.Lock()
     
-    def _load_spec(self) -> Dict[str, Any]:
-        """Load API specification from JSON file.
+    def _load_compiled(self, digest: str) -> bool:
+        """Restore spec and indexes from the cache file.
+        
+        Args:
+            digest: SHA-256 of the current spec content.
         
         Returns:
-            Parsed API specification.
+            True if the cache file matched the spec and was loaded.
+        """
+        try:
+            with open(self.cache_path, 'rb') as f:
+                # Unpickling runs code: never load a file someone else could have planted
+                if hasattr(os, 'getuid') and os.fstat(f.fileno()).st_uid != os.getuid():
+                    return False
+                compiled = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            return False
+        if not isinstance(compiled, dict) or compiled.get('format') != COMPILED_FORMAT or compiled.get('sha256') != digest:
+            return False
+        for name in _COMPILED_ATTRIBUTES:
+            setattr(self, name, compiled[name])
+        return True
+    
+    def _save_compiled(self, digest: str) -> None:
+        """Write spec and indexes to the cache file; skipped if not writable.
         
-        Raises:
-            FileNotFoundError: If spec file not found.
-            json.JSONDecodeError: If spec file is invalid JSON.
+        Args:
+            digest: SHA-256 of the spec content.
+        """
+        compiled = {name: getattr(self, name) for name in _COMPILED_ATTRIBUTES}
+        compiled.update(format=COMPILED_FORMAT, sha256=digest)
+        # Written aside and renamed, so concurrent workers never read a partial file
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), mode=0o700, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _build_indexes(self) -> None:
+        """Index endpoints by operationId, by route and by path template,
+        and derive JSON Schemas of their request bodies and described
+        responses.
+        
+        Concrete paths of templates without parameters resolve with one dict
+        lookup; templated routes are tried as compiled regexes, fewest
+        parameters first (so '/timeLogs/getByProjectId' wins over
+        '/timeLogs/{timeLogId}'), in spec order among equals.
         """
-        with open(self.spec_path, 'r') as f:
-            return json.load(f)
+        self._by_operation_id: Dict[str, Dict[str, Any]] = {}
+        self._by_route: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._literal_routes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._templates: Dict[str, List[Tuple[int, Pattern, Dict[str, Any]]]] = {}
+        self._response_schemas: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._body_schemas: Dict[str, Dict[str, Any]] = {}
+        for endpoint in self.get_endpoints():
+            operation_id = endpoint.get("operationId")
+            if operation_id is not None and operation_id not in self._by_operation_id:
+                self._by_operation_id[operation_id] = endpoint
+                for status, response in endpoint.get("responses", {}).items():
+                    schema = response_schema(response) if isinstance(response, dict) else None
+                    if schema is not None:
+                        self._response_schemas[(operation_id, str(status))] = schema
+                if isinstance(endpoint.get("body"), dict):
+                    self._body_schemas[operation_id] = body_schema(endpoint["body"])
+            method = endpoint.get("method", "").upper()
+            template = _normalize_path(endpoint.get("path", ""))
+            self._by_route.setdefault((method, template), endpoint)
+            pattern, params = _compile_template(template)
+            if params:
+                self._templates.setdefault(method, []).append((params, pattern, endpoint))
+            else:
+                self._literal_routes.setdefault((method, template), endpoint)
+        for routes in self._templates.values():
+            routes.sort(key=lambda route: route[0])
     
     def get_base_url(self) -> str:
         """Get API base URL from spec.
@@ -62,10 +204,64 @@ class SpecLoader:
         Returns:
             Endpoint definition or None if not found.
         """
-        for endpoint in self.get_endpoints():
-            if endpoint.get("operationId") == operation_id:
-                return endpoint
-        return None
+        return self._by_operation_id.get(operation_id)
+    
+    def get_body_schema(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        """Get JSON Schema of an operation's request body.
+        
+        Args:
+            operation_id: Operation ID.
+        
+        Returns:
+            JSON Schema, or None if the operation takes no body.
+        """
+        return self._body_schemas.get(operation_id)
+    
+    def get_response_schema(self, operation_id: str, status: int = 200) -> Optional[Dict[str, Any]]:
+        """Get JSON Schema of an operation's response body.
+        
+        Args:
+            operation_id: Operation ID.
+            status: HTTP status code of the response.
+        
+        Returns:
+            JSON Schema, or None if the spec does not describe the body.
+        """
+        return self._response_schemas.get((operation_id, str(status)))
+    
+    def get_response_validator(self, operation_id: str, status: int = 200) -> Optional[CompiledSchema]:
+        """Get validator of an operation's response body, compiled once.
+        
+        Args:
+            operation_id: Operation ID.
+            status: HTTP status code of the response.
+        
+        Returns:
+            Compiled schema, or None if the spec does not describe the body.
+        """
+        key = (operation_id, str(status))
+        validator = self._validators.get(key)
+        if validator is None:
+            schema = self._response_schemas.get(key)
+            if schema is None:
+                return None
+            with self._validators_lock:
+                validator = self._validators.get(key)
+                if validator is None:
+                    validator = self._validators[key] = CompiledSchema(schema)
+        return validator
+    
+    def get_endpoint(self, method: str, path: str) -> Optional[Dict[str, Any]]:
+        """Get endpoint by its route as written in the spec.
+        
+        Args:
+            method: HTTP method.
+            path: Path template (e.g., '/timeLogs/{timeLogId}').
+        
+        Returns:
+            Endpoint definition or None if not found.
+        """
+        return self._by_route.get((method.upper(), _normalize_path(path)))
     
     def get_endpoints_by_path_prefix(self, prefix: str) -> List[Dict[str, Any]]:
         """Get all endpoints matching path prefix.
@@ -76,10 +272,53 @@ class SpecLoader:
         Returns:
             List of matching endpoints.
         """
-        return [
-            ep for ep in self.get_endpoints()
-            if ep.get("path", "").startswith(prefix)
-        ]
+        if prefix not in self._prefixes:
+            self._prefixes[prefix] = [
+                ep for ep in self.get_endpoints()
+                if ep.get("path", "").startswith(prefix)
+            ]
+        return list(self._prefixes[prefix])
+    
+    def match(self, method: str, path: str) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+        """Resolve a concrete request path to its endpoint and path parameters.
+        
+        Path templates match any value in ``{param}`` segments; when several
+        templates match (e.g. '/timeLogs/getByProjectId' and
+        '/timeLogs/{timeLogId}'), the one with fewer parameters wins.
+        
+        Args:
+            method: HTTP method.
+            path: Request path (e.g., '/timeLogs/123'); query string ignored.
+        
+        Returns:
+            Endpoint definition and path parameter values (e.g.
+            ``{'timeLogId': '123'}``), or None if no endpoint matches.
+        """
+        method = method.upper()
+        path = _normalize_path(path)
+        endpoint = self._literal_routes.get((method, path))
+        if endpoint is not None:
+            return endpoint, {}
+        for _, pattern, endpoint in self._templates.get(method, ()):
+            match = pattern.match(path)
+            if match:
+                return endpoint, match.groupdict()
+        return None
+    
+    def find_endpoint(self, method: str, path: str) -> Optional[Dict[str, Any]]:
+        """Find endpoint serving a concrete request path.
+        
+        See match() for how templates are resolved.
+        
+        Args:
+            method: HTTP method.
+            path: Request path (e.g., '/timeLogs/123'); query string ignored.
+        
+        Returns:
+            Endpoint definition or None if no endpoint matches.
+        """
+        matched = self.match(method, path)
+        return matched[0] if matched else None
     
     def get_error_codes(self) -> List[Dict[str, Any]]:
         """Get all error codes from spec.
@@ -88,3 +327,26 @@ class SpecLoader:
             List of error code definitions.
         """
         return self.spec.get("errorCodes", [])
+
+
+_default_loader: Optional[SpecLoader] = None
+_default_lock = threading.Lock()
+
+
+def get_default_spec_loader() -> SpecLoader:
+    """Get process-wide loader of the project's api_spec.json.
+    
+    With SPEC_CACHE_ENABLED the compiled spec is kept in SPEC_CACHE_DIR, so
+    later processes (e.g. xdist workers) skip parsing and indexing.
+    
+    Returns:
+        Shared SpecLoader.
+    """
+    global _default_loader
+    with _default_lock:
+        if _default_loader is None:
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            spec_path = os.path.join(project_root, "api_spec.json")
+            cache_dir = Config.SPEC_CACHE_DIR if Config.SPEC_CACHE_ENABLED else None
+            _default_loader = SpecLoader(spec_path, cache_dir)
+        return _default_loader
@@ -0,0 +1,217 @@
+"""Transport adapter for requests sessions.
+
+Installs urllib3 connection classes that time connection setup (DNS, TCP
+and TLS handshake), so HTTPClient can tell how much of a request was spent
+opening a connection versus waiting for the server. Timings are collected
+per thread: requests sends on the calling thread, so a client resets the
+timer before a request and reads it afterwards.
+
+The adapter also counts how often keep-alive connections are reused,
+can pre-open connections to a host before the first request, and returns
+JSONResponse objects whose parsed body is memoized.
+
+Response compression is negotiated with every content coding urllib3 can
+decode here (gzip and deflate, plus br and zstd when brotli/zstandard are
+installed); urllib3 decodes bodies incrementally, also when streamed.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import HTTPError
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .json_codec import JSONResponse
+
+_local = threading.local()
+
+
+def reset_connect_timer() -> None:
+    """Start collecting connection setup time on the current thread."""
+    _local.connect_time = 0.0
+
+
+def connect_time() -> float:
+    """Get seconds spent opening connections since the last reset.
+
+    Returns:
+        Connection setup time on the current thread (0 when reused).
+    """
+    return getattr(_local, 'connect_time', 0.0)
+
+
+def accept_encoding(setting: str = 'auto') -> str:
+    """Build the Accept-Encoding header value.
+
+    Args:
+        setting: 'auto' for every content coding urllib3 can decode,
+            'identity' to disable compression, or an explicit list.
+
+    Returns:
+        Accept-Encoding header value.
+    """
+    if setting == 'auto':
+        return ', '.join(coding.strip() for coding in ACCEPT_ENCODING.split(','))
+    return setting
+
+
+def transferred_bytes(response: Response) -> int:
+    """Get body bytes of a response as transferred, before decompression.
+
+    Args:
+        response: Response whose body has been read.
+
+    Returns:
+        Bytes read off the connection; the decoded body size for responses
+        built without a connection (cache, cassette replay).
+    """
+    raw = response.raw
+    # urllib3 counts bytes pulled from the socket, not decoded ones
+    if raw is not None and hasattr(raw, 'tell'):
+        try:
+            return raw.tell()
+        except (OSError, ValueError):
+            pass
+    return len(response.content or b'')
+
+
+def _record_connect(started: float) -> None:
+    _local.connect_time = connect_time() + time.perf_counter() - started
+    _local.connections = getattr(_local, 'connections', 0) + 1
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """HTTP connection recording its setup time."""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(started)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection recording its setup time, TLS handshake included."""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _record_connect(started)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose direct connections report their setup time.
+
+    Accepts the pool sizing arguments of HTTPAdapter (``pool_connections``
+    hosts, ``pool_maxsize`` kept-alive connections per host, ``pool_block``).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.connections_warmed = 0
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        # Instance copy: the default mapping is shared by every PoolManager
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        # Same object, with memoized codec-backed json()
+        response.__class__ = JSONResponse
+        return response
+
+    def send(self, request, *args, **kwargs):
+        opened_before = getattr(_local, 'connections', 0)
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            opened = getattr(_local, 'connections', 0) - opened_before
+            with self._stats_lock:
+                self.requests_sent += 1
+                self.connections_opened += opened
+
+    def stats(self) -> Dict[str, int]:
+        """Get keep-alive reuse statistics.
+
+        Returns:
+            Dictionary with requests sent, connections opened while sending,
+            connections opened by warm-up, and requests that reused an open
+            connection.
+        """
+        with self._stats_lock:
+            return {
+                'requests': self.requests_sent,
+                'connections_opened': self.connections_opened,
+                'connections_warmed': self.connections_warmed,
+                'reused': max(0, self.requests_sent - self.connections_opened),
+            }
+
+    def warm_up(self, url: str, connections: int, timeout: float = 5.0) -> int:
+        """Open connections to the host of url in parallel and keep them pooled.
+
+        DNS, TCP and TLS setup are paid up front, so the first requests of
+        a run (and concurrent batches) find ready keep-alive connections.
+
+        Args:
+            url: Any URL on the host to connect to.
+            connections: Number of connections; capped at pool_maxsize.
+            timeout: Connect timeout per connection in seconds.
+
+        Returns:
+            Number of connections opened.
+        """
+        pool = self.poolmanager.connection_from_url(url)
+        count = min(connections, self._pool_maxsize)
+        if count <= 0:
+            return 0
+        conns = [pool._get_conn() for _ in range(count)]
+        opened = 0
+        try:
+            with ThreadPoolExecutor(max_workers=count, thread_name_prefix="http-warmup") as executor:
+                for conn, error in zip(conns, executor.map(lambda conn: _open(conn, timeout), conns)):
+                    if error is None:
+                        opened += 1
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        with self._stats_lock:
+            self.connections_warmed += opened
+        return opened
+
+
+def _open(conn: HTTPConnection, timeout: float) -> Optional[Exception]:
+    """Connect a pooled connection unless already connected."""
+    if conn.sock is not None:
+        return None
+    default_timeout, conn.timeout = conn.timeout, timeout
+    try:
+        conn.connect()
+    except (OSError, HTTPError) as e:
+        conn.close()
+        return e
+    finally:
+        conn.timeout = default_timeout
+    return None
@@ -3,6 +3,9 @@ import json
 sys.path.insert(0, '.')
 from src.config import Config
 from src.http_client import HTTPClient
+from src.logging_setup import configure_logging
+
+configure_logging()
 
 client = HTTPClient(base_url=Config.BASE_URL)
 headers = Config.get_auth_headers()
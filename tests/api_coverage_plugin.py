@@ -5,6 +5,8 @@ import re
 from collections import defaultdict
 from pathlib import Path
 
+from src.spec_loader import get_default_spec_loader
+
 
 class APICoveragePlugin:
     """Плагин для сбора метрик покрытия API."""
@@ -21,21 +23,20 @@ class APICoveragePlugin:
 
     def pytest_configure(self, config):
         """Инициализация плагина."""
-        # Загружаем api_spec.json для подсчёта всех endpoints
-        spec_path = Path(config.rootdir) / "api_spec.json"
-        if spec_path.exists():
-            with open(spec_path, 'r') as f:
-                spec_data = json.load(f)
-                self.spec_endpoints = self._parse_spec(spec_data)
-
-    def _parse_spec(self, spec_data):
-        """Парсинг api_spec.json для получения всех endpoints."""
+        # Берём endpoints из общего для процесса (и закэшированного) api_spec.json
+        try:
+            spec = get_default_spec_loader()
+        except FileNotFoundError:
+            return
+        self.spec_endpoints = self._parse_spec(spec)
+
+    def _parse_spec(self, spec):
+        """Получение всех endpoints из api_spec.json."""
         endpoints = {}
-        if 'paths' in spec_data:
-            for path, methods in spec_data['paths'].items():
-                for method in methods.keys():
-                    key = f"{method.upper()} {path}"
-                    endpoints[key] = {'path': path, 'method': method.upper()}
+        for endpoint in spec.get_endpoints():
+            method = endpoint.get('method', '').upper()
+            path = endpoint.get('path', '')
+            endpoints[f"{method} {path}"] = {'path': path, 'method': method}
         return endpoints
 
     def pytest_runtest_call(self, item):
@@ -2,11 +2,97 @@
 
 Provides fixtures for HTTP client, authentication, and test data IDs.
 """
+import json
 import os
-import time
 import pytest
+import requests
 from src.http_client import HTTPClient
+from src.async_http_client import AsyncHTTPClient
+from src.cassette import get_default_cassette
+from src.circuit_breaker import CircuitOpenError, get_default_breakers
 from src.config import Config
+from src.deadline import deadline
+from src.key_pool import get_default_key_pool
+from src.logging_setup import RootHandler, configure_logging, flush_logging
+from src.metrics import get_default_latency_stats
+from src.rate_limiter import get_default_governor
+
+
+_log_listener = None
+
+
+# Allure groups failed tests matching these rules under their own category
+ALLURE_CATEGORIES = [
+    {
+        "name": "Timeouts",
+        "matchedStatuses": ["failed", "broken"],
+        "messageRegex": r".*(Timeout|DeadlineExceeded|timed out).*",
+    },
+    {
+        "name": "Circuit open",
+        "matchedStatuses": ["failed", "broken"],
+        "messageRegex": r".*CircuitOpenError.*",
+    },
+]
+
+# Failures reported as their own category (JUnit property, terminal summary)
+FAILURE_CATEGORIES = [
+    (CircuitOpenError, "circuit_open", "failed fast on an open circuit"),
+    (requests.Timeout, "timeout", "timed out or missed their deadline"),
+]
+
+
+class _LogFlush:
+    """Deliver queued log records while pytest's per-phase capture handlers are installed."""
+
+    # trylast: innermost wrapper, so the capture handlers are still in place after yield
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_runtest_setup(self, item):
+        yield
+        flush_logging()
+
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_runtest_call(self, item):
+        yield
+        flush_logging()
+
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_runtest_teardown(self, item):
+        yield
+        flush_logging()
+
+
+def pytest_configure(config):
+    """Start the background log listener and register Allure categories."""
+    global _log_listener
+    # pytest's own handlers on the root logger capture records per test
+    # ("Captured log" sections, caplog, log_cli); the listener thread hands
+    # records to them, flushed at the end of every test phase
+    _log_listener = configure_logging(handlers=[RootHandler()])
+    config.pluginmanager.register(_LogFlush(), "src-log-flush")
+    
+    alluredir = getattr(config.option, "allure_report_dir", None)
+    if alluredir:
+        os.makedirs(alluredir, exist_ok=True)
+        with open(os.path.join(alluredir, "categories.json"), "w", encoding="utf-8") as f:
+            json.dump(ALLURE_CATEGORIES, f, indent=2)
+
+
+def pytest_unconfigure(config):
+    """Flush pending log records, stop the log listener and close rate budget files."""
+    if _log_listener is not None:
+        _log_listener.stop()
+    get_default_governor().close()
+
+
+def pytest_report_header(config):
+    """Show the API target and config profile, warning if no API key is set."""
+    lines = [f"GanttPRO API: {Config.BASE_URL} (config profile: {Config.CONFIG_PROFILE or 'default'})"]
+    try:
+        Config.validate()
+    except ValueError as e:
+        lines.append(f"Warning: {e}")
+    return lines
 
 
 @pytest.fixture(scope="session")
@@ -17,8 +103,19 @@ def client():
         HTTPClient instance configured with base URL.
     """
     client = HTTPClient(base_url=Config.BASE_URL)
-    # Store client globally for report access
-    return client
+    client.warm_up()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def async_client():
+    """Create asyncio HTTP client instance.
+    
+    Returns:
+        AsyncHTTPClient instance configured with base URL.
+    """
+    return AsyncHTTPClient(base_url=Config.BASE_URL)
 
 
 @pytest.fixture(scope="session")
@@ -256,12 +353,70 @@ def setup_reports_dir():
     os.makedirs(os.path.join(reports_dir, "coverage-html"), exist_ok=True)
 
 
-@pytest.fixture(autouse=True)
-def rate_limit_pause():
-    """Add pause between tests to avoid API rate limiting."""
-    yield
-    # Pause after each test (1 second to be safe)
-    time.sleep(1)
+def pytest_sessionfinish(session):
+    """Dump per-operation latency histograms to reports/."""
+    latency = get_default_latency_stats()
+    if not len(latency):
+        return
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    name = f"latency-{worker}.json" if worker else "latency.json"
+    latency.dump(os.path.join(str(session.config.rootdir), "reports", name))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report rate-limit waits, failure categories, open circuits and slowest operations."""
+    stats = get_default_governor().stats()
+    if stats['requests']:
+        terminalreporter.write_line(
+            f"Rate governor: {stats['requests']} requests, "
+            f"{stats['throttled_requests']} throttled, "
+            f"{stats['throttled_seconds']:.2f}s spent waiting"
+        )
+        key_pool = get_default_key_pool()
+        if key_pool is not None and len(key_pool) > 1:
+            for identity, usage in key_pool.stats(get_default_governor()).items():
+                terminalreporter.write_line(
+                    f"  API key {identity}: {usage['requests']} requests, "
+                    f"{usage['throttled_requests']} throttled, {usage['throttled_seconds']:.2f}s waiting"
+                )
+    for _, category, description in FAILURE_CATEGORIES:
+        reports = [
+            report for report in terminalreporter.stats.get('failed', [])
+            if ("failure_category", category) in report.user_properties
+        ]
+        if reports:
+            terminalreporter.write_line(f"{category}: {len(reports)} failed tests {description}")
+            for report in reports:
+                terminalreporter.write_line(f"  {report.nodeid}")
+    for name, breaker in get_default_breakers().open_circuits().items():
+        terminalreporter.write_line(
+            f"Circuit open: {name} ({breaker.failures} consecutive failures, "
+            f"last: {breaker.last_failure}, {breaker.rejected} requests rejected)"
+        )
+    slowest = get_default_latency_stats().slowest()
+    if slowest:
+        terminalreporter.write_line("Slowest operations (p50 / p99 total):")
+        for operation, histogram in slowest:
+            terminalreporter.write_line(
+                f"  {operation:<40} {histogram.percentile(50) * 1e3:8.1f} ms "
+                f"{histogram.percentile(99) * 1e3:8.1f} ms  ({histogram.count} requests)"
+            )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Switch the record/replay cassette to the test about to run."""
+    cassette = get_default_cassette()
+    if cassette is not None:
+        cassette.use(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Run the test under its request deadline (marker or TEST_DEADLINE)."""
+    marker = item.get_closest_marker("deadline")
+    with deadline(marker.args[0] if marker else Config.TEST_DEADLINE):
+        yield
 
 
 # HTML Report customization
@@ -271,6 +426,15 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     
+    # Timeouts (including missed deadlines) and open circuits are reported as their own category
+    if report.failed and call.excinfo is not None:
+        for exc_type, category, _ in FAILURE_CATEGORIES:
+            if call.excinfo.errisinstance(exc_type):
+                # On the item too, so the JUnit XML (written at teardown) carries it
+                item.user_properties.append(("failure_category", category))
+                report.user_properties.append(("failure_category", category))
+                break
+    
     # Add extra info to report
     if report.when == 'call':
         # Get test docstring as description
@@ -281,7 +445,7 @@ def pytest_runtest_makereport(item, call):
         if 'client' in item.funcargs:
             client = item.funcargs['client']
             if hasattr(client, 'request_history') and client.request_history:
-                report.request_info = client.request_history[-1]
+                report.request_info = client.get_last_request().to_dict()
             else:
                 report.request_info = None
         else:
@@ -331,7 +495,7 @@ def pytest_html_results_table_row(report, cells):
             request_str = ''.join(request_parts)
         
         # Format response details
-        response = request_info.get('response', {})
+        response = request_info.get('response') or {}
         status_code = response.get('status_code', 'N/A')
         response_body = response.get('body', '')
         
@@ -1,6 +1,6 @@
 """Test for getting colors via GET /colors"""
 import pytest
-from src.assertions import assert_status_code, assert_response_is_list
+from src.assertions import assert_matches_spec, assert_status_code, assert_response_is_list
 import allure
 
 
@@ -16,6 +16,18 @@ def test_get_colors_success(client, auth_headers):
     assert_response_is_list(response)
 
 
+@allure.feature("Colors")
+@allure.story("Get Colors")
+@allure.tag("GET")
+@allure.tag("contract")
+def test_get_colors_matches_spec(client, auth_headers):
+    """Test colors match the item shape described in api_spec.json"""
+    response = client.get("/colors", headers=auth_headers)
+    
+    assert_status_code(response, 200)
+    assert_matches_spec(response, "getColors")
+
+
 @allure.feature("Colors")
 @allure.story("Get Colors")
 @allure.tag("GET")
@@ -1,6 +1,6 @@
 """Test for getting languages via GET /languages"""
 import pytest
-from src.assertions import assert_status_code, assert_response_is_list
+from src.assertions import assert_matches_spec, assert_status_code, assert_response_is_list
 import allure
 
 
@@ -16,6 +16,18 @@ def test_get_languages_success(client, auth_headers):
     assert_response_is_list(response)
 
 
+@allure.feature("Languages")
+@allure.story("Get Languages")
+@allure.tag("GET")
+@allure.tag("contract")
+def test_get_languages_matches_spec(client, auth_headers):
+    """Test languages match the item shape described in api_spec.json"""
+    response = client.get("/languages", headers=auth_headers)
+    
+    assert_status_code(response, 200)
+    assert_matches_spec(response, "getLanguages")
+
+
 @allure.feature("Languages")
 @allure.story("Get Languages")
 @allure.tag("GET")
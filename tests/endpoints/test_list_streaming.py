@@ -0,0 +1,46 @@
+"""Test streaming of list endpoints via HTTPClient.iter_items"""
+import pytest
+from src.assertions import assert_stream_is_list
+from src.spec_loader import get_default_spec_loader
+import allure
+
+# Fixtures supplying required query parameters of list operations
+QUERY_FIXTURES = {"taskId": "task_id", "projectId": "project_id"}
+
+
+def _list_operations():
+    """GET operations whose 200 response is described as a JSON array in api_spec.json"""
+    spec = get_default_spec_loader()
+    operations = []
+    for endpoint in spec.get_endpoints():
+        operation_id = endpoint.get("operationId")
+        if endpoint.get("method") != "GET" or not operation_id:
+            continue
+        schema = spec.get_response_schema(operation_id)
+        if schema and schema.get("type") == "array":
+            item_keys = schema.get("items", {}).get("required", [])
+            operations.append(pytest.param(endpoint, item_keys, id=operation_id))
+    return operations
+
+
+@allure.feature("Lists")
+@allure.story("Stream List")
+@allure.tag("GET")
+@allure.tag("positive")
+@pytest.mark.parametrize("endpoint, item_keys", _list_operations())
+def test_list_streams_as_json_list(request, client, auth_headers, endpoint, item_keys):
+    """Test list operations stream as JSON lists of items with the keys in api_spec.json"""
+    params = {}
+    for name, param in endpoint.get("queryParams", {}).items():
+        if not param.get("required"):
+            continue
+        if name not in QUERY_FIXTURES:
+            pytest.skip(f"No fixture supplies required query parameter {name}")
+        value = request.getfixturevalue(QUERY_FIXTURES[name])
+        if not value:
+            pytest.skip(f"{QUERY_FIXTURES[name]} not available")
+        params[name] = [value] if param.get("type") == "array" else value
+    
+    items = client.iter_items(endpoint["path"], params=params, headers=auth_headers)
+    
+    assert_stream_is_list(items, item_keys=item_keys)
@@ -1,6 +1,6 @@
 """Test for getting time logs by project ID via GET /timeLogs/getByProjectId"""
 import pytest
-from src.assertions import assert_status_code
+from src.assertions import assert_status_code, assert_stream_is_list
 import allure
 
 
@@ -19,6 +19,21 @@ def test_get_time_log_by_project_id_success(client, auth_headers, project_id):
     assert_status_code(response, 200)
 
 
+@allure.feature("Timelogs")
+@allure.story("Get Timelogs by Project")
+@allure.tag("GET")
+@allure.tag("positive")
+def test_get_time_log_by_project_id_streamed(client, auth_headers, project_id):
+    """Test time logs by project ID stream as a JSON list of objects"""
+    if not project_id:
+        pytest.skip("PROJECT_ID not configured in .env")
+    
+    params = {"projectId": project_id}
+    items = client.iter_items("/timeLogs/getByProjectId", params=params, headers=auth_headers)
+    
+    assert_stream_is_list(items, item_keys=["id"])
+
+
 @allure.feature("Timelogs")
 @allure.story("Get Timelogs by Project")
 @allure.tag("GET")
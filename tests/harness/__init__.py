@@ -0,0 +1 @@
+"""Harness tests against a local stand-in server."""
@@ -0,0 +1,49 @@
+"""Fixtures for harness tests against the local stand-in server."""
+import pytest
+
+from src.circuit_breaker import get_default_breakers
+from src.metrics import LatencyStats, get_default_latency_stats
+from tests.harness.stand_in_server import StandInServer
+
+
+@pytest.fixture(scope="session")
+def stand_in_server():
+    """Start local stand-in server for the test session.
+    
+    Returns:
+        Running StandInServer instance.
+    """
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def stand_in_url(stand_in_server):
+    """Get base URL of the stand-in server with a clean request log.
+    
+    Circuits opened by earlier harness tests are closed again.
+    
+    Returns:
+        Base URL string.
+    """
+    stand_in_server.received.clear()
+    get_default_breakers().reset()
+    return stand_in_server.base_url
+
+
+@pytest.fixture(autouse=True)
+def isolated_latency_stats():
+    """Keep stand-in latencies out of the session's latency report.
+    
+    Harness clients record into the process-wide stats like any client;
+    whatever a harness test recorded is discarded after it, so the
+    "Slowest operations" summary and reports/latency.json only cover the
+    real API.
+    """
+    stats = get_default_latency_stats()
+    saved = LatencyStats()
+    saved.merge(stats)
+    yield
+    stats.clear()
+    stats.merge(saved)
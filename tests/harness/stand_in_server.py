@@ -0,0 +1,190 @@
+"""Local stand-in for the GanttPRO API.
+
+A small threaded HTTP server used to verify the HTTP clients without
+network access or API credentials.
+"""
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+
+LANGUAGES = [
+    {"id": 1, "lang": "en", "name": "English"},
+    {"id": 2, "lang": "ru", "name": "Русский"},
+]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler with a few canned GanttPRO-like routes.
+
+    Routes:
+        GET  /languages        -> static JSON list.
+        ANY  /echo             -> method, path, query and JSON body echoed back.
+        GET  /slow?delay=SEC   -> sleeps SEC seconds, then {"status": "ok"}.
+        ANY  /status/CODE      -> responds with CODE and a JSON error body.
+        ANY  /flaky?key=K&failures=N&status=S&retry_after=R
+                               -> first N calls per key answer S (default 503,
+                                  with Retry-After R if given), then 200.
+        GET  /lagging?key=K&delay=SEC
+                               -> first call per key sleeps SEC seconds, later
+                                  calls answer at once.
+        GET  /items?count=N    -> list of N items, gzip-compressed when the
+                                  request accepts gzip.
+        GET  /comments/getByProjectId?projectId=P&version=V
+                               -> comment list with ETag V and Last-Modified;
+                                  304 when If-None-Match or (without it)
+                                  If-Modified-Since matches.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence default stderr access log."""
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        raw = self.rfile.read(length)
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw.decode("utf-8", errors="replace")
+
+    def _send_json(self, status: int, payload: Any, headers: Dict[str, str] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _dispatch(self) -> None:
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        body = self._read_body()
+        self.server.received.append({
+            "method": self.command,
+            "path": parsed.path,
+            "query": query,
+            "headers": dict(self.headers),
+        })
+
+        if parsed.path == "/languages":
+            self._send_json(200, LANGUAGES)
+        elif parsed.path == "/echo":
+            self._send_json(200, {
+                "method": self.command,
+                "path": parsed.path,
+                "query": query,
+                "body": body,
+            })
+        elif parsed.path == "/slow":
+            time.sleep(float(query.get("delay", 0.1)))
+            self._send_json(200, {"status": "ok"})
+        elif parsed.path == "/flaky":
+            key = query.get("key", "")
+            with self.server.lock:
+                calls = self.server.counters.get(key, 0) + 1
+                self.server.counters[key] = calls
+            if calls <= int(query.get("failures", 1)):
+                headers = {"Retry-After": query["retry_after"]} if "retry_after" in query else None
+                self._send_json(int(query.get("status", 503)), {"status": "error", "call": calls}, headers)
+            else:
+                self._send_json(200, {"status": "ok", "call": calls})
+        elif parsed.path == "/lagging":
+            key = query.get("key", "")
+            with self.server.lock:
+                calls = self.server.counters.get(key, 0) + 1
+                self.server.counters[key] = calls
+            if calls == 1:
+                time.sleep(float(query.get("delay", 1)))
+            self._send_json(200, {"status": "ok", "call": calls})
+        elif parsed.path == "/items":
+            items = [{"id": i, "name": f"Item {i}", "done": i % 2 == 0} for i in range(int(query.get("count", 100)))]
+            body = json.dumps(items).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif parsed.path == "/comments/getByProjectId":
+            etag = f'"{query.get("version", "1")}"'
+            last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+            headers = {"ETag": etag, "Last-Modified": last_modified}
+            if_none_match = self.headers.get("If-None-Match")
+            if (if_none_match == etag if if_none_match is not None
+                    else self.headers.get("If-Modified-Since") == last_modified):
+                self.send_response(304)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+            comments = [{"id": i, "projectId": query.get("projectId"), "text": f"Comment {i}"} for i in range(50)]
+            self._send_json(200, comments, headers)
+        elif parsed.path.startswith("/status/"):
+            code = int(parsed.path.rsplit("/", 1)[-1])
+            self._send_json(code, {"status": "error", "code": code})
+        else:
+            self._send_json(404, {"status": "error", "message": "Not found"})
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+    do_DELETE = _dispatch
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded stand-in server running in a background thread."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), StandInHandler)
+        self.received: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+        self.lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def hits(self, path: str) -> int:
+        """Count requests received for a path."""
+        return sum(1 for entry in self.received if entry["path"] == path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the stand-in API (target of CONFIG_PROFILE=local).")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    server = StandInServer(port=args.port)
+    print(f"Stand-in server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,107 @@
+"""Tests for AsyncHTTPClient against the local stand-in server"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.assertions import assert_status_code, assert_response_is_list
+from src.async_http_client import AsyncHTTPClient
+from src.config import Config
+from src.deadline import DeadlineExceeded, deadline
+from src.rate_limiter import RateGovernor
+
+
+def test_async_get_returns_response(stand_in_url):
+    """Test GET through AsyncHTTPClient returns parsed response and history"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+    response = client.run(client.get("/languages", headers={"X-API-Key": "secret"}))
+
+    assert_status_code(response, 200)
+    assert_response_is_list(response, min_length=1)
+    assert client.last_response is response
+    last = client.get_last_request()
+    assert last["method"] == "GET"
+    assert "X-API-Key" not in last["headers"]
+    assert last["response"]["status_code"] == 200
+
+
+def test_async_methods_send_body_and_params(stand_in_url):
+    """Test POST/PUT/DELETE pass json and params like the sync client"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+    async def scenario():
+        return await asyncio.gather(
+            client.post("/echo", json={"name": "task"}),
+            client.put("/echo", json={"name": "renamed"}, params={"x": "1"}),
+            client.delete("/echo", json={"ids": [1, 2]}),
+        )
+
+    post, put, delete = client.run(scenario())
+
+    assert post.json() == {"method": "POST", "path": "/echo", "query": {}, "body": {"name": "task"}}
+    assert put.json()["query"] == {"x": "1"}
+    assert delete.json()["body"] == {"ids": [1, 2]}
+    assert [entry["method"] for entry in client.request_history] == ["POST", "PUT", "DELETE"]
+
+
+def test_async_fan_out_runs_concurrently(stand_in_url):
+    """Test many in-flight requests overlap instead of running serially"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+    delay = 0.2
+    count = 50
+
+    async def scenario():
+        return await asyncio.gather(*[
+            client.get("/slow", params={"delay": delay}) for _ in range(count)
+        ])
+
+    started = time.perf_counter()
+    responses = client.run(scenario())
+    elapsed = time.perf_counter() - started
+
+    assert all(r.status_code == 200 for r in responses)
+    assert len(client.request_history) == count
+    assert all(entry["response"]["status_code"] == 200 for entry in client.request_history)
+    assert elapsed < delay * count / 5
+
+
+def test_async_client_reusable_across_event_loops(stand_in_url):
+    """Test one client instance works from consecutive asyncio.run calls"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+    first = client.run(client.get("/languages"))
+    second = asyncio.run(client.get("/languages"))
+    asyncio.run(client.aclose())
+
+    assert first.status_code == second.status_code == 200
+    assert len(client.request_history) == 2
+
+
+def test_async_requests_time_out(stand_in_url):
+    """Test a stalled server raises a timeout instead of hanging the test"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+    started = time.perf_counter()
+    with pytest.raises(httpx.ReadTimeout):
+        client.run(client.get("/slow", params={"delay": 1}, timeout=(1, 0.1)))
+    assert time.perf_counter() - started < 0.9
+    assert client._timeout_for("GET", "/timeLogs/getByProjectId") == (5, 60)
+    assert client._timeout_for("GET", "/slow") == (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+
+
+def test_async_requests_respect_deadline(stand_in_url):
+    """Test the deadline caps async request time and blocks later requests"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+    async def scenario():
+        with pytest.raises(httpx.TimeoutException):
+            await client.get("/slow", params={"delay": 1})
+        with pytest.raises(DeadlineExceeded):
+            await client.get("/languages")
+
+    started = time.perf_counter()
+    with deadline(0.2):
+        client.run(scenario())
+    assert time.perf_counter() - started < 0.9
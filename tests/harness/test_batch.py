@@ -0,0 +1,55 @@
+"""Tests for concurrent HTTPClient.batch"""
+import time
+
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+
+
+def _client(url):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1))
+
+
+def test_batch_returns_results_in_order(stand_in_url):
+    """Test responses come back in description order with timings"""
+    client = _client(stand_in_url)
+
+    results = client.batch([
+        {"method": "POST", "path": "/echo", "json": {"n": n}} for n in range(10)
+    ])
+
+    assert [r.response.json()["body"]["n"] for r in results] == list(range(10))
+    assert all(r.ok and r.elapsed > 0 for r in results)
+    assert len(client.request_history) == 10
+    assert client.last_response is results[-1].response
+
+
+def test_batch_runs_requests_concurrently(stand_in_url):
+    """Test slow requests overlap up to max_workers"""
+    client = _client(stand_in_url)
+    delay = 0.2
+
+    started = time.perf_counter()
+    results = client.batch(
+        # Distinct queries, so identical in-flight GETs are not coalesced
+        [{"method": "GET", "path": "/slow", "params": {"delay": delay, "n": i}} for i in range(8)],
+        max_workers=8,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert all(r.response.status_code == 200 for r in results)
+    assert elapsed < delay * 4
+
+
+def test_batch_captures_connection_errors():
+    """Test a failing request does not abort the rest of the batch"""
+    client = _client("http://127.0.0.1:9")
+
+    results = client.batch([{"method": "GET", "path": "/languages"}] * 2)
+
+    assert [r.ok for r in results] == [False, False]
+    assert all(r.response is None and r.error is not None for r in results)
+
+
+def test_empty_batch():
+    """Test empty batch returns no results"""
+    assert _client("http://127.0.0.1:9").batch([]) == []
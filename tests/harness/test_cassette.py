@@ -0,0 +1,108 @@
+"""Tests for record/replay cassettes"""
+import pytest
+
+from src.cassette import Cassette, CassetteMiss, cassette_name, match_key
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+from src.retry import RetryBudget, RetryPolicy
+
+UNREACHABLE_URL = "http://127.0.0.1:9"
+
+
+def _client(url, cassette, **kwargs):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), cassette=cassette, **kwargs)
+
+
+def test_match_key_ignores_param_order():
+    """Test requests differing only in query param order share a key"""
+    assert match_key("get", "http://x/a", {"b": 2, "a": 1}) == match_key("GET", "http://x/a", [("a", 1), ("b", 2)])
+    assert match_key("POST", "http://x/a", body={"n": 1}) != match_key("POST", "http://x/a", body={"n": 2})
+
+
+def test_cassette_name_is_file_system_safe():
+    """Test node IDs are turned into plain file names"""
+    assert cassette_name("tests/test_tasks.py::test_create[ru]") == "tests_test_tasks.py_test_create_ru.jsonl"
+
+
+def test_replay_serves_recorded_responses_offline(stand_in_server, stand_in_url, tmp_path):
+    """Test a recorded session replays without reaching the server"""
+    recorder = _client(stand_in_url, Cassette(str(tmp_path), "record", name="test_a"))
+    recorded_list = recorder.get("/languages")
+    recorded_post = recorder.post("/echo", json={"name": "Task"}, params={"projectId": 1})
+    hits = len(stand_in_server.received)
+
+    player = _client(UNREACHABLE_URL, Cassette(str(tmp_path), "replay", name="test_a"))
+    # Replayed responses keep the recorded URL, so the base URL must match
+    player.base_url = stand_in_url
+    replayed_list = player.get("/languages")
+    replayed_post = player.post("/echo", json={"name": "Task"}, params={"projectId": 1})
+
+    assert len(stand_in_server.received) == hits
+    assert replayed_list.status_code == 200
+    assert replayed_list.json() == recorded_list.json()
+    assert replayed_list.headers["Content-Type"] == "application/json"
+    assert replayed_post.json() == recorded_post.json()
+    assert player.get_last_request()["response"]["status_code"] == 200
+
+
+def test_identical_requests_replay_in_recorded_order(stand_in_server, stand_in_url, tmp_path):
+    """Test repeated requests replay successive recordings, then repeat the last"""
+    path = "/flaky?key=cassette-order&failures=1&status=500"
+    recorder = _client(stand_in_url, Cassette(str(tmp_path), "record", name="test_b"))
+    assert [recorder.get(path).status_code for _ in range(2)] == [500, 200]
+
+    player = _client(stand_in_url, Cassette(str(tmp_path), "replay", name="test_b"))
+    hits = len(stand_in_server.received)
+
+    assert [player.get(path).status_code for _ in range(3)] == [500, 200, 200]
+    assert len(stand_in_server.received) == hits
+
+
+def test_replayed_retries_do_not_sleep(stand_in_url, tmp_path):
+    """Test retries of a replayed exchange follow the recording without waiting"""
+    path = "/flaky?key=cassette-retry&failures=1&retry_after=5"
+    sleeps = []
+    policy = RetryPolicy(max_retries=2, budget=RetryBudget(0, 10), sleep=lambda s: None)
+    _client(stand_in_url, Cassette(str(tmp_path), "record", name="test_c"), retry_policy=policy).get(path)
+
+    policy = RetryPolicy(max_retries=2, budget=RetryBudget(0, 10), sleep=sleeps.append)
+    player = _client(stand_in_url, Cassette(str(tmp_path), "replay", name="test_c"), retry_policy=policy)
+
+    assert player.get(path).status_code == 200
+    assert player.get_last_request().retries == 1
+    assert sleeps == []
+
+
+def test_unrecorded_request_raises_miss(tmp_path):
+    """Test replay fails loudly for requests missing from the cassette"""
+    player = _client(UNREACHABLE_URL, Cassette(str(tmp_path), "replay", name="missing"))
+
+    with pytest.raises(CassetteMiss):
+        player.get("/languages")
+
+
+def test_batch_captures_misses_per_request(stand_in_url, tmp_path):
+    """Test a request missing from the cassette does not drop the other batch results"""
+    _client(stand_in_url, Cassette(str(tmp_path), "record", name="test_d")).get("/languages")
+    player = _client(UNREACHABLE_URL, Cassette(str(tmp_path), "replay", name="test_d"))
+    player.base_url = stand_in_url
+
+    recorded, missing = player.batch([
+        {"method": "GET", "path": "/languages"},
+        {"method": "GET", "path": "/colors"},
+    ])
+
+    assert recorded.response.status_code == 200 and recorded.error is None
+    assert missing.response is None
+    assert isinstance(missing.error, CassetteMiss)
+
+
+def test_use_switches_cassette_per_test(tmp_path):
+    """Test each test name gets its own cassette file"""
+    cassette = Cassette(str(tmp_path), "record", name="first")
+    cassette.record("GET http://x/a? ", 200, {}, b"[]", "utf-8", "http://x/a")
+    cassette.use("second")
+    cassette.record("GET http://x/a? ", 404, {}, b"{}", "utf-8", "http://x/a")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["first.jsonl", "second.jsonl"]
+    assert Cassette(str(tmp_path), "replay", name="first").play("GET http://x/a? ").status_code == 200
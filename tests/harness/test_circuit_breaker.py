@@ -0,0 +1,141 @@
+"""Tests for per-operation circuit breakers"""
+import time
+
+import pytest
+import requests
+
+from src.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers, CircuitOpenError
+from src.deadline import DeadlineExceeded, deadline
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+from src.retry import RetryBudget, RetryPolicy
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client(url, breakers, **kwargs):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), circuit_breakers=breakers, **kwargs)
+
+
+def test_breaker_opens_and_probes_after_cool_down():
+    """Test closed -> open -> half-open probe -> open/closed transitions"""
+    clock = FakeClock()
+    breaker = CircuitBreaker("getTimeLog", failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure("ReadTimeout")
+    breaker.allow()
+    breaker.record_failure("HTTP 503")
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError, match=r"getTimeLog after 2 consecutive failures \(last: HTTP 503\)"):
+        breaker.allow()
+
+    clock.now = 10
+    breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    breaker.record_failure("HTTP 503")
+    assert breaker.state == OPEN
+
+    clock.now = 20
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.rejected == 2
+
+
+def test_open_circuit_fails_fast_per_operation(stand_in_server, stand_in_url):
+    """Test a broken operation is rejected without traffic while others keep working"""
+    client = _client(stand_in_url, CircuitBreakers(failure_threshold=3, reset_timeout=60))
+    for _ in range(3):
+        assert client.get("/status/503").status_code == 503
+
+    with pytest.raises(CircuitOpenError):
+        client.get("/status/503")
+    assert stand_in_server.hits("/status/503") == 3
+    assert client.get("/languages").status_code == 200
+
+
+def test_application_errors_do_not_open_circuit(stand_in_url):
+    """Test 4xx and 500 answers are not counted as outages"""
+    breakers = CircuitBreakers(failure_threshold=2)
+    client = _client(stand_in_url, breakers)
+    for code in (400, 404, 500, 500):
+        client.get(f"/status/{code}")
+
+    assert breakers.open_circuits() == {}
+
+
+def test_connection_errors_open_circuit():
+    """Test unreachable hosts count as failures"""
+    breakers = CircuitBreakers(failure_threshold=1)
+    client = _client("http://127.0.0.1:9", breakers)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get("/languages")
+    with pytest.raises(CircuitOpenError):
+        client.get("/languages")
+    assert breakers.open_circuits()["getLanguages"].last_failure == "ConnectionError"
+
+
+def test_retries_stop_when_circuit_opens(stand_in_server, stand_in_url):
+    """Test retries do not multiply load on an operation whose circuit opened"""
+    policy = RetryPolicy(max_retries=5, budget=RetryBudget(0, 10), sleep=lambda s: None)
+    client = _client(stand_in_url, CircuitBreakers(failure_threshold=2), retry_policy=policy)
+
+    response = client.get("/flaky", params={"key": "circuit-retry", "failures": 10})
+
+    assert response.status_code == 503
+    assert stand_in_server.hits("/flaky") == 2
+
+
+def test_disabled_breakers_never_reject(stand_in_url):
+    """Test CIRCUIT_FAILURE_THRESHOLD=0 turns circuit breaking off"""
+    client = _client(stand_in_url, CircuitBreakers(failure_threshold=0))
+    for _ in range(3):
+        assert client.get("/status/503").status_code == 503
+
+
+def test_probe_without_outcome_releases_half_open(stand_in_server, stand_in_url):
+    """Test a probe cut short by the deadline lets the next request probe again"""
+    clock = FakeClock()
+    breakers = CircuitBreakers(failure_threshold=1, reset_timeout=10, clock=clock)
+    client = _client(stand_in_url, breakers)
+    params = {"key": "circuit-deadline", "failures": 1}
+    assert client.get("/flaky", params=params).status_code == 503
+
+    clock.now = 10
+    with deadline(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            client.get("/flaky", params=params)
+    assert breakers.get("GET /flaky").state == OPEN
+
+    assert client.get("/flaky", params=params).status_code == 200
+    assert breakers.get("GET /flaky").state == CLOSED
+    assert stand_in_server.hits("/flaky") == 2
+
+
+def test_stale_probe_is_replaced_after_cool_down():
+    """Test a probe never reported back does not keep the circuit half-open forever"""
+    clock = FakeClock()
+    breaker = CircuitBreaker("getTimeLog", failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure("ReadTimeout")
+
+    clock.now = 10
+    assert breaker.allow() is True
+    clock.now = 15
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    clock.now = 20
+    assert breaker.allow() is True
+    assert breaker.state == HALF_OPEN
@@ -0,0 +1,73 @@
+"""Tests for compressed transfer and streaming decode of list responses"""
+import json
+
+import pytest
+import requests
+
+from src.http_client import HTTPClient
+from src.json_codec import iter_json_array
+from src.rate_limiter import RateGovernor
+from src.transport import accept_encoding
+
+
+def _client(url):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1))
+
+
+def test_compression_is_negotiated_and_sizes_reported(stand_in_server, stand_in_url):
+    """Test gzip bodies are decoded and both sizes land in history"""
+    client = _client(stand_in_url)
+
+    response = client.get("/items", params={"count": 1000})
+
+    assert "gzip" in stand_in_server.received[-1]["headers"]["Accept-Encoding"]
+    assert len(response.json()) == 1000
+    record = client.get_last_request()
+    assert record.bytes_received == len(response.content)
+    assert 0 < record.bytes_transferred < record.bytes_received / 3
+    assert record.to_dict()["bytes_transferred"] == record.bytes_transferred
+
+
+def test_accept_encoding_setting():
+    """Test auto lists the installed decoders and explicit values pass through"""
+    assert accept_encoding("auto").split(", ")[:2] == ["gzip", "deflate"]
+    assert accept_encoding("identity") == "identity"
+
+
+def test_streamed_list_is_decoded_item_by_item(stand_in_url):
+    """Test stream=True leaves the body unread until items are iterated"""
+    client = _client(stand_in_url)
+
+    response = client.get("/items", params={"count": 5000}, stream=True)
+
+    assert response._content is False
+    assert client.get_last_request()["response"]["body"] is None
+    items = response.iter_items(chunk_size=1024)
+    assert next(items) == {"id": 0, "name": "Item 0", "done": True}
+    assert sum(1 for _ in items) == 4999
+    assert response._content is False
+
+
+def test_array_decoding_across_chunk_boundaries():
+    """Test items split at any byte, including inside numbers and UTF-8 characters"""
+    data = [{"id": 1234567, "text": "Задача ✓", "tags": [1, [2.5e3]], "none": None}, 98765, "]", []]
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    for size in (1, 2, 5, 64):
+        chunks = [body[i:i + size] for i in range(0, len(body), size)]
+        assert list(iter_json_array(chunks)) == data
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b"[1, 2", b"[1 2]", b"[1,]", b"[] []"])
+def test_malformed_arrays_raise(body):
+    """Test bodies that are not a single well-formed array are rejected"""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([body]))
+
+
+def test_iter_items_reports_requests_decode_error(stand_in_url):
+    """Test non-array bodies raise the same error type as response.json()"""
+    response = _client(stand_in_url).get("/echo", stream=True)
+
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        list(response.iter_items())
@@ -0,0 +1,85 @@
+"""Tests for lazy configuration loading and profiles"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import src.config
+from src.config import Config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def env_files(tmp_path):
+    """Point config at .env files in a temporary directory and reset it afterwards."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(src.config, "_find_env_file", lambda name: str(tmp_path / name) if (tmp_path / name).exists() else None)
+        for name in ("CONFIG_PROFILE", "BASE_URL", "RATE_LIMIT_RPS", "HTTP_POOL_MAXSIZE", "BATCH_MAX_WORKERS"):
+            mp.delenv(name, raising=False)
+        yield tmp_path, mp
+    Config.reload()
+
+
+def test_import_has_no_side_effects():
+    """Test importing the clients reads no .env, prints nothing and leaves os.environ alone"""
+    code = (
+        "import os, sys; before = dict(os.environ); "
+        "import src.http_client, src.async_http_client, src.assertions; "
+        "print('dotenv' in sys.modules, 'asyncio' in sys.modules and 'src.async_http_client' in sys.modules, "
+        "dict(os.environ) == before)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout == "False True True\n"
+    assert result.stderr == ""
+
+
+def test_import_time_within_budget():
+    """Test src's own modules import within the budget of scripts/bench_import.py"""
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "scripts", "bench_import.py"), "--budget-ms", "50"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_settings_are_read_once_until_reload(env_files):
+    """Test values are cached on first access and refreshed by reload()"""
+    _, mp = env_files
+    mp.setenv("RATE_LIMIT_RPS", "7")
+    Config.reload()
+    assert Config.RATE_LIMIT_RPS == 7.0
+
+    mp.setenv("RATE_LIMIT_RPS", "9")
+    assert Config.RATE_LIMIT_RPS == 7.0
+    Config.reload()
+    assert Config.RATE_LIMIT_RPS == 9.0
+
+
+def test_profile_layers_over_env_file(env_files):
+    """Test process env > .env.<profile> > built-in profile > .env, and empty values fall back to defaults"""
+    tmp_path, mp = env_files
+    (tmp_path / ".env").write_text("BASE_URL=https://base\nRATE_LIMIT_RPS=1\nHTTP_POOL_MAXSIZE=\nBATCH_MAX_WORKERS=12\n")
+    (tmp_path / ".env.staging").write_text("BASE_URL=https://staging\n")
+    mp.setenv("RATE_LIMIT_RPS", "3")
+
+    Config.reload("staging")
+    assert (Config.CONFIG_PROFILE, Config.BASE_URL, Config.RATE_LIMIT_RPS) == ("staging", "https://staging", 3.0)
+    assert Config.HTTP_POOL_MAXSIZE == 12
+
+    Config.reload("local")
+    assert Config.BASE_URL == "http://127.0.0.1:8765"
+    assert Config.API_KEY == "stand-in"
+
+    mp.setenv("CONFIG_PROFILE", "staging")
+    Config.reload()
+    assert Config.BASE_URL == "https://staging"
+
+
+def test_unknown_profile_is_rejected(env_files):
+    """Test a profile without built-in defaults or .env file fails loudly"""
+    with pytest.raises(ValueError, match="Unknown config profile: 'qa'"):
+        Config.reload("qa")
@@ -0,0 +1,53 @@
+"""Tests for connection pool sizing, reuse stats and warm-up"""
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+
+
+def _client(url, **kwargs):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), **kwargs)
+
+
+def test_sequential_requests_reuse_one_connection(stand_in_url):
+    """Test keep-alive reuse is counted per session"""
+    client = _client(stand_in_url)
+    for _ in range(5):
+        client.get("/languages")
+
+    assert client.connection_stats() == {
+        "requests": 5,
+        "connections_opened": 1,
+        "connections_warmed": 0,
+        "reused": 4,
+    }
+
+
+def test_warm_up_serves_concurrent_batch_without_new_connections(stand_in_url):
+    """Test a warmed pool covers a batch as wide as the pool"""
+    client = _client(stand_in_url, pool_maxsize=4)
+
+    assert client.warm_up(4) == 4
+    results = client.batch(
+        [{"method": "GET", "path": "/slow", "params": {"delay": 0.1, "n": i}} for i in range(4)],
+        max_workers=4,
+    )
+
+    assert all(result.ok for result in results)
+    stats = client.connection_stats()
+    assert stats["connections_warmed"] == 4
+    assert stats["connections_opened"] == 0
+    assert client.get_last_request().connect_time == 0
+
+
+def test_warm_up_is_capped_at_pool_size(stand_in_url):
+    """Test warm-up never opens connections the pool would discard"""
+    client = _client(stand_in_url, pool_maxsize=2)
+
+    assert client.warm_up(10) == 2
+
+
+def test_warm_up_failure_is_not_raised():
+    """Test unreachable hosts leave warm-up a no-op"""
+    client = _client("http://127.0.0.1:9")
+
+    assert client.warm_up(2) == 0
+    assert client.warm_up(0) == 0
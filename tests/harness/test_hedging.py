@@ -0,0 +1,87 @@
+"""Tests for hedged GET requests"""
+import time
+import uuid
+
+from src.hedging import HedgePolicy
+from src.http_client import HTTPClient
+from src.metrics import LatencyStats
+from src.rate_limiter import RateGovernor
+from src.retry import RetryBudget
+
+
+def _stats(operation, ttfb=0.05, samples=20):
+    stats = LatencyStats()
+    for _ in range(samples):
+        stats.record(operation, {"ttfb": ttfb})
+    return stats
+
+
+def _client(url, policy, stats):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), hedge_policy=policy, latency_stats=stats)
+
+
+def _policy(ratio=1.0, **kwargs):
+    return HedgePolicy(budget=RetryBudget(ratio, min_retries=0), **kwargs)
+
+
+def test_slow_get_is_hedged_and_duplicate_wins(stand_in_server, stand_in_url):
+    """Test a GET slower than p95 is duplicated and the faster answer returned"""
+    policy = _policy()
+    client = _client(stand_in_url, policy, _stats("GET /lagging"))
+
+    started = time.monotonic()
+    response = client.get("/lagging", params={"key": uuid.uuid4().hex, "delay": 1})
+
+    assert time.monotonic() - started < 0.5
+    assert response.json()["call"] == 2
+    assert client.get_last_request().hedged
+    assert (policy.hedges, policy.wins) == (1, 1)
+    assert stand_in_server.hits("/lagging") == 2
+
+
+def test_fast_get_is_not_hedged(stand_in_server, stand_in_url):
+    """Test responses within the hedge delay send no duplicate"""
+    policy = _policy()
+    client = _client(stand_in_url, policy, _stats("getLanguages", ttfb=0.5))
+
+    client.get("/languages")
+
+    assert not client.get_last_request().hedged
+    assert stand_in_server.hits("/languages") == 1
+
+
+def test_no_hedging_without_enough_samples_or_budget(stand_in_server, stand_in_url):
+    """Test hedging waits for min_samples and stops when the budget is spent"""
+    unknown = _client(stand_in_url, _policy(), _stats("GET /lagging", samples=5))
+    unknown.get("/lagging", params={"key": uuid.uuid4().hex, "delay": 0.2})
+    broke = _client(stand_in_url, _policy(ratio=0), _stats("GET /lagging"))
+    broke.get("/lagging", params={"key": uuid.uuid4().hex, "delay": 0.2})
+
+    assert not unknown.get_last_request().hedged
+    assert not broke.get_last_request().hedged
+    assert stand_in_server.hits("/lagging") == 2
+
+
+def test_post_is_never_hedged(stand_in_server, stand_in_url):
+    """Test non-idempotent requests are sent once"""
+    policy = _policy(min_samples=0)
+    client = _client(stand_in_url, policy, _stats("POST /lagging", ttfb=0))
+
+    client.post("/lagging", params={"key": uuid.uuid4().hex, "delay": 0.2})
+
+    assert policy.hedges == 0
+    assert stand_in_server.hits("/lagging") == 1
+
+
+def test_close_stops_hedge_worker_threads(stand_in_url):
+    """Test hedging worker threads end with the client instead of leaking"""
+    with _client(stand_in_url, _policy(), _stats("getLanguages", ttfb=0.5)) as client:
+        client.get("/languages")
+        workers = list(client._hedge_executor._threads)
+    assert workers
+    for thread in workers:
+        thread.join(timeout=1)
+
+    assert client._hedge_executor is None
+    assert not any(thread.is_alive() for thread in workers)
+
@@ -0,0 +1,99 @@
+"""Tests for the bounded request history"""
+import json
+
+import src.history
+from src.history import ExchangeRecord, RequestHistory
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+
+
+def _record(index):
+    return ExchangeRecord(method="GET", url=f"https://example.test/tasks/{index}")
+
+
+def test_history_keeps_only_most_recent_records():
+    """Test ring buffer evicts oldest records once capacity is reached"""
+    history = RequestHistory(capacity=3)
+    for index in range(10):
+        history.append(_record(index))
+
+    assert len(history) == 3
+    assert [record.url[-1] for record in history] == ["7", "8", "9"]
+    assert history[-1] is history.last()
+    assert [record.url[-1] for record in history[:2]] == ["7", "8"]
+
+
+def test_history_spills_evicted_records(tmp_path):
+    """Test evicted records are appended to the spill file as JSON lines"""
+    spill = tmp_path / "history.jsonl"
+    history = RequestHistory(capacity=2, spill_path=str(spill))
+    for index in range(5):
+        record = _record(index)
+        record.record_response(200, {"Content-Type": "application/json"}, '{"status": "ok"}')
+        history.append(record)
+
+    lines = [json.loads(line) for line in spill.read_text().splitlines()]
+    assert history.spilled == 3
+    assert [line["url"][-1] for line in lines] == ["0", "1", "2"]
+    assert lines[0]["response"]["status_code"] == 200
+
+
+def test_spill_file_is_opened_once(tmp_path, monkeypatch):
+    """Test evictions append through one open handle until close()"""
+    opened = []
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return open(*args, **kwargs)
+
+    monkeypatch.setattr(src.history, "open", counting_open, raising=False)
+    spill = tmp_path / "history.jsonl"
+    history = RequestHistory(capacity=1, spill_path=str(spill))
+    for index in range(50):
+        history.append(_record(index))
+
+    assert len(opened) == 1
+    assert len(spill.read_text().splitlines()) == 49
+
+    history.close()
+    history.append(_record(50))
+    history.close()
+    assert len(opened) == 2
+    assert len(spill.read_text().splitlines()) == 50
+
+
+def test_exchange_record_is_compact_and_dict_compatible():
+    """Test record keeps legacy key access and drops unneeded headers"""
+    record = ExchangeRecord(method="POST", url="https://example.test/tasks", body={"name": "x"})
+
+    assert record["response"] is None
+    assert record.get("missing", "default") == "default"
+
+    record.record_response(
+        201,
+        {"Content-Type": "application/json", "Set-Cookie": "a=b", "Server": "nginx"},
+        "x" * 2000,
+    )
+
+    assert record["response"]["status_code"] == 201
+    assert record["response"]["headers"] == {"Content-Type": "application/json"}
+    assert len(record["response"]["body"]) == 500
+    assert record.get("body") == {"name": "x"}
+    assert not hasattr(record, "__dict__")
+
+
+def test_http_client_history_is_bounded(stand_in_url):
+    """Test HTTPClient keeps a bounded history and get_last_request works"""
+    client = HTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), history_size=5)
+
+    for _ in range(12):
+        client.get("/languages", headers={"X-API-Key": "secret"})
+
+    assert len(client.request_history) == 5
+    last = client.get_last_request()
+    assert last["response"]["status_code"] == 200
+    assert "X-API-Key" not in last["headers"]
+    assert last.to_dict()["url"] == f"{stand_in_url}/languages"
+
+    client.clear_history()
+    assert client.get_last_request() is None
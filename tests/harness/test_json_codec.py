@@ -0,0 +1,91 @@
+"""Tests for the pluggable JSON codec and memoized response bodies"""
+import json
+
+import pytest
+import requests
+
+from src.assertions import assert_response_has_keys, assert_response_is_list
+from src.http_client import HTTPClient
+from src.json_codec import CODECS, JSONResponse, get_codec, set_codec
+from src.rate_limiter import RateGovernor
+
+
+class CountingCodec:
+    """Stdlib codec counting decodes."""
+
+    name = 'counting'
+
+    def __init__(self):
+        self.loads_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return json.loads(data)
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode('utf-8')
+
+
+@pytest.fixture
+def codec():
+    """Install a counting codec for one test."""
+    previous = get_codec()
+    counting = CountingCodec()
+    set_codec(counting)
+    yield counting
+    set_codec(previous)
+
+
+def _client(url):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1))
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_codecs_round_trip(name):
+    """Test every installed codec encodes and decodes the same data"""
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    data = {"id": 1, "name": "Задача", "tags": [1.5, None, True]}
+
+    assert codec.loads(codec.dumps(data)) == data
+    assert json.loads(codec.dumps(data)) == data
+
+
+def test_unknown_codec_is_rejected():
+    """Test a misspelled JSON_CODEC fails loudly"""
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("simdjson")
+
+
+def test_response_body_is_parsed_once(stand_in_url, codec):
+    """Test json() and the assertion helpers share one decode per response"""
+    response = _client(stand_in_url).get("/languages")
+
+    assert isinstance(response, JSONResponse)
+    assert response.json() is response.json()
+    assert_response_is_list(response, min_length=2)
+    assert response.json()[1]["name"] == "Русский"
+    assert codec.loads_calls == 1
+
+
+def test_request_body_is_encoded_with_codec(stand_in_url, codec):
+    """Test json= bodies are serialized by the configured codec"""
+    client = _client(stand_in_url)
+    response = client.post("/echo", json={"name": "Task", "ids": [1, 2]})
+
+    assert response.json()["body"] == {"name": "Task", "ids": [1, 2]}
+    assert client.get_last_request().body == {"name": "Task", "ids": [1, 2]}
+    assert response.request.headers["Content-Type"] == "application/json"
+
+
+def test_invalid_json_raises_requests_error(stand_in_url):
+    """Test decode errors keep the requests/json exception types"""
+    response = _client(stand_in_url).get("/languages")
+    response._content = b"<html>"
+
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        response.json()
+    with pytest.raises(AssertionError, match="not valid JSON"):
+        assert_response_has_keys(response, ["id"])
@@ -0,0 +1,107 @@
+"""Tests for the API key pool"""
+import pytest
+
+from src.async_http_client import AsyncHTTPClient
+from src.config import Config
+from src.http_client import HTTPClient
+from src.key_pool import LEAST_LOADED, APIKeyPool
+from src.rate_limiter import RateGovernor
+from src.response_cache import auth_identity
+
+# Requests sent with any pooled key are spread over the pool
+POOLED = {"X-API-Key": "a"}
+
+
+def _sent_keys(server):
+    return [entry["headers"].get("X-API-Key") for entry in server.received]
+
+
+def test_round_robin_spreads_requests(stand_in_server, stand_in_url):
+    """Test pooled requests rotate over the keys"""
+    pool = APIKeyPool(["a", "b", "c", "a"])
+    client = HTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), key_pool=pool)
+
+    for _ in range(6):
+        client.get("/languages", headers=POOLED)
+
+    assert _sent_keys(stand_in_server) == ["a", "b", "c", "a", "b", "c"]
+    assert pool.stats()[auth_identity("b")] == {"requests": 2, "in_flight": 0}
+    assert "X-API-Key" not in client.get_last_request()["headers"]
+
+
+def test_auth_headers_carry_a_real_pooled_key(stand_in_server, stand_in_url, monkeypatch):
+    """Test auth headers hold the first configured key, spread by clients over the pool"""
+    monkeypatch.setenv("API_KEYS", "a,b")
+    Config.reload()
+    try:
+        headers = Config.get_auth_headers()
+    finally:
+        monkeypatch.undo()
+        Config.reload()
+    client = HTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), key_pool=APIKeyPool(["a", "b"]))
+
+    client.get("/languages", headers=headers)
+    client.get("/languages", headers=headers)
+
+    assert headers["X-API-Key"] == "a"
+    assert _sent_keys(stand_in_server) == ["a", "b"]
+
+
+def test_explicit_and_missing_keys_are_untouched(stand_in_server, stand_in_url):
+    """Test auth-negative requests keep their own headers"""
+    pool = APIKeyPool(["a", "b"])
+    client = HTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), key_pool=pool)
+
+    client.get("/languages", headers={"X-API-Key": "invalid"})
+    client.get("/languages", headers={"Accept": "application/json"})
+
+    assert _sent_keys(stand_in_server) == ["invalid", None]
+    assert sum(usage["requests"] for usage in pool.stats().values()) == 0
+
+
+def test_least_loaded_picks_idle_key():
+    """Test the key with fewest requests in flight is taken"""
+    pool = APIKeyPool(["a", "b", "c"], strategy=LEAST_LOADED)
+
+    held = [pool.acquire(), pool.acquire()]
+    pool.release(held[0])
+
+    assert held == ["a", "b"]
+    # Ties on in-flight requests go to the key used least
+    assert pool.acquire() == "c"
+    assert pool.acquire() == "a"
+
+
+def test_throttling_is_per_key(stand_in_url):
+    """Test each pooled key has its own rate budget"""
+    sleeps = []
+    governor = RateGovernor(1, 1, sleep=sleeps.append)
+    pool = APIKeyPool(["a", "b"])
+    client = HTTPClient(base_url=stand_in_url, rate_governor=governor, key_pool=pool)
+
+    client.batch([{"method": "GET", "path": "/languages", "headers": POOLED}] * 2)
+    assert sleeps == []
+
+    client.get("/languages", headers=POOLED)
+    stats = pool.stats(governor)
+    assert len(sleeps) == 1
+    assert stats[auth_identity("a")]["throttled_requests"] == 1
+    assert stats[auth_identity("b")]["throttled_requests"] == 0
+
+
+def test_async_client_uses_pool(stand_in_server, stand_in_url):
+    """Test AsyncHTTPClient spreads pooled requests too"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), key_pool=APIKeyPool(["a", "b"]))
+
+    client.run(client.get("/languages", headers=POOLED))
+    client.run(client.get("/languages", headers=POOLED))
+
+    assert _sent_keys(stand_in_server) == ["a", "b"]
+
+
+def test_pool_rejects_bad_configuration():
+    """Test empty pools and unknown strategies are refused"""
+    with pytest.raises(ValueError):
+        APIKeyPool(["", ""])
+    with pytest.raises(ValueError, match="Unknown key pool strategy"):
+        APIKeyPool(["a"], strategy="random")
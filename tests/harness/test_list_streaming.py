@@ -0,0 +1,61 @@
+"""Tests for streaming item iteration over list endpoints"""
+import json
+
+import pytest
+import requests
+
+from src.assertions import assert_stream_is_list
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+
+
+def _client(url):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1))
+
+
+def test_iter_items_counts_and_validates_in_one_pass(stand_in_url):
+    """Test items are validated as they stream and sizes land in history"""
+    client = _client(stand_in_url)
+
+    count = assert_stream_is_list(
+        client.iter_items("/items", params={"count": 20000}, chunk_size=4096),
+        min_length=20000,
+        item_keys=["id", "name"],
+    )
+
+    assert count == 20000
+    record = client.get_last_request()
+    assert record.status_code == 200
+    assert record.bytes_received == len(json.dumps(
+        [{"id": i, "name": f"Item {i}", "done": i % 2 == 0} for i in range(20000)]
+    ))
+    assert 0 < record.bytes_transferred < record.bytes_received
+
+
+def test_abandoned_iteration_releases_connection(stand_in_url):
+    """Test closing the iterator early frees the connection for later requests"""
+    client = _client(stand_in_url)
+
+    items = client.iter_items("/items", params={"count": 50000})
+    assert next(items)["id"] == 0
+    items.close()
+
+    assert client.get("/languages").status_code == 200
+
+
+def test_iter_items_raises_for_error_status(stand_in_url):
+    """Test error responses are not mistaken for empty lists"""
+    with pytest.raises(requests.HTTPError):
+        list(_client(stand_in_url).iter_items("/status/404"))
+
+
+def test_stream_assertion_failures(stand_in_url):
+    """Test missing keys, short lists and non-list bodies fail the assertion"""
+    client = _client(stand_in_url)
+
+    with pytest.raises(AssertionError, match=r"Missing keys at root\[0\]: \['title'\]"):
+        assert_stream_is_list(client.iter_items("/items", params={"count": 3}), item_keys=["title"])
+    with pytest.raises(AssertionError, match="Expected at least 4 items, got 3"):
+        assert_stream_is_list(client.get("/items", params={"count": 3}, stream=True), min_length=4)
+    with pytest.raises(AssertionError, match="not a valid JSON list"):
+        assert_stream_is_list(client.get("/echo", stream=True))
@@ -0,0 +1,136 @@
+"""Tests for queue-based, lazily formatted HTTP client logging"""
+import logging
+import threading
+
+import pytest
+import requests
+
+from src.history import ExchangeRecord
+from src.http_client import HTTPClient
+from src.logging_setup import RootHandler, configure_logging, flush_logging
+from src.rate_limiter import RateGovernor
+
+
+class ListHandler(logging.Handler):
+    """Collect formatted messages and the threads that formatted them."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+class CountingResponse(requests.Response):
+    """Response counting full-body decodes."""
+
+    decodes = 0
+
+    @property
+    def text(self):
+        CountingResponse.decodes += 1
+        return super().text
+
+
+@pytest.fixture
+def package_logger():
+    """Restore `src` logger configuration after the test."""
+    logger = logging.getLogger("src")
+    saved = (list(logger.handlers), logger.level, logger.propagate)
+    yield logger
+    logger.handlers[:] = saved[0]
+    logger.setLevel(saved[1])
+    logger.propagate = saved[2]
+
+
+def _response(status_code, body):
+    response = CountingResponse()
+    response.status_code = status_code
+    response._content = body.encode("utf-8")
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    CountingResponse.decodes = 0
+    return response
+
+
+def test_records_are_formatted_on_listener_thread(package_logger, stand_in_url):
+    """Test request thread only enqueues; listener formats and writes"""
+    handler = ListHandler()
+    listener = configure_logging(level="INFO", handlers=[handler])
+    client = HTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+    client.get("/languages")
+    listener.stop()
+
+    assert handler.messages == [
+        f"INFO:src.http_client:GET {stand_in_url}/languages",
+        "INFO:src.http_client:Response status: 200",
+    ]
+    assert threading.get_ident() not in handler.threads
+
+
+def test_records_reach_pytest_log_capture(package_logger, stand_in_url, caplog):
+    """Test root handlers such as caplog get the records from the listener thread"""
+    root_handler = ListHandler()
+    logging.getLogger().addHandler(root_handler)
+    try:
+        listener = configure_logging(level="INFO")
+        client = HTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+        client.get("/languages")
+        flush_logging()
+
+        assert [(r.name, r.getMessage()) for r in caplog.records] == [
+            ("src.http_client", f"GET {stand_in_url}/languages"),
+            ("src.http_client", "Response status: 200"),
+        ]
+        listener.stop()
+    finally:
+        logging.getLogger().removeHandler(root_handler)
+
+    assert len(root_handler.messages) == 2
+    assert threading.get_ident() not in root_handler.threads
+
+
+def test_root_handlers_are_reached_through_the_listener_only(package_logger, caplog):
+    """Test records do not propagate, so root handlers never run on the request thread"""
+    listener = configure_logging(level="INFO")
+    listener.stop()
+
+    assert not package_logger.propagate
+    assert [type(handler) for handler in listener.handlers] == [RootHandler]
+
+
+def test_success_body_is_not_decoded_unless_debug(package_logger):
+    """Test large success bodies are never fully decoded below DEBUG"""
+    listener = configure_logging(level="INFO", handlers=[ListHandler()])
+    client = HTTPClient(base_url="http://stand-in", rate_governor=RateGovernor(0, 1))
+    record = ExchangeRecord("GET", "http://stand-in/comments")
+    response = _response(200, '[' + ','.join(['{"id": 1}'] * 10000) + ']')
+
+    client._log_response(record, response)
+    listener.stop()
+
+    assert CountingResponse.decodes == 0
+    assert len(record["response"]["body"]) == 500
+
+
+def test_error_body_logged_once_when_error_enabled(package_logger):
+    """Test error bodies are decoded once, and not at all when errors are muted"""
+    handler = ListHandler()
+    listener = configure_logging(level="ERROR", handlers=[handler])
+    client = HTTPClient(base_url="http://stand-in", rate_governor=RateGovernor(0, 1))
+
+    client._log_response(ExchangeRecord("GET", "x"), _response(404, '{"status": "error"}'))
+    assert CountingResponse.decodes == 1
+
+    package_logger.setLevel(logging.CRITICAL)
+    client._log_response(ExchangeRecord("GET", "x"), _response(404, '{"status": "error"}'))
+    assert CountingResponse.decodes == 0
+
+    listener.stop()
+    assert handler.messages == ['ERROR:src.http_client:Response body: {"status": "error"}']
@@ -0,0 +1,79 @@
+"""Tests for request timings and latency histograms"""
+import random
+
+import pytest
+
+from src.http_client import HTTPClient
+from src.json_codec import get_codec
+from src.metrics import LatencyHistogram, LatencyStats
+from src.rate_limiter import RateGovernor
+
+
+def _client(url, stats):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), latency_stats=stats)
+
+
+def test_histogram_percentiles_within_relative_error():
+    """Test percentiles stay within 1% across several orders of magnitude"""
+    rng = random.Random(7)
+    values = sorted(rng.uniform(0.0001, 30.0) for _ in range(5000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    assert histogram.count == 5000
+    for percent in (50, 90, 99, 99.9):
+        exact = values[int(-(-percent * len(values) // 100)) - 1]
+        assert histogram.percentile(percent) == pytest.approx(exact, rel=0.01)
+    assert histogram.percentile(100) == pytest.approx(values[-1], abs=1e-6)
+    assert histogram.percentile(0) == pytest.approx(values[0], rel=0.01)
+
+
+def test_histogram_merge_and_round_trip(tmp_path):
+    """Test stats from several workers merge after a dump/load round trip"""
+    first, second = LatencyStats(), LatencyStats()
+    for i in range(100):
+        first.record("getTasks", {"total": 0.010 + i / 1e4})
+        second.record("getTasks", {"total": 0.500})
+    path = tmp_path / "latency.json"
+    second.dump(str(path))
+
+    first.merge(LatencyStats.load(str(path)))
+    merged = first.histogram("getTasks")
+
+    assert merged.count == 200
+    assert merged.percentile(99) == pytest.approx(0.5, rel=0.01)
+    assert first.summary()["getTasks"]["total"]["max_ms"] == 500.0
+
+
+def test_exchange_carries_timing_breakdown(stand_in_url):
+    """Test connect, TTFB, total and byte counts are recorded per exchange"""
+    client = _client(stand_in_url, LatencyStats())
+
+    client.post("/echo", json={"name": "Task"})
+    first = client.get_last_request()
+    client.get("/slow", params={"delay": 0.05})
+    second = client.get_last_request()
+
+    assert first.connect_time > 0
+    assert first.bytes_sent == len(get_codec().dumps({"name": "Task"}))
+    assert first.bytes_received > 0
+    # Keep-alive: the second request reuses the connection
+    assert second.connect_time == 0
+    assert second.ttfb >= 0.05
+    assert second.total_time >= second.ttfb
+    assert second.to_dict()["timings"]["total"] == second.total_time
+
+
+def test_client_keeps_histograms_per_operation(stand_in_url):
+    """Test latencies are grouped by operationId, unknown paths by method and path"""
+    stats = LatencyStats()
+    client = _client(stand_in_url, stats)
+    for _ in range(3):
+        client.get("/languages")
+    client.get("/echo?x=1")
+
+    assert list(stats.operations()) == ["GET /echo", "getLanguages"]
+    assert stats.histogram("getLanguages").count == 3
+    assert stats.histogram("getLanguages", "ttfb").count == 3
+    assert stats.slowest(limit=1)[0][0] in ("GET /echo", "getLanguages")
@@ -0,0 +1,77 @@
+"""Tests for request payloads generated from api_spec.json"""
+import time
+
+import pytest
+from jsonschema import Draft7Validator
+
+from src.payloads import PayloadGenerator
+from src.spec_loader import get_default_spec_loader
+
+
+def _operations_with_body():
+    spec = get_default_spec_loader()
+    return [ep["operationId"] for ep in spec.get_endpoints() if spec.get_body_schema(ep["operationId"])]
+
+
+def test_same_seed_gives_same_payloads():
+    """Test generation is deterministic per seed"""
+    first = list(PayloadGenerator(seed=3).bodies("updateTask", 50))
+
+    assert list(PayloadGenerator(seed=3).bodies("updateTask", 50)) == first
+    assert list(PayloadGenerator(seed=4).bodies("updateTask", 50)) != first
+
+
+@pytest.mark.parametrize("operation_id", _operations_with_body())
+def test_valid_bodies_match_schema(operation_id):
+    """Test generated bodies satisfy the body schema of every operation"""
+    validator = Draft7Validator(get_default_spec_loader().get_body_schema(operation_id))
+
+    for body in PayloadGenerator(seed=1).bodies(operation_id, 200):
+        assert not list(validator.iter_errors(body)), body
+
+
+def test_enums_and_bounds_are_honored():
+    """Test task status/priority stay in their enums and progress/color in their bounds"""
+    bodies = list(PayloadGenerator(seed=5, optional_rate=1).bodies("updateTask", 500))
+
+    assert {body["status"] for body in bodies} == {1, 2, 3, 4}
+    assert {body["priority"] for body in bodies} == {1, 2, 3, 4, 5}
+    assert all(0 <= body["progress"] <= 1 for body in bodies)
+    assert all(1 <= body["color"] <= 18 for body in bodies)
+
+
+@pytest.mark.parametrize("operation_id", _operations_with_body())
+def test_invalid_bodies_break_the_schema(operation_id):
+    """Test every deliberately invalid body is rejected by the schema"""
+    validator = Draft7Validator(get_default_spec_loader().get_body_schema(operation_id))
+
+    for description, body in PayloadGenerator(seed=2).invalid_bodies(operation_id):
+        assert list(validator.iter_errors(body)), description
+
+
+def test_invalid_bodies_cover_each_rule():
+    """Test invalid bodies break required fields, types, enums and bounds"""
+    generator = PayloadGenerator(seed=0)
+    descriptions = [description for description, _ in generator.invalid_bodies("updateTask")]
+
+    assert "'status' is not one of [1, 2, 3, 4]" in descriptions
+    assert "'progress' is below the minimum of 0" in descriptions
+    assert "'progress' is above the maximum of 1" in descriptions
+    assert "'name' is not of type string" in descriptions
+    assert [d for d, _ in generator.invalid_bodies("addCommentToTask")][:3] == [
+        "missing required field 'taskId'", "missing required field 'userId'", "missing required field 'content'",
+    ]
+    description, _ = generator.invalid_body("addCommentToTask")
+    assert description in [d for d, _ in generator.invalid_bodies("addCommentToTask")]
+    with pytest.raises(ValueError, match="has no request body"):
+        generator.body("getColors")
+
+
+def test_thousands_of_payloads_per_second():
+    """Test generation is fast enough to feed load and fuzz runs"""
+    generator = PayloadGenerator(seed=0)
+
+    started = time.perf_counter()
+    for _ in generator.bodies("updateTask", 5000):
+        pass
+    assert time.perf_counter() - started < 1
@@ -0,0 +1,154 @@
+"""Tests for the client-side rate governor"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.async_http_client import AsyncHTTPClient
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    """Test bucket lets burst through and then asks callers to wait"""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_governor_keeps_separate_budget_per_key():
+    """Test exhausting one API key does not throttle another"""
+    waits = []
+    governor = RateGovernor(rate=1, burst=1, sleep=waits.append)
+
+    assert governor.acquire("key-a") == 0.0
+    assert governor.acquire("key-b") == 0.0
+    assert governor.acquire("key-a") > 0.9
+    assert len(waits) == 1
+
+    stats = governor.stats()
+    assert stats["requests"] == 3
+    assert stats["throttled_requests"] == 1
+    assert stats["throttled_seconds"] > 0.9
+
+
+def test_disabled_governor_never_waits():
+    """Test zero rate disables throttling"""
+    governor = RateGovernor(rate=0, burst=1)
+
+    assert all(governor.acquire("key") == 0.0 for _ in range(100))
+    assert governor.stats()["requests"] == 0
+
+
+def test_http_client_records_throttle_time(stand_in_url):
+    """Test HTTPClient waits only after the burst and records wait per request"""
+    client = HTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(rate=5, burst=2))
+    headers = {"X-API-Key": "key"}
+
+    started = time.perf_counter()
+    for _ in range(4):
+        client.get("/languages", headers=headers)
+    elapsed = time.perf_counter() - started
+
+    throttled = [entry["throttled"] for entry in client.request_history]
+    assert throttled[:2] == [0.0, 0.0]
+    assert all(wait > 0 for wait in throttled[2:])
+    assert elapsed >= 0.35
+
+
+def test_async_client_shares_governor_budget(stand_in_url):
+    """Test async requests draw from the same budget without blocking the loop"""
+    governor = RateGovernor(rate=10, burst=5)
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=governor)
+
+    async def scenario():
+        return await asyncio.gather(*[client.get("/languages") for _ in range(10)])
+
+    responses = client.run(scenario())
+
+    assert all(r.status_code == 200 for r in responses)
+    assert governor.stats()["throttled_requests"] == 5
+
+
+def _reserve_shared(state_dir, count):
+    governor = RateGovernor(rate=10, burst=1, state_dir=state_dir)
+    return [governor.reserve("key") for _ in range(count)]
+
+
+def test_shared_budget_is_respected_across_processes(tmp_path):
+    """Test processes using one state dir draw from a single budget"""
+    workers, per_worker = 3, 10
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_reserve_shared, [str(tmp_path)] * workers, [per_worker] * workers))
+
+    delays = sorted(delay for result in results for delay in result)
+    # One token of burst, the remaining 29 reservations are spaced 0.1s apart
+    assert delays[0] == 0.0
+    assert delays[-1] > (workers * per_worker - 1) / 10 * 0.8
+    assert len(list(tmp_path.glob("*.bucket"))) == 1
+
+
+def test_shared_bucket_file_does_not_contain_key(tmp_path):
+    """Test API key is not written into state file names"""
+    governor = RateGovernor(rate=1, burst=1, state_dir=str(tmp_path))
+    governor.reserve("92dda54a-secret")
+
+    assert not any("secret" in path.name for path in tmp_path.iterdir())
+
+
+def test_close_releases_shared_bucket_files(tmp_path):
+    """Test closing the governor closes the state files of its shared buckets"""
+    governor = RateGovernor(rate=1, burst=1, state_dir=str(tmp_path))
+    governor.reserve("a")
+    bucket = governor._bucket("a")
+
+    governor.close()
+    bucket.close()
+
+    with pytest.raises(OSError):
+        os.fstat(bucket._fd)
+    assert governor.reserve("a") > 0
+
+
+def test_async_client_reserves_shared_budget_off_the_event_loop(stand_in_url, tmp_path):
+    """Test file-locked reservations run in a worker thread, not on the event loop"""
+    threads = []
+
+    class RecordingGovernor(RateGovernor):
+        def reserve(self, key):
+            threads.append(threading.get_ident())
+            return super().reserve(key)
+
+    governor = RecordingGovernor(rate=100, burst=10, state_dir=str(tmp_path))
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=governor)
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        await asyncio.gather(*[client.get("/languages") for _ in range(3)])
+        return loop_thread
+
+    loop_thread = client.run(scenario())
+    governor.close()
+
+    assert len(threads) == 3
+    assert loop_thread not in threads
@@ -0,0 +1,175 @@
+"""Tests for the TTL response cache of reference endpoints"""
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+from src.response_cache import ResponseCache, cache_key
+from src.spec_loader import SpecLoader
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client(url, cache):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), response_cache=cache)
+
+
+def test_spec_declares_ttls_for_reference_operations():
+    """Test cache TTLs are read per operationId from api_spec.json"""
+    cache = ResponseCache.from_spec(SpecLoader())
+
+    assert set(cache.ttls) == {
+        "getLanguages", "getColors", "getAccountRoles", "getProjectRoles",
+        "getCommentsByProjectId", "getAttachmentsByProjectId",
+    }
+    assert cache.ttl_for("getCommentsByProjectId") == 0
+    assert cache.ttl_for("getTasks") is None
+
+
+def test_find_endpoint_prefers_literal_segments():
+    """Test concrete paths resolve to the most specific template"""
+    spec = SpecLoader()
+
+    assert spec.find_endpoint("GET", "/timeLogs/getByProjectId?projectId=1")["operationId"] == "getTimeLogByProjectId"
+    assert spec.find_endpoint("GET", "/timeLogs/123")["operationId"] == "getTimeLog"
+    assert spec.find_endpoint("DELETE", "tasks/5")["operationId"] == "deleteTask"
+    assert spec.find_endpoint("GET", "/unknown") is None
+
+
+def test_repeated_reference_reads_hit_network_once(stand_in_server, stand_in_url):
+    """Test second GET /languages is served from cache"""
+    client = _client(stand_in_url, ResponseCache({"getLanguages": 60}))
+    headers = {"X-API-Key": "key"}
+
+    first = client.get("/languages", headers=headers)
+    second = client.get("/languages", headers=headers)
+
+    assert stand_in_server.hits("/languages") == 1
+    assert second.json() == first.json()
+    assert second is not first
+    assert client.get_last_request()["from_cache"] is True
+    assert client.last_response.request.method == "GET"
+
+
+def test_cache_is_keyed_by_auth_identity(stand_in_server, stand_in_url):
+    """Test responses are never shared between API keys"""
+    client = _client(stand_in_url, ResponseCache({"getLanguages": 60}))
+
+    client.get("/languages", headers={"X-API-Key": "key-a"})
+    client.get("/languages", headers={"X-API-Key": "key-b"})
+    client.get("/languages")
+
+    assert stand_in_server.hits("/languages") == 3
+    assert "key-a" not in cache_key("GET", "u", None, "key-a")
+
+
+def test_non_cacheable_operations_and_errors_are_not_cached(stand_in_server, stand_in_url):
+    """Test operations without TTL and error responses always go to network"""
+    cache = ResponseCache({"getLanguages": 60, "getLink": 60})
+    client = _client(stand_in_url, cache)
+
+    client.get("/echo")
+    client.get("/echo")
+    client.get("/links/1")
+    client.get("/links/1")
+
+    assert stand_in_server.hits("/echo") == 2
+    assert stand_in_server.hits("/links/1") == 2
+    assert len(cache) == 0
+
+
+def test_entries_expire_and_lru_evicts():
+    """Test TTL expiry and least-recently-used eviction"""
+    clock = FakeClock()
+    cache = ResponseCache({}, max_entries=2, clock=clock)
+    for key in ("a", "b"):
+        cache.put(key, 10, 200, {}, b"[]", "utf-8", key)
+
+    assert cache.get("a") is not None
+    cache.put("c", 10, 200, {}, b"[]", "utf-8", "c")
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    clock.now += 11
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+
+
+def test_disk_cache_survives_new_client(stand_in_server, stand_in_url, tmp_path):
+    """Test on-disk entries are reused by a fresh cache instance"""
+    _client(stand_in_url, ResponseCache({"getLanguages": 60}, disk_dir=str(tmp_path))).get("/languages")
+    client = _client(stand_in_url, ResponseCache({"getLanguages": 60}, disk_dir=str(tmp_path)))
+
+    response = client.get("/languages")
+
+    assert response.status_code == 200
+    assert response.json()[0]["lang"] == "en"
+    assert stand_in_server.hits("/languages") == 1
+
+
+def test_expired_entries_are_revalidated_with_etag(stand_in_server, stand_in_url):
+    """Test a 304 answer to If-None-Match serves the cached list"""
+    cache = ResponseCache({"getCommentsByProjectId": 0})
+    client = _client(stand_in_url, cache)
+    params = {"projectId": 1, "version": "a"}
+
+    first = client.get("/comments/getByProjectId", params=params)
+    second = client.get("/comments/getByProjectId", params=params)
+
+    assert stand_in_server.received[-1]["headers"]["If-None-Match"] == '"a"'
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    record = client.get_last_request()
+    assert record["revalidated"] is True
+    assert record["from_cache"] is False
+    assert record.bytes_received == 0
+    assert cache.revalidated == 1
+
+
+def test_changed_resource_replaces_entry(stand_in_server, stand_in_url):
+    """Test a 200 answer to a conditional GET is returned and stored"""
+    cache = ResponseCache({"getCommentsByProjectId": 0})
+    client = _client(stand_in_url, cache)
+
+    client.get("/comments/getByProjectId", params={"projectId": 1, "version": "a"})
+    key = cache_key("GET", f"{stand_in_url}/comments/getByProjectId", {"projectId": 1, "version": "a"}, None)
+    cache._entries[key].headers["ETag"] = '"old"'
+    client.get("/comments/getByProjectId", params={"projectId": 1, "version": "a"})
+
+    assert client.get_last_request()["revalidated"] is False
+    assert cache.get_stale(key).validators["If-None-Match"] == '"a"'
+    assert cache.revalidated == 0
+
+
+def test_last_modified_revalidation_survives_runs(stand_in_server, stand_in_url, tmp_path):
+    """Test validators mirrored to disk revalidate with If-Modified-Since in a new run"""
+    params = {"projectId": 2}
+    _client(stand_in_url, ResponseCache({"getCommentsByProjectId": 0}, disk_dir=str(tmp_path))).get(
+        "/comments/getByProjectId", params=params,
+    )
+    key = cache_key("GET", f"{stand_in_url}/comments/getByProjectId", params, None)
+    cache = ResponseCache({"getCommentsByProjectId": 0}, disk_dir=str(tmp_path))
+    entry = cache.get_stale(key)
+    del entry.headers["ETag"]
+
+    response = _client(stand_in_url, cache).get("/comments/getByProjectId", params=params)
+
+    assert "If-None-Match" not in stand_in_server.received[-1]["headers"]
+    assert stand_in_server.received[-1]["headers"]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert len(response.json()) == 50
+    assert cache.revalidated == 1
+
+
+def test_entries_without_validators_are_not_kept_past_ttl(stand_in_url):
+    """Test revalidate-only operations store nothing without validators"""
+    cache = ResponseCache({"getLanguages": 0})
+    client = _client(stand_in_url, cache)
+
+    client.get("/languages")
+
+    assert len(cache) == 0
@@ -0,0 +1,109 @@
+"""Tests for response validation against api_spec.json"""
+import json
+import random
+
+import pytest
+from jsonschema import Draft7Validator
+from requests import Response
+
+from src.assertions import assert_matches_spec
+from src.schema import CompiledSchema, shape_to_schema
+from src.spec_loader import SpecLoader, get_default_spec_loader
+
+
+def _response(status_code, body):
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8")
+    response._content_consumed = True
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    return response
+
+
+def _timelog(i):
+    return {"id": i, "taskId": 10, "resourceId": 3, "time": 60, "date": "2024-01-01", "comment": None}
+
+
+def test_shape_becomes_json_schema():
+    """Test exampleItemShape type names, alternatives and nesting convert to JSON Schema"""
+    shape = {"id": "integer", "days": "integer[]", "repeat": "week|month", "rights": [{"view": "boolean"}]}
+
+    assert shape_to_schema(shape, nullable=False) == {
+        "type": "object",
+        "properties": {
+            "id": {"type": ["integer", "null"]},
+            "days": {"type": ["array", "null"], "items": {"type": "integer"}},
+            "repeat": {"enum": ["week", "month", None]},
+            "rights": {
+                "type": ["array", "null"],
+                "items": {"type": "object", "properties": {"view": {"type": ["boolean", "null"]}}, "required": ["view"]},
+            },
+        },
+        "required": ["id", "days", "repeat", "rights"],
+    }
+
+
+def test_list_response_is_validated_per_item():
+    """Test list bodies and streamed items are checked item by item"""
+    items = [_timelog(i) for i in range(2000)]
+
+    assert assert_matches_spec(_response(200, items), "getTimeLogListForTasks") == 2000
+    assert assert_matches_spec(iter(items), "getTimeLogListForTasks") == 2000
+
+    items[1500] = dict(_timelog(1500), time="1h")
+    del items[1700]["date"]
+    with pytest.raises(AssertionError) as error:
+        assert_matches_spec(_response(200, items), "getTimeLogListForTasks")
+    assert "root[1500].time: expected integer or null, got str '1h'" in str(error.value)
+    assert "root[1700]: missing keys ['date']" in str(error.value)
+
+    with pytest.raises(AssertionError, match="not a valid JSON list"):
+        assert_matches_spec(_response(200, {"items": []}), "getTimeLogListForTasks")
+
+
+def test_example_bodies_and_statuses():
+    """Test bodies shaped like the example pass, undeclared statuses and operations fail"""
+    assert assert_matches_spec(_response(200, {"status": "ok"}), "updateTask") == 1
+    with pytest.raises(AssertionError, match=r"root: missing keys \['status'\]"):
+        assert_matches_spec(_response(200, {"ok": True}), "updateTask")
+    assert assert_matches_spec(_response(400, {"error": "bad"}), "updateTask") == 0
+    with pytest.raises(AssertionError, match="Status 500 is not declared for updateTask"):
+        assert_matches_spec(_response(500, {}), "updateTask")
+    with pytest.raises(ValueError, match="Unknown operation"):
+        assert_matches_spec(_response(200, {}), "noSuchOperation")
+
+
+def test_validators_are_compiled_once():
+    """Test the spec hands out one compiled validator per operation and status"""
+    spec = get_default_spec_loader()
+
+    assert spec.get_response_validator("getColors") is spec.get_response_validator("getColors", 200)
+    assert spec.get_response_validator("getCommentsByProjectId") is None
+
+
+def test_compiled_checks_agree_with_jsonschema():
+    """Test the compiled fast path accepts and rejects exactly what jsonschema does"""
+    schema = get_default_spec_loader().get_response_schema("getResourcesList")["items"]
+    compiled = CompiledSchema(schema)
+    reference = Draft7Validator(schema)
+    rng = random.Random(7)
+    values = [None, True, 1, 1.5, "x", [], [1, "a"], {}, [{"projectId": 1}], "week", "day"]
+
+    for _ in range(500):
+        item = {name: rng.choice(values) for name in schema["properties"] if rng.random() < 0.95}
+        assert bool(compiled.errors(item)) == any(True for _ in reference.iter_errors(item)), item
+
+
+def test_explicit_schema_falls_back_to_jsonschema(tmp_path):
+    """Test an explicit schema with keywords outside the compiled subset is still enforced"""
+    spec_path = tmp_path / "api_spec.json"
+    spec_path.write_text(json.dumps({"endpoints": [{
+        "method": "GET", "path": "/codes", "operationId": "getCodes",
+        "responses": {"200": {"schema": {"type": "array", "items": {"type": "string", "pattern": "^[A-Z]+$"}}}},
+    }]}))
+    spec = SpecLoader(str(spec_path))
+
+    assert assert_matches_spec(_response(200, ["AB", "CD"]), "getCodes", spec_loader=spec) == 2
+    with pytest.raises(AssertionError, match=r"root\[1\]: 'cd' does not match"):
+        assert_matches_spec(_response(200, ["AB", "cd"]), "getCodes", spec_loader=spec)
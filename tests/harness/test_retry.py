@@ -0,0 +1,127 @@
+"""Tests for retry policy with backoff, Retry-After and retry budget"""
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from src.async_http_client import AsyncHTTPClient
+from src.circuit_breaker import CircuitBreakers
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+from src.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def _policy(waits, **kwargs):
+    kwargs.setdefault("budget", RetryBudget(ratio=0, min_retries=100))
+    return RetryPolicy(rng=lambda: 0.5, sleep=waits.append, **kwargs)
+
+
+def _client(url, policy):
+    # Circuit breaking off: these tests count every retry of repeated failures
+    return HTTPClient(
+        base_url=url,
+        rate_governor=RateGovernor(0, 1),
+        retry_policy=policy,
+        circuit_breakers=CircuitBreakers(failure_threshold=0),
+    )
+
+
+def test_backoff_is_jittered_exponential_and_capped():
+    """Test backoff ceiling doubles per retry and never exceeds the cap"""
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, rng=lambda: 0.5, budget=RetryBudget())
+
+    assert [policy.backoff(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 2.5, 2.5]
+
+
+def test_retry_after_takes_precedence():
+    """Test Retry-After seconds and HTTP-date are honored and capped"""
+    policy = RetryPolicy(backoff_max=10, budget=RetryBudget())
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    assert policy.backoff(0, {"Retry-After": "3"}) == 3.0
+    assert policy.backoff(0, {"Retry-After": "120"}) == 10
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=7)), now=now) == 7.0
+    assert parse_retry_after("not a date") is None
+
+
+def test_get_is_retried_until_success(stand_in_url):
+    """Test transient 503s are retried and the count lands in history"""
+    waits = []
+    client = _client(stand_in_url, _policy(waits))
+
+    response = client.get("/flaky", params={"key": uuid.uuid4().hex, "failures": 2, "retry_after": "0"})
+
+    assert response.status_code == 200
+    assert response.json()["call"] == 3
+    assert client.get_last_request()["retries"] == 2
+    assert waits == [0.0, 0.0]
+
+
+def test_post_is_not_retried_by_default(stand_in_url):
+    """Test non-idempotent methods are not retried unless configured"""
+    waits = []
+    client = _client(stand_in_url, _policy(waits))
+
+    response = client.post("/flaky", params={"key": uuid.uuid4().hex, "failures": 1, "status": 429})
+
+    assert response.status_code == 429
+    assert client.get_last_request()["retries"] == 0
+    assert waits == []
+
+
+def test_max_retries_returns_last_response(stand_in_url):
+    """Test the last failed response is returned once retries are exhausted"""
+    waits = []
+    client = _client(stand_in_url, _policy(waits, max_retries=2))
+
+    response = client.get("/flaky", params={"key": uuid.uuid4().hex, "failures": 10, "status": 502})
+
+    assert response.status_code == 502
+    assert client.get_last_request()["retries"] == 2
+
+
+def test_budget_limits_retries_across_requests(stand_in_url):
+    """Test shared retry budget stops retries from amplifying an outage"""
+    waits = []
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    client = _client(stand_in_url, _policy(waits, max_retries=5, budget=budget))
+
+    for _ in range(4):
+        client.get("/status/503")
+
+    # 1 free retry + 0.5 per request sent
+    assert budget.retries == 3
+    assert budget.denied >= 1
+    assert sum(record["retries"] for record in client.request_history) == 3
+
+
+def test_connection_errors_are_retried():
+    """Test connection failures are retried and re-raised when exhausted"""
+    waits = []
+    client = _client("http://127.0.0.1:9", _policy(waits, max_retries=2))
+
+    with pytest.raises(requests.ConnectionError):
+        client.get("/languages")
+
+    assert len(waits) == 2
+    assert client.get_last_request()["retries"] == 2
+
+
+def test_async_client_retries(stand_in_url):
+    """Test AsyncHTTPClient applies the same retry policy"""
+    policy = _policy([], max_retries=3)
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), retry_policy=policy)
+
+    async def scenario():
+        return await asyncio.gather(*[
+            client.get("/flaky", params={"key": uuid.uuid4().hex, "failures": 1, "retry_after": "0"})
+            for _ in range(3)
+        ])
+
+    responses = client.run(scenario())
+
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert [record["retries"] for record in client.request_history] == [1, 1, 1]
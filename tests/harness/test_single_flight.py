@@ -0,0 +1,184 @@
+"""Tests for single-flight coalescing of identical in-flight GETs"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.async_http_client import AsyncHTTPClient
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+from src.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def _client(url, flight):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), single_flight=flight)
+
+
+def test_concurrent_identical_gets_share_one_call(stand_in_server, stand_in_url):
+    """Test identical GETs in flight together reach the server once"""
+    flight = SingleFlight()
+    client = _client(stand_in_url, flight)
+
+    results = client.batch([{"method": "GET", "path": "/slow", "params": {"delay": 0.2}}] * 5)
+
+    assert [r.response.json() for r in results] == [{"status": "ok"}] * 5
+    assert stand_in_server.hits("/slow") == 1
+    assert flight.coalesced == 4
+    assert sum(record.coalesced for record in client.request_history) == 4
+    # Every caller gets its own response object
+    assert len({id(r.response) for r in results}) == 5
+
+
+def test_different_queries_and_keys_are_not_coalesced(stand_in_server, stand_in_url):
+    """Test coalescing is limited to same URL, query and API key"""
+    client = _client(stand_in_url, SingleFlight())
+
+    client.batch([
+        {"method": "GET", "path": "/slow", "params": {"delay": 0.2, "n": 1}},
+        {"method": "GET", "path": "/slow", "params": {"delay": 0.2, "n": 2}},
+        {"method": "GET", "path": "/slow", "params": {"delay": 0.2, "n": 1}, "headers": {"X-API-Key": "other"}},
+        {"method": "POST", "path": "/echo"},
+        {"method": "POST", "path": "/echo"},
+    ])
+
+    assert stand_in_server.hits("/slow") == 3
+    assert stand_in_server.hits("/echo") == 2
+
+
+def test_different_headers_and_options_are_not_coalesced(stand_in_server, stand_in_url):
+    """Test GETs differing only in a header or per-call timeout are sent separately"""
+    client = _client(stand_in_url, SingleFlight())
+    params = {"delay": 0.2}
+
+    client.batch([
+        {"method": "GET", "path": "/slow", "params": params},
+        {"method": "GET", "path": "/slow", "params": params, "headers": {"Accept-Language": "de"}},
+        {"method": "GET", "path": "/slow", "params": params, "timeout": 7},
+    ])
+
+    assert stand_in_server.hits("/slow") == 3
+
+
+def test_concurrent_identical_async_gets_share_one_call(stand_in_server, stand_in_url):
+    """Test identical async GETs in flight together reach the server once"""
+    flight = AsyncSingleFlight()
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), single_flight=flight)
+
+    async def scenario():
+        return await asyncio.gather(*[client.get("/slow", params={"delay": 0.2}) for _ in range(5)])
+
+    responses = client.run(scenario())
+
+    assert [r.json() for r in responses] == [{"status": "ok"}] * 5
+    assert stand_in_server.hits("/slow") == 1
+    assert flight.coalesced == 4
+    assert sum(record.coalesced for record in client.request_history) == 4
+    assert len({id(r) for r in responses}) == 5
+
+
+def test_async_gets_with_different_headers_are_not_coalesced(stand_in_server, stand_in_url):
+    """Test async GETs differing only in a header are sent separately"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), single_flight=AsyncSingleFlight())
+
+    async def scenario():
+        return await asyncio.gather(
+            client.get("/slow", params={"delay": 0.2}),
+            client.get("/slow", params={"delay": 0.2}, headers={"Accept-Language": "de"}),
+        )
+
+    client.run(scenario())
+
+    assert stand_in_server.hits("/slow") == 2
+
+
+def test_coalesced_async_copies_of_compressed_responses_decode(stand_in_server, stand_in_url):
+    """Test copies of a gzip response carry the decoded body without its encoding headers"""
+    flight = AsyncSingleFlight()
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1), single_flight=flight)
+
+    async def scenario():
+        return await asyncio.gather(*[client.get("/items", params={"count": 50}) for _ in range(3)])
+
+    responses = client.run(scenario())
+
+    assert stand_in_server.hits("/items") == 1
+    assert flight.coalesced == 2
+    assert [len(r.json()) for r in responses] == [50] * 3
+    assert responses[0].headers["Content-Encoding"] == "gzip"
+    assert all("Content-Encoding" not in r.headers for r in responses[1:])
+
+
+def test_async_client_does_not_coalesce_by_default(stand_in_server, stand_in_url):
+    """Test async fan-out of identical GETs reaches the server as sent unless a group is given"""
+    client = AsyncHTTPClient(base_url=stand_in_url, rate_governor=RateGovernor(0, 1))
+
+    async def scenario():
+        return await asyncio.gather(*[client.get("/slow", params={"delay": 0.1}) for _ in range(3)])
+
+    client.run(scenario())
+
+    assert client.single_flight is None
+    assert stand_in_server.hits("/slow") == 3
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    """Test followers of a cancelled call call again instead of being cancelled"""
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls))
+        await asyncio.sleep(0.1)
+        return len(calls)
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(*followers), leader.cancelled()
+
+    results, leader_cancelled = asyncio.run(scenario())
+
+    assert leader_cancelled
+    assert len(calls) == 2
+    assert sorted(results) == [(2, False), (2, True)]
+
+
+def test_sequential_gets_are_not_coalesced(stand_in_server, stand_in_url):
+    """Test only requests overlapping in time are coalesced"""
+    client = _client(stand_in_url, SingleFlight())
+    client.get("/languages")
+    client.get("/languages")
+
+    assert stand_in_server.hits("/languages") == 2
+
+
+def test_leader_error_reaches_followers():
+    """Test followers receive the exception of the shared call"""
+    flight = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise ConnectionError("boom")
+
+    def follower():
+        started.wait()
+        try:
+            flight.do("key", failing)
+        except ConnectionError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    with pytest.raises(ConnectionError):
+        flight.do("key", failing)
+    thread.join()
+
+    assert len(errors) == 1
+    assert flight.coalesced == 1
@@ -0,0 +1,88 @@
+"""Tests for indexed endpoint lookups and compiled spec caching of SpecLoader"""
+import hashlib
+import os
+import re
+
+import pytest
+
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+from src.spec_loader import SpecLoader, get_default_spec_loader
+
+
+def test_operation_and_route_lookups():
+    """Test endpoints are found by operationId and by their spec route"""
+    spec = SpecLoader()
+
+    assert spec.get_endpoint_by_operation_id("getTimeLog")["path"] == "/timeLogs/{timeLogId}"
+    assert spec.get_endpoint_by_operation_id("unknown") is None
+    assert spec.get_endpoint("get", "timeLogs/{timeLogId}")["operationId"] == "getTimeLog"
+    assert spec.get_endpoint("POST", "/timeLogs/{timeLogId}") is None
+    prefixed = spec.get_endpoints_by_path_prefix("/timeLogs")
+    prefixed.clear()
+    assert len(spec.get_endpoints_by_path_prefix("/timeLogs")) == len(
+        [ep for ep in spec.get_endpoints() if ep["path"].startswith("/timeLogs")]
+    )
+
+
+def test_match_returns_path_parameters():
+    """Test concrete paths resolve to their operation and parameter values"""
+    spec = SpecLoader()
+
+    endpoint, params = spec.match("PUT", "/tasks/42/assignResource")
+    assert (endpoint["operationId"], params) == ("updateTaskResource", {"taskId": "42"})
+    assert spec.match("GET", "/comments/getByProjectId?projectId=7")[1] == {}
+    assert spec.match("GET", "/timeLogs/1/extra") is None
+
+
+def test_every_spec_route_resolves_to_itself():
+    """Test each route's concrete path resolves back to the same endpoint"""
+    spec = SpecLoader()
+
+    for endpoint in spec.get_endpoints():
+        path = re.sub(r"\{[^}]+\}", "123", endpoint["path"])
+        assert spec.find_endpoint(endpoint["method"], path) is spec.get_endpoint(endpoint["method"], endpoint["path"])
+
+
+def test_compiled_spec_is_reused_until_spec_changes(tmp_path):
+    """Test the cache file is loaded while the spec content hash matches"""
+    spec_dir, cache_dir = tmp_path / "spec", tmp_path / "cache"
+    spec_dir.mkdir()
+    spec_path = spec_dir / "api_spec.json"
+    spec_path.write_bytes(open(SpecLoader().spec_path, "rb").read())
+    digest = hashlib.sha256(spec_path.read_bytes()).hexdigest()
+
+    built = SpecLoader(str(spec_path), str(cache_dir))
+    cached = SpecLoader(str(spec_path), str(cache_dir))
+    assert (built.from_cache, cached.from_cache) == (False, True)
+    assert cached.spec == built.spec
+    assert cached.match("GET", "/timeLogs/5")[1] == {"timeLogId": "5"}
+    # Nothing is written next to the spec
+    assert [p.name for p in spec_dir.iterdir()] == ["api_spec.json"]
+    assert [p.name for p in cache_dir.iterdir()] == [f"api_spec.{digest}.pickle"]
+
+    spec_path.write_text('{"endpoints": [{"method": "GET", "path": "/only/{id}", "operationId": "only"}]}')
+    changed = SpecLoader(str(spec_path), str(cache_dir))
+    assert not changed.from_cache
+    assert changed.find_endpoint("GET", "/only/1")["operationId"] == "only"
+    assert len(list(cache_dir.iterdir())) == 2
+
+    with open(changed.cache_path, "wb") as f:
+        f.write(b"not a pickle")
+    assert not SpecLoader(str(spec_path), str(cache_dir)).from_cache
+    assert SpecLoader(str(spec_path), str(cache_dir)).from_cache
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="file ownership is POSIX only")
+def test_cache_file_of_another_user_is_not_loaded(tmp_path, monkeypatch):
+    """Test cache files not owned by the current user are never unpickled"""
+    SpecLoader(SpecLoader().spec_path, str(tmp_path))
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(tmp_path).st_uid + 1)
+
+    assert not SpecLoader(SpecLoader().spec_path, str(tmp_path)).from_cache
+
+
+def test_default_loader_is_shared():
+    """Test clients, caches and plugins get one loader per process"""
+    assert get_default_spec_loader() is get_default_spec_loader()
+    assert HTTPClient(base_url="http://stand-in", rate_governor=RateGovernor(0, 1)).spec_loader is get_default_spec_loader()
@@ -0,0 +1,81 @@
+"""Tests for per-operation timeouts and request deadlines"""
+import time
+
+import pytest
+import requests
+
+from src.config import Config
+from src.deadline import DeadlineExceeded, clip_timeout, deadline, remaining
+from src.http_client import HTTPClient
+from src.rate_limiter import RateGovernor
+from src.retry import RetryBudget, RetryPolicy
+
+
+def _client(url, **kwargs):
+    return HTTPClient(base_url=url, rate_governor=RateGovernor(0, 1), **kwargs)
+
+
+def test_operation_timeouts_come_from_spec():
+    """Test operations declaring a timeout override the Config defaults"""
+    client = _client("http://stand-in")
+
+    assert client._timeout_for("getTimeLogByProjectId") == (5, 60)
+    assert client._timeout_for("getTasks") == (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+    assert client._timeout_for(None) == (Config.HTTP_CONNECT_TIMEOUT, Config.HTTP_READ_TIMEOUT)
+
+
+def test_hung_response_times_out(stand_in_url):
+    """Test a slow server raises a timeout instead of stalling the run"""
+    client = _client(stand_in_url)
+
+    with pytest.raises(requests.Timeout):
+        client.get("/slow", params={"delay": 1}, timeout=(1, 0.1))
+
+
+def test_deadline_clips_timeouts_and_nests():
+    """Test deadlines cap timeouts and never extend an outer deadline"""
+    assert remaining() is None
+    assert clip_timeout((5, 30)) == (5, 30)
+    with deadline(2):
+        with deadline(60):
+            assert remaining() <= 2
+        connect, read = clip_timeout((5, 30))
+        assert connect <= 2 and read <= 2
+        assert clip_timeout(None) <= 2
+    assert remaining() is None
+
+
+def test_deadline_caps_request_time(stand_in_url):
+    """Test a request gets only the time left until the deadline"""
+    client = _client(stand_in_url)
+
+    started = time.monotonic()
+    with deadline(0.2):
+        with pytest.raises(requests.Timeout):
+            client.get("/slow", params={"delay": 1})
+        with pytest.raises(DeadlineExceeded):
+            client.get("/languages")
+    assert time.monotonic() - started < 0.9
+
+
+def test_deadline_stops_retries(stand_in_url):
+    """Test no retry is waited for once the backoff would pass the deadline"""
+    sleeps = []
+    policy = RetryPolicy(max_retries=3, budget=RetryBudget(0, 10), sleep=sleeps.append)
+    client = _client(stand_in_url, retry_policy=policy)
+
+    with deadline(1):
+        response = client.get("/flaky", params={"key": "deadline-retry", "failures": 5, "retry_after": 5})
+
+    assert response.status_code == 503
+    assert sleeps == []
+
+
+def test_batch_workers_inherit_deadline(stand_in_url):
+    """Test concurrent batch requests run under the caller's deadline"""
+    client = _client(stand_in_url)
+
+    with deadline(0.2):
+        results = client.batch([{"method": "GET", "path": "/slow", "params": {"delay": 1, "n": i}} for i in range(2)])
+
+    assert all(isinstance(result.error, requests.Timeout) for result in results)